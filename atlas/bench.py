@@ -0,0 +1,264 @@
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import platform
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+from atlas.data_quality import audit_gold_dataset
+from atlas.dataset_cache import iter_rows
+from atlas.evaluate import (
+    compare_readback,
+    evaluate_dataset,
+    evaluate_readback_dataset,
+    evaluate_sequence_dataset,
+)
+from atlas.pipeline import parse_utterance
+from atlas.sequence import SequenceState, parse_turn_with_state
+from atlas.synthetic import iter_utterance_rows, write_corpus
+
+try:
+    import resource
+except ImportError:  # Windows has no `resource`; peak RSS is reported as None there.
+    resource = None
+
+GOLD_UTTERANCE_DATASETS: tuple[str, ...] = (
+    "data/gold/v0_slice.jsonl",
+    "data/gold/v0_noisy_slice.jsonl",
+    "data/gold/v0_region_phraseology_slice.jsonl",
+    "data/gold/v0_region_phraseology_apac_slice.jsonl",
+)
+READBACK_DATASET = "data/gold/readback_pairs.v0.jsonl"
+SEQUENCE_DATASET = "data/gold/v0_sequence_slice.jsonl"
+DEFAULT_BASELINE = "data/gold/perf_baseline.json"
+
+# Concurrent aircraft in the sector-wide sequence benchmark (cross-aircraft index).
+SECTOR_CALLSIGNS = 600
+
+_SYNTHETIC_AIRLINES = ("AAL", "UAL", "DAL", "AFR", "BAW", "QFA", "JAL", "SIA")
+
+
+def synthetic_utterances(count: int, seed: int = 0) -> list[str]:
+    return [row["utterance"] for row in iter_utterance_rows(count, seed=seed)]
+
+
+def _percentile(sorted_values: list[float], q: float) -> float:
+    # Nearest-rank percentile.
+    return sorted_values[max(0, math.ceil(q * len(sorted_values)) - 1)]
+
+
+def _peak_rss_mb() -> float | None:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes.
+    return round(peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024, 1)
+
+
+def _summarize(latencies_ns: list[int], items: int) -> dict[str, Any]:
+    ordered = sorted(latencies_ns)
+    total_s = sum(ordered) / 1e9
+    return {
+        "calls": len(ordered),
+        "items": items,
+        "seconds": round(total_s, 4),
+        "throughput_per_sec": round(items / total_s, 1) if total_s else 0.0,
+        "latency_ms": {
+            "p50": round(_percentile(ordered, 0.50) / 1e6, 4),
+            "p95": round(_percentile(ordered, 0.95) / 1e6, 4),
+            "p99": round(_percentile(ordered, 0.99) / 1e6, 4),
+            "max": round(ordered[-1] / 1e6, 4),
+        },
+        # Process-wide high-water mark after this benchmark, not its own footprint.
+        "peak_rss_mb": _peak_rss_mb(),
+    }
+
+
+def _time_calls(calls: Iterable[Callable[[], Any]]) -> list[int]:
+    latencies: list[int] = []
+    clock = time.perf_counter_ns
+    for call in calls:
+        start = clock()
+        call()
+        latencies.append(clock() - start)
+    return latencies
+
+
+def _bench_parse_utterance(rows: list[tuple[str, str]], repeat: int) -> dict[str, Any]:
+    calls = [
+        (lambda text=text, speaker=speaker: parse_utterance(text, speaker=speaker))
+        for _ in range(repeat)
+        for text, speaker in rows
+    ]
+    return _summarize(_time_calls(calls), len(calls))
+
+
+def _bench_sequence(sessions: list[list[tuple[str, str]]], repeat: int) -> dict[str, Any]:
+    latencies: list[int] = []
+    for _ in range(repeat):
+        for turns in sessions:
+            state = SequenceState()
+            latencies.extend(
+                _time_calls(
+                    (lambda text=text, speaker=speaker: parse_turn_with_state(text, state=state, speaker=speaker))
+                    for text, speaker in turns
+                )
+            )
+    return _summarize(latencies, len(latencies))
+
+
+def _sector_session(callsigns: int, seed: int) -> list[tuple[str, str]]:
+    """One sector with many concurrent aircraft, so cross-aircraft indexes stay populated."""
+    rng = random.Random(seed)
+    turns = []
+    for idx in range(callsigns):
+        cs = f"{_SYNTHETIC_AIRLINES[idx % len(_SYNTHETIC_AIRLINES)]}{idx + 1}"
+        turns.append((f"{cs} descend flight level {rng.randrange(50, 410, 10)}", "ATC"))
+        turns.append((f"{cs} squawk {rng.randint(0, 0o7777):04o}", "ATC"))
+    return turns
+
+
+def _bench_readback(pairs: list[tuple[str, str]], repeat: int) -> dict[str, Any]:
+    calls = [(lambda atc=atc, pilot=pilot: compare_readback(atc, pilot)) for _ in range(repeat) for atc, pilot in pairs]
+    return _summarize(_time_calls(calls), len(calls))
+
+
+def _bench_evaluator(func: Callable[[Path], dict[str, Any]], path: Path, repeat: int) -> dict[str, Any]:
+    items = 0
+    latencies: list[int] = []
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        report = func(path)
+        latencies.append(time.perf_counter_ns() - start)
+        items += int(report.get("samples", report.get("turns", 0)))
+    return _summarize(latencies, items)
+
+
+def _bench_cached_evaluator(func: Callable[..., dict[str, Any]], path: Path, repeat: int) -> dict[str, Any]:
+    # Compile the dataset cache first, so every timed pass reads it warm.
+    for _row in iter_rows(path, use_cache=True):
+        pass
+    return _bench_evaluator(lambda dataset: func(dataset, use_cache=True), path, repeat)
+
+
+def _bench_audit(synthetic: int, seed: int, repeat: int, near_duplicates: bool) -> dict[str, Any]:
+    # Synthetic rows stand in for a silver set; the dataset cache is bypassed so each pass audits every row.
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "silver.jsonl"
+        write_corpus(path, synthetic, seed=seed)
+        return _bench_evaluator(
+            lambda dataset: audit_gold_dataset(dataset, use_cache=False, near_duplicates=near_duplicates),
+            path,
+            repeat,
+        )
+
+
+def _warm_up() -> None:
+    # Regex compilation and lazy imports would otherwise land in the first timed calls.
+    for text in synthetic_utterances(40, seed=-1):
+        parse_utterance(text)
+    compare_readback("AAL1 descend flight level 120", "descend flight level 120 AAL1")
+    parse_turn_with_state("AAL1 descend flight level 120", state=SequenceState())
+
+
+BENCHMARKS: tuple[str, ...] = (
+    "parse_utterance.gold",
+    "parse_utterance.synthetic",
+    "parse_turn_with_state.gold",
+    "parse_turn_with_state.sector",
+    "compare_readback.gold",
+    "evaluate_dataset",
+    "evaluate_readback_dataset",
+    "evaluate_sequence_dataset",
+    "audit_gold_dataset.exact",
+    "audit_gold_dataset.near_duplicates",
+)
+
+
+def run_benchmarks(
+    *,
+    only: Iterable[str] | None = None,
+    repeat: int = 10,
+    synthetic: int = 2000,
+    seed: int = 0,
+) -> dict[str, Any]:
+    selected = tuple(dict.fromkeys(only)) if only else BENCHMARKS
+    unknown = [name for name in selected if name not in BENCHMARKS]
+    if unknown:
+        raise ValueError(f"unknown benchmarks: {', '.join(unknown)}")
+    if repeat < 1:
+        raise ValueError("repeat must be at least 1")
+
+    _warm_up()
+    results: dict[str, Any] = {}
+    for name in selected:
+        if name == "parse_utterance.gold":
+            rows = [
+                (row["utterance"], row.get("speaker", "ATC"))
+                for path in GOLD_UTTERANCE_DATASETS
+                for row in iter_rows(path)
+            ]
+            results[name] = _bench_parse_utterance(rows, repeat)
+        elif name == "parse_utterance.synthetic":
+            results[name] = _bench_parse_utterance([(text, "ATC") for text in synthetic_utterances(synthetic, seed)], 1)
+        elif name == "parse_turn_with_state.gold":
+            sessions = [[(turn["utterance"], "ATC") for turn in row["turns"]] for row in iter_rows(SEQUENCE_DATASET)]
+            results[name] = _bench_sequence(sessions, repeat)
+        elif name == "parse_turn_with_state.sector":
+            results[name] = _bench_sequence([_sector_session(SECTOR_CALLSIGNS, seed)], 1)
+        elif name == "compare_readback.gold":
+            pairs = [(row["atc_utterance"], row["pilot_utterance"]) for row in iter_rows(READBACK_DATASET)]
+            results[name] = _bench_readback(pairs, repeat)
+        elif name == "evaluate_dataset":
+            results[name] = _bench_cached_evaluator(evaluate_dataset, Path(GOLD_UTTERANCE_DATASETS[0]), repeat)
+        elif name == "evaluate_readback_dataset":
+            results[name] = _bench_cached_evaluator(evaluate_readback_dataset, Path(READBACK_DATASET), repeat)
+        elif name == "evaluate_sequence_dataset":
+            results[name] = _bench_cached_evaluator(evaluate_sequence_dataset, Path(SEQUENCE_DATASET), repeat)
+        elif name == "audit_gold_dataset.exact":
+            results[name] = _bench_audit(synthetic, seed, 1, near_duplicates=False)
+        elif name == "audit_gold_dataset.near_duplicates":
+            results[name] = _bench_audit(synthetic, seed, 1, near_duplicates=True)
+
+    return {
+        "generated_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "environment": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "system": platform.system(),
+        },
+        "settings": {"repeat": repeat, "synthetic": synthetic, "seed": seed, "sector_callsigns": SECTOR_CALLSIGNS},
+        "benchmarks": results,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="ATLAS throughput and latency benchmarks")
+    parser.add_argument("--only", default=None, help=f"Comma-separated benchmarks ({', '.join(BENCHMARKS)})")
+    parser.add_argument("--repeat", type=int, default=10, help="Passes over each gold input set")
+    parser.add_argument("--synthetic", type=int, default=2000, help="Synthetic utterances to parse")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=None, help=f"Write the report as a baseline JSON (e.g. {DEFAULT_BASELINE})")
+    args = parser.parse_args()
+
+    report = run_benchmarks(
+        only=[name.strip() for name in args.only.split(",") if name.strip()] if args.only else None,
+        repeat=args.repeat,
+        synthetic=args.synthetic,
+        seed=args.seed,
+    )
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    print(json.dumps(report, indent=2, sort_keys=False))
+
+
+if __name__ == "__main__":
+    main()
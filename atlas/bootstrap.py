@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import random
+from collections import Counter
+from typing import Any, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the pure-Python path is exact but O(rows) per resample.
+    np = None
+
+DEFAULT_BOOTSTRAP_RESAMPLES = 2000
+DEFAULT_CONFIDENCE_LEVEL = 0.95
+RESAMPLE_BATCH = 500
+
+# A metric is `sum(coef * column for numerator) / sum(coef * column for denominator)`,
+# with 0.0 when the denominator is zero (matching `_safe_div` in reports).
+MetricSpec = tuple[dict[str, float], dict[str, float]]
+
+
+def resample_backend() -> str:
+    """Which resampler `bootstrap_intervals` uses here; the two draw differently for the same seed."""
+    return "numpy" if np is not None else "python"
+
+
+def _ratio(sums: dict[str, Any], terms: dict[str, float]) -> Any:
+    return sum(sums[column] * coef for column, coef in terms.items())
+
+
+def _percentile(sorted_values: list[float], q: float) -> float:
+    # Linear interpolation between closest ranks, as `numpy.quantile` does by default.
+    pos = (len(sorted_values) - 1) * q
+    low = int(pos)
+    high = min(low + 1, len(sorted_values) - 1)
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (pos - low)
+
+
+def _numpy_resamples(
+    patterns: list[tuple[float, ...]],
+    weights: list[int],
+    columns: Sequence[str],
+    metrics: dict[str, MetricSpec],
+    resamples: int,
+    seed: int,
+) -> dict[str, list[float]]:
+    n = sum(weights)
+    values = np.asarray(patterns, dtype=np.float64)
+    probs = np.asarray(weights, dtype=np.float64) / n
+    rng = np.random.default_rng(seed)
+    batches: dict[str, list[Any]] = {name: [] for name in metrics}
+    for start in range(0, resamples, RESAMPLE_BATCH):
+        size = min(RESAMPLE_BATCH, resamples - start)
+        # Resampling n rows with replacement only changes how often each outcome pattern
+        # occurs, so one multinomial draw over patterns replaces n row draws.
+        draws = rng.multinomial(n, probs, size=size)
+        totals = draws @ values
+        sums = {column: totals[:, idx] for idx, column in enumerate(columns)}
+        for name, (numerator, denominator) in metrics.items():
+            num = _ratio(sums, numerator)
+            den = _ratio(sums, denominator)
+            batches[name].append(np.divide(num, den, out=np.zeros(size), where=den != 0))
+    return {name: np.sort(np.concatenate(parts)).tolist() for name, parts in batches.items()}
+
+
+def _python_resamples(
+    patterns: list[tuple[float, ...]],
+    weights: list[int],
+    columns: Sequence[str],
+    metrics: dict[str, MetricSpec],
+    resamples: int,
+    seed: int,
+) -> dict[str, list[float]]:
+    n = sum(weights)
+    rng = random.Random(seed)
+    indices = range(len(patterns))
+    samples: dict[str, list[float]] = {name: [] for name in metrics}
+    for _ in range(resamples):
+        draws = Counter(rng.choices(indices, weights=weights, k=n))
+        sums = {
+            column: sum(patterns[idx][col] * count for idx, count in draws.items())
+            for col, column in enumerate(columns)
+        }
+        for name, (numerator, denominator) in metrics.items():
+            den = _ratio(sums, denominator)
+            samples[name].append(_ratio(sums, numerator) / den if den else 0.0)
+    return {name: sorted(values) for name, values in samples.items()}
+
+
+def bootstrap_intervals(
+    outcomes: Counter[tuple[float, ...]],
+    columns: Sequence[str],
+    metrics: dict[str, MetricSpec],
+    *,
+    resamples: int = DEFAULT_BOOTSTRAP_RESAMPLES,
+    confidence: float = DEFAULT_CONFIDENCE_LEVEL,
+    seed: int = 0,
+) -> dict[str, Any]:
+    """Percentile bootstrap intervals for ratio metrics over per-row outcome patterns.
+
+    `outcomes` maps each distinct per-row outcome tuple (laid out as `columns`) to
+    the number of rows that produced it. The same `seed` reproduces the same bounds
+    only on the same `backend`, which the summary records.
+    """
+    if resamples <= 0:
+        raise ValueError("resamples must be positive")
+    if not 0.0 < confidence < 1.0:
+        raise ValueError("confidence must be between 0 and 1")
+
+    summary: dict[str, Any] = {
+        "method": "percentile_bootstrap",
+        "resamples": resamples,
+        "confidence": confidence,
+        "seed": seed,
+        "backend": resample_backend(),
+        "metrics": {},
+    }
+    patterns = [pattern for pattern, count in outcomes.items() if count > 0]
+    if not patterns:
+        summary["metrics"] = {name: {"lower": 0.0, "upper": 0.0} for name in metrics}
+        return summary
+
+    weights = [outcomes[pattern] for pattern in patterns]
+    resample = _numpy_resamples if np is not None else _python_resamples
+    distributions = resample(patterns, weights, columns, metrics, resamples, seed)
+    alpha = (1.0 - confidence) / 2
+    for name, values in distributions.items():
+        summary["metrics"][name] = {
+            "lower": round(_percentile(values, alpha), 4),
+            "upper": round(_percentile(values, 1.0 - alpha), 4),
+        }
+    return summary
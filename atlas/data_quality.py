@@ -1,19 +1,40 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
+import random
 import re
-from collections import Counter, defaultdict
+import sys
+from collections import Counter
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
+from atlas import normalize
+from atlas.dataset_cache import CacheWriter, decode_line, iter_records, load_items
+from atlas.jsonl import iter_jsonl_lines
 from atlas.normalize import normalize_text
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the pure-Python MinHash gives identical signatures.
+    np = None
+
 VALID_STATUSES = {"ok", "unknown", "ambiguous", "conflict"}
 CALLSIGN_PATTERN = re.compile(r"^[A-Z]{3}\d{1,4}$")
 RUNWAY_PATTERN = re.compile(r"^\d{1,2}[LRC]?$")
 SQUAWK_PATTERN = re.compile(r"^[0-7]{4}$")
 
+NEAR_DUPLICATE_THRESHOLD = 0.75
+NEAR_DUPLICATE_BANDS = 10
+NEAR_DUPLICATE_ROWS = 3
+# Representatives kept in the LSH index; later distinct rows are still checked but not indexed.
+NEAR_DUPLICATE_INDEX_LIMIT = 500_000
+# Indexed rows kept per LSH bucket; a bucket that is full still answers lookups.
+NEAR_DUPLICATE_BUCKET_LIMIT = 8
+_MERSENNE_61 = (1 << 61) - 1
+
 
 def _slot_counter(instructions: list[dict[str, Any]]) -> Counter[tuple[Any, ...]]:
     return Counter(
@@ -28,143 +49,380 @@ def _slot_counter(instructions: list[dict[str, Any]]) -> Counter[tuple[Any, ...]
     )
 
 
+def _label_signature(status: Any, callsign: Any, instructions: list[dict[str, Any]]) -> str:
+    # JSON text, so signatures read back from the dataset cache compare equal to fresh ones.
+    return json.dumps([status, callsign, sorted(_slot_counter(instructions).items())], separators=(",", ":"))
+
+
+def _shingle_hashes(normalized_utt: str) -> frozenset[int]:
+    # 32-bit shingle hashes keep `a * x + b` below 2**64, so NumPy and Python agree.
+    tokens = normalized_utt.split()
+    shingles = tokens + [f"{left} {right}" for left, right in zip(tokens, tokens[1:])]
+    return frozenset(
+        int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=4).digest(), "big") for shingle in shingles
+    )
+
+
+_AIRLINE_CODES = frozenset(normalize.AIRLINE_ALIASES.values())
+
+
+def _anchor_tokens(normalized_utt: str) -> tuple[str, ...]:
+    # Callsign and value tokens; spoken digits are folded so "ONE" and "1" anchor alike.
+    anchors = []
+    for token in normalized_utt.split():
+        if token in normalize.SPOKEN_DIGITS:
+            anchors.append(normalize.SPOKEN_DIGITS[token])
+        elif token in _AIRLINE_CODES or any(char.isdigit() for char in token):
+            anchors.append(token)
+    return tuple(anchors)
+
+
+@dataclass(slots=True)
+class _Representative:
+    row_id: str | None
+    normalized_utterance: str
+    anchors: tuple[str, ...]
+    signature: str
+    shingles: frozenset[int]
+
+
+@dataclass(slots=True)
+class NearDuplicateIndex:
+    """Streaming MinHash/LSH index over normalized utterance tokens and bigrams.
+
+    Rows are clustered greedily: a row whose Jaccard similarity to an indexed
+    representative reaches `threshold` joins its cluster, and is indexed only if
+    it carries a label no matched representative has, so later rows are compared
+    with every label variant. Other rows become representatives themselves (up to
+    `limit`). Memory therefore grows with distinct utterances and label variants,
+    not rows. Only rows with the same anchor tokens (airline codes, digits,
+    digit-bearing values) are compared, since a changed callsign or value
+    legitimately changes the label.
+    """
+
+    threshold: float = NEAR_DUPLICATE_THRESHOLD
+    bands: int = NEAR_DUPLICATE_BANDS
+    rows: int = NEAR_DUPLICATE_ROWS
+    limit: int = NEAR_DUPLICATE_INDEX_LIMIT
+    bucket_limit: int = NEAR_DUPLICATE_BUCKET_LIMIT
+    seed: int = 0
+    near_duplicates: int = 0
+    unindexed: int = 0
+    representatives: list[_Representative] = field(default_factory=list)
+    _buckets: list[dict[int, list[int]]] = field(default_factory=list)
+    _permutations: list[tuple[int, int]] = field(default_factory=list)
+    _coefficients: Any = None
+
+    def __post_init__(self) -> None:
+        if not 0.0 < self.threshold <= 1.0:
+            raise ValueError("threshold must be in (0, 1]")
+        if self.bands < 1 or self.rows < 1 or self.bucket_limit < 1:
+            raise ValueError("bands, rows and bucket_limit must be at least 1")
+        rng = random.Random(f"atlas-minhash:{self.seed}")
+        self._permutations = [
+            (rng.randrange(1, 1 << 29), rng.randrange(0, _MERSENNE_61)) for _ in range(self.bands * self.rows)
+        ]
+        self._buckets = [{} for _ in range(self.bands)]
+        if np is not None:
+            self._coefficients = np.array(self._permutations, dtype=np.uint64).T[:, :, None]
+
+    def _band_keys(self, shingles: frozenset[int]) -> list[int]:
+        if self._coefficients is not None:
+            values = np.fromiter(shingles, dtype=np.uint64, count=len(shingles))
+            a, b = self._coefficients
+            minhash = ((a * values + b) % np.uint64(_MERSENNE_61)).min(axis=1).tolist()
+        else:
+            minhash = [min([(a * value + b) % _MERSENNE_61 for value in shingles]) for a, b in self._permutations]
+        return [hash(tuple(minhash[band * self.rows : (band + 1) * self.rows])) for band in range(self.bands)]
+
+    def add(self, normalized_utt: str, row_id: str | None, signature: str) -> dict[str, Any] | None:
+        """Index one audited row; return an adjudication item if it conflicts with a near duplicate."""
+        shingles = _shingle_hashes(normalized_utt)
+        if not shingles:
+            return None
+        anchors = _anchor_tokens(normalized_utt)
+        keys = self._band_keys(shingles)
+
+        candidates: set[int] = set()
+        for band, key in enumerate(keys):
+            candidates.update(self._buckets[band].get(key, ()))
+
+        matched: set[str] = set()
+        best: tuple[float, int] | None = None
+        for candidate_idx in sorted(candidates):
+            candidate = self.representatives[candidate_idx]
+            if candidate.normalized_utterance == normalized_utt:
+                # Exact duplicates are the exact-match path's job.
+                return None
+            if candidate.anchors != anchors:
+                continue
+            similarity = len(shingles & candidate.shingles) / len(shingles | candidate.shingles)
+            if similarity < self.threshold:
+                continue
+            matched.add(candidate.signature)
+            # The closest near duplicate with a different label is the one worth adjudicating.
+            if candidate.signature != signature and (best is None or similarity > best[0]):
+                best = (similarity, candidate_idx)
+
+        if matched:
+            self.near_duplicates += 1
+        if signature in matched:
+            # Agrees with a near duplicate: any conflict with other label variants was reported when they arrived.
+            return None
+        conflict = None
+        if best is not None:
+            similarity, candidate_idx = best
+            match = self.representatives[candidate_idx]
+            conflict = {
+                "type": "near_duplicate_label_conflict",
+                "normalized_utterances": [match.normalized_utterance, normalized_utt],
+                "row_ids": [match.row_id, row_id],
+                "similarity": round(similarity, 4),
+                "message": "near-identical normalized utterances have conflicting expected labels",
+            }
+
+        if len(self.representatives) >= self.limit:
+            self.unindexed += 1
+            return conflict
+        idx = len(self.representatives)
+        self.representatives.append(_Representative(row_id, normalized_utt, anchors, signature, shingles))
+        for band, key in enumerate(keys):
+            bucket = self._buckets[band].setdefault(key, [])
+            if len(bucket) < self.bucket_limit:
+                bucket.append(idx)
+        return conflict
+
+
 def _emit_issue(container: list[dict[str, Any]], row_id: str | None, field: str, message: str) -> None:
     container.append({"row_id": row_id, "field": field, "message": message})
 
 
-def audit_gold_dataset(path: Path) -> dict[str, Any]:
+def _audit_version() -> str:
+    # Cached per-row audits depend on this module, the normalizer source and its tables.
+    digest = hashlib.sha256()
+    for module in (sys.modules[__name__], normalize):
+        digest.update(Path(str(module.__file__)).read_bytes())
+    tables = [normalize.PHRASE_REPLACEMENTS, normalize.AIRLINE_ALIASES, normalize.SPOKEN_DIGITS]
+    digest.update(json.dumps(tables, sort_keys=True).encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+def _audit_record(idx: int, row: Any, decode_error: str | None) -> dict[str, Any]:
+    """Row-local checks for one JSONL line; cross-row checks happen in `audit_gold_dataset`."""
     errors: list[dict[str, Any]] = []
     warnings: list[dict[str, Any]] = []
-    adjudication_items: list[dict[str, Any]] = []
-    rows: list[dict[str, Any]] = []
+    audit: dict[str, Any] = {"counted": False, "errors": errors, "warnings": warnings, "entry": None}
 
-    for idx, line in enumerate(path.read_text(encoding="utf-8").splitlines(), start=1):
-        if not line.strip():
-            continue
-        try:
-            payload = json.loads(line)
-        except json.JSONDecodeError as exc:
-            _emit_issue(errors, None, "jsonl", f"invalid JSON at line {idx}: {exc.msg}")
-            continue
-        if not isinstance(payload, dict):
-            _emit_issue(errors, None, "jsonl", f"line {idx} payload must be object")
-            continue
-        rows.append(payload)
+    if decode_error is not None:
+        _emit_issue(errors, None, "jsonl", f"invalid JSON at line {idx}: {decode_error}")
+        return audit
+    if not isinstance(row, dict):
+        _emit_issue(errors, None, "jsonl", f"line {idx} payload must be object")
+        return audit
+    audit["counted"] = True
 
-    seen_ids: set[str] = set()
-    norm_utterance_rows: defaultdict[str, list[dict[str, Any]]] = defaultdict(list)
+    row_id = row.get("id")
+    audit["row_id"] = row_id
 
-    for idx, row in enumerate(rows, start=1):
-        row_id = row.get("id")
-        if not row_id:
-            _emit_issue(errors, None, "id", f"missing id at line {idx}")
-        elif row_id in seen_ids:
-            _emit_issue(errors, row_id, "id", "duplicate id")
-        else:
-            seen_ids.add(row_id)
+    utterance = row.get("utterance")
+    if not isinstance(utterance, str) or not utterance.strip():
+        _emit_issue(errors, row_id, "utterance", "missing or empty utterance")
+        return audit
 
-        utterance = row.get("utterance")
-        if not isinstance(utterance, str) or not utterance.strip():
-            _emit_issue(errors, row_id, "utterance", "missing or empty utterance")
-            continue
+    expected = row.get("expected")
+    if not isinstance(expected, dict):
+        _emit_issue(errors, row_id, "expected", "missing expected object")
+        return audit
 
-        expected = row.get("expected")
-        if not isinstance(expected, dict):
-            _emit_issue(errors, row_id, "expected", "missing expected object")
-            continue
+    status = expected.get("status")
+    if status not in VALID_STATUSES:
+        _emit_issue(errors, row_id, "expected.status", f"invalid status: {status}")
+
+    callsign = expected.get("callsign")
+    if callsign is not None and (not isinstance(callsign, str) or not CALLSIGN_PATTERN.match(callsign)):
+        _emit_issue(warnings, row_id, "expected.callsign", f"non-canonical callsign format: {callsign}")
 
-        status = expected.get("status")
-        if status not in VALID_STATUSES:
-            _emit_issue(errors, row_id, "expected.status", f"invalid status: {status}")
+    instructions = expected.get("instructions")
+    if not isinstance(instructions, list):
+        _emit_issue(errors, row_id, "expected.instructions", "instructions must be a list")
+        return audit
 
-        callsign = expected.get("callsign")
-        if callsign is not None and (not isinstance(callsign, str) or not CALLSIGN_PATTERN.match(callsign)):
-            _emit_issue(warnings, row_id, "expected.callsign", f"non-canonical callsign format: {callsign}")
+    if status == "unknown" and instructions:
+        _emit_issue(warnings, row_id, "expected.instructions", "unknown status should generally have empty instructions")
 
-        instructions = expected.get("instructions")
-        if not isinstance(instructions, list):
-            _emit_issue(errors, row_id, "expected.instructions", "instructions must be a list")
+    for inst_idx, instruction in enumerate(instructions, start=1):
+        if not isinstance(instruction, dict):
+            _emit_issue(errors, row_id, "expected.instructions", f"instruction #{inst_idx} must be object")
             continue
 
-        if status == "unknown" and instructions:
-            _emit_issue(warnings, row_id, "expected.instructions", "unknown status should generally have empty instructions")
+        itype = instruction.get("type")
+        action = instruction.get("action")
+        if not isinstance(itype, str) or not itype:
+            _emit_issue(errors, row_id, f"instruction[{inst_idx}].type", "missing type")
+        if not isinstance(action, str) or not action:
+            _emit_issue(errors, row_id, f"instruction[{inst_idx}].action", "missing action")
 
-        for inst_idx, instruction in enumerate(instructions, start=1):
-            if not isinstance(instruction, dict):
-                _emit_issue(errors, row_id, "expected.instructions", f"instruction #{inst_idx} must be object")
-                continue
+        value = instruction.get("value")
+        unit = instruction.get("unit")
+
+        if itype == "runway" and isinstance(value, str) and not RUNWAY_PATTERN.match(value):
+            _emit_issue(warnings, row_id, f"instruction[{inst_idx}].value", f"non-standard runway value: {value}")
+        if itype == "squawk" and isinstance(value, str) and not SQUAWK_PATTERN.match(value):
+            _emit_issue(errors, row_id, f"instruction[{inst_idx}].value", f"invalid squawk code: {value}")
+        if itype == "frequency" and isinstance(value, (float, int)):
+            if not 100.0 <= float(value) <= 136.975:
+                _emit_issue(warnings, row_id, f"instruction[{inst_idx}].value", f"frequency out of typical range: {value}")
+        if itype == "heading" and isinstance(value, int):
+            if not 1 <= value <= 360:
+                _emit_issue(warnings, row_id, f"instruction[{inst_idx}].value", f"heading out of range: {value}")
+        if itype == "altitude" and unit == "FL" and isinstance(value, int):
+            if not 10 <= value <= 450:
+                _emit_issue(warnings, row_id, f"instruction[{inst_idx}].value", f"flight level out of range: {value}")
+        if itype == "speed" and isinstance(value, int):
+            if not 100 <= value <= 400:
+                _emit_issue(warnings, row_id, f"instruction[{inst_idx}].value", f"speed out of range: {value}")
+
+    # Cached with the audit, so re-runs only group rows by (normalized utterance, label signature).
+    audit["entry"] = (normalize_text(utterance), row_id, _label_signature(status, callsign, instructions))
+    return audit
+
+
+def _row_fingerprint(line: str) -> bytes:
+    return hashlib.blake2b(line.strip().encode("utf-8"), digest_size=16).digest()
+
+
+def _iter_row_audits(path: Path, use_cache: bool) -> Iterator[dict[str, Any]]:
+    version = _audit_version()
+    if not use_cache:
+        for idx, row, decode_error in iter_records(path, use_cache=False):
+            yield _audit_record(idx, row, decode_error)
+        return
+
+    cached = load_items(path, "data_quality", version)
+    if cached is not None:
+        yield from cached
+        return
+
+    # The dataset changed: audits of an earlier revision are looked up by line
+    # fingerprint, so only new or edited rows are decoded and validated. Lookups
+    # and the rewritten audits both stream through the cache file.
+    writer = CacheWriter(path, "data_quality", version)
+    try:
+        for idx, line in iter_jsonl_lines(path):
+            fingerprint = _row_fingerprint(line)
+            audit = writer.reusable(fingerprint)
+            if audit is None:
+                audit = _audit_record(*decode_line(idx, line))
+            # Uncounted lines report their line number in the error text, so they are never reused.
+            writer.add(audit, key=fingerprint if audit["counted"] else None)
+            yield audit
+        writer.commit()
+    finally:
+        writer.abort()
 
-            itype = instruction.get("type")
-            action = instruction.get("action")
-            if not isinstance(itype, str) or not itype:
-                _emit_issue(errors, row_id, f"instruction[{inst_idx}].type", "missing type")
-            if not isinstance(action, str) or not action:
-                _emit_issue(errors, row_id, f"instruction[{inst_idx}].action", "missing action")
-
-            value = instruction.get("value")
-            unit = instruction.get("unit")
-
-            if itype == "runway" and isinstance(value, str) and not RUNWAY_PATTERN.match(value):
-                _emit_issue(warnings, row_id, f"instruction[{inst_idx}].value", f"non-standard runway value: {value}")
-            if itype == "squawk" and isinstance(value, str) and not SQUAWK_PATTERN.match(value):
-                _emit_issue(errors, row_id, f"instruction[{inst_idx}].value", f"invalid squawk code: {value}")
-            if itype == "frequency" and isinstance(value, (float, int)):
-                if not 100.0 <= float(value) <= 136.975:
-                    _emit_issue(warnings, row_id, f"instruction[{inst_idx}].value", f"frequency out of typical range: {value}")
-            if itype == "heading" and isinstance(value, int):
-                if not 1 <= value <= 360:
-                    _emit_issue(warnings, row_id, f"instruction[{inst_idx}].value", f"heading out of range: {value}")
-            if itype == "altitude" and unit == "FL" and isinstance(value, int):
-                if not 10 <= value <= 450:
-                    _emit_issue(warnings, row_id, f"instruction[{inst_idx}].value", f"flight level out of range: {value}")
-            if itype == "speed" and isinstance(value, int):
-                if not 100 <= value <= 400:
-                    _emit_issue(warnings, row_id, f"instruction[{inst_idx}].value", f"speed out of range: {value}")
-
-        normalized_utt = normalize_text(utterance)
-        norm_utterance_rows[normalized_utt].append(
-            {
-                "id": row_id,
-                "status": status,
-                "callsign": callsign,
-                "slots": _slot_counter(instructions),
-            }
-        )
 
-    for normalized_utt, grouped in norm_utterance_rows.items():
-        if len(grouped) < 2:
+def audit_gold_dataset(
+    path: Path,
+    *,
+    use_cache: bool = True,
+    near_duplicates: bool = False,
+    near_duplicate_threshold: float = NEAR_DUPLICATE_THRESHOLD,
+) -> dict[str, Any]:
+    # Unreadable lines are reported ahead of row issues, which number rows among the readable ones.
+    jsonl_errors: list[dict[str, Any]] = []
+    errors: list[dict[str, Any]] = []
+    warnings: list[dict[str, Any]] = []
+    adjudication_items: list[dict[str, Any]] = []
+    near_duplicate_items: list[dict[str, Any]] = []
+    samples = 0
+
+    seen_ids: set[str] = set()
+    # normalized utterance -> [first label signature, row ids, conflicting]
+    norm_utterance_rows: dict[str, list[Any]] = {}
+    index = NearDuplicateIndex(threshold=near_duplicate_threshold) if near_duplicates else None
+
+    for audit in _iter_row_audits(path, use_cache):
+        if not audit["counted"]:
+            jsonl_errors.extend(audit["errors"])
             continue
-        signatures = {(item["status"], item["callsign"], tuple(sorted(item["slots"].items()))) for item in grouped}
-        if len(signatures) > 1:
+        samples += 1
+
+        row_id = audit["row_id"]
+        if not row_id:
+            _emit_issue(errors, None, "id", f"missing id at line {samples}")
+        elif row_id in seen_ids:
+            _emit_issue(errors, row_id, "id", "duplicate id")
+        else:
+            seen_ids.add(row_id)
+
+        errors.extend(audit["errors"])
+        warnings.extend(audit["warnings"])
+        if audit["entry"] is not None:
+            normalized_utt, entry_id, signature = audit["entry"]
+            group = norm_utterance_rows.get(normalized_utt)
+            if group is None:
+                norm_utterance_rows[normalized_utt] = [signature, [entry_id], False]
+            else:
+                group[1].append(entry_id)
+                group[2] = group[2] or group[0] != signature
+            if index is not None:
+                conflict = index.add(normalized_utt, entry_id, signature)
+                if conflict is not None:
+                    near_duplicate_items.append(conflict)
+
+    for normalized_utt, (_signature, row_ids, conflicting) in norm_utterance_rows.items():
+        if conflicting:
             adjudication_items.append(
                 {
                     "type": "label_conflict",
                     "normalized_utterance": normalized_utt,
-                    "row_ids": [item["id"] for item in grouped],
+                    "row_ids": row_ids,
                     "message": "same normalized utterance has conflicting expected labels",
                 }
             )
+    adjudication_items.extend(near_duplicate_items)
+    errors = jsonl_errors + errors
 
+    summary = {
+        "error_count": len(errors),
+        "warning_count": len(warnings),
+        "adjudication_count": len(adjudication_items),
+    }
+    if index is not None:
+        summary["near_duplicate_count"] = index.near_duplicates
+        summary["near_duplicate_unindexed"] = index.unindexed
     return {
         "dataset": str(path),
-        "samples": len(rows),
+        "samples": samples,
         "errors": errors,
         "warnings": warnings,
         "adjudication_items": adjudication_items,
-        "summary": {
-            "error_count": len(errors),
-            "warning_count": len(warnings),
-            "adjudication_count": len(adjudication_items),
-        },
+        "summary": summary,
     }
 
 
 def main() -> None:
     parser = argparse.ArgumentParser(description="Audit ATLAS gold dataset quality and adjudication candidates")
     parser.add_argument("--dataset", default="data/gold/v0_slice.jsonl")
+    parser.add_argument(
+        "--no-dataset-cache",
+        action="store_true",
+        help="Re-decode and re-validate every row instead of using the compiled dataset cache",
+    )
+    parser.add_argument(
+        "--near-duplicates",
+        action="store_true",
+        help="Also flag near-identical utterances (MinHash/LSH) with conflicting labels",
+    )
+    parser.add_argument("--near-duplicate-threshold", type=float, default=NEAR_DUPLICATE_THRESHOLD)
     args = parser.parse_args()
 
-    report = audit_gold_dataset(Path(args.dataset))
+    report = audit_gold_dataset(
+        Path(args.dataset),
+        use_cache=not args.no_dataset_cache,
+        near_duplicates=args.near_duplicates,
+        near_duplicate_threshold=args.near_duplicate_threshold,
+    )
     print(json.dumps(report, indent=2, sort_keys=False))
 
     if report["summary"]["error_count"] > 0:
@@ -0,0 +1,297 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Iterator
+
+from atlas.jsonl import JsonlError, iter_jsonl_lines
+
+CACHE_DIR_ENV = "ATLAS_CACHE_DIR"
+FORMAT_VERSION = 2
+CHUNK_ROWS = 1000
+# Content digests memoized per process; least recently used entries are evicted first.
+DIGEST_MEMO_LIMIT = 256
+# A run that finds another run compiling the same dataset proceeds uncached rather than waiting.
+WRITE_TIMEOUT = 1.0
+
+# (line_no, payload, error): payload is the decoded JSON value, or None with a decode error message.
+Record = tuple[int, Any, str | None]
+
+_digests: OrderedDict[tuple[str, int, int], str] = OrderedDict()
+
+_SCHEMA = (
+    """CREATE TABLE IF NOT EXISTS entries (
+        kind TEXT PRIMARY KEY,
+        generation INTEGER NOT NULL,
+        format INTEGER NOT NULL,
+        version TEXT NOT NULL,
+        size INTEGER NOT NULL,
+        mtime_ns INTEGER NOT NULL,
+        sha256 TEXT NOT NULL
+    )""",
+    "CREATE TABLE IF NOT EXISTS generations (id INTEGER PRIMARY KEY AUTOINCREMENT)",
+    # Values are JSON text, so a cache file that was swapped or shared is data, never code.
+    """CREATE TABLE IF NOT EXISTS items (
+        generation INTEGER NOT NULL,
+        seq INTEGER NOT NULL,
+        key BLOB,
+        value TEXT NOT NULL,
+        PRIMARY KEY (generation, seq)
+    )""",
+    "CREATE INDEX IF NOT EXISTS items_by_key ON items (generation, key)",
+)
+
+
+def cache_dir() -> Path:
+    """`$ATLAS_CACHE_DIR`, else `atlas/` under the user cache directory; never the dataset tree."""
+    configured = os.environ.get(CACHE_DIR_ENV)
+    if configured:
+        return Path(configured)
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "atlas"
+
+
+def cache_file(path: str | Path) -> Path:
+    source = Path(path).resolve()
+    tag = hashlib.sha256(str(source).encode("utf-8")).hexdigest()[:16]
+    return cache_dir() / f"{source.name}.{tag}.sqlite"
+
+
+def content_digest(path: str | Path) -> str:
+    """sha256 of the source file, memoized per process by size and mtime."""
+    stat = os.stat(path)
+    key = (str(Path(path).resolve()), stat.st_size, stat.st_mtime_ns)
+    digest = _digests.get(key)
+    if digest is not None:
+        _digests.move_to_end(key)
+        return digest
+    hasher = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for block in iter(lambda: handle.read(1 << 20), b""):
+            hasher.update(block)
+    digest = _digests[key] = hasher.hexdigest()
+    while len(_digests) > DIGEST_MEMO_LIMIT:
+        _digests.popitem(last=False)
+    return digest
+
+
+def _connect(path: Path, *, create: bool) -> sqlite3.Connection | None:
+    target = cache_file(path)
+    if not create and not target.exists():
+        return None
+    try:
+        if create:
+            target.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(target, timeout=WRITE_TIMEOUT, isolation_level=None)
+    except (OSError, sqlite3.Error):
+        return None
+    try:
+        conn.execute("PRAGMA journal_mode=WAL")
+        for statement in _SCHEMA:
+            conn.execute(statement)
+    except sqlite3.Error:
+        # Unwritable, locked or not an ATLAS cache: run uncached.
+        conn.close()
+        return None
+    return conn
+
+
+def _generation(conn: sqlite3.Connection, path: Path, kind: str, version: str, *, stale_ok: bool = False) -> int | None:
+    """Generation holding `kind` if it matches `version` and the dataset is unchanged, else None.
+
+    With `stale_ok`, only the format and version must match: the stored items may
+    describe an earlier revision of the dataset.
+    """
+    try:
+        found = conn.execute(
+            "SELECT generation, format, version, size, mtime_ns, sha256 FROM entries WHERE kind = ?", (kind,)
+        ).fetchone()
+    except sqlite3.Error:
+        return None
+    if found is None:
+        return None
+    generation, fmt, stored_version, size, mtime_ns, sha256 = found
+    if (fmt, stored_version) != (FORMAT_VERSION, version):
+        return None
+    if stale_ok:
+        return generation
+    stat = path.stat()
+    if size != stat.st_size:
+        return None
+    if mtime_ns == stat.st_mtime_ns:
+        return generation
+    # Touched but possibly unchanged (checkout, copy): fall back to the content hash.
+    return generation if sha256 == content_digest(path) else None
+
+
+def _stream(conn: sqlite3.Connection, generation: int) -> Iterator[Any]:
+    try:
+        for (value,) in conn.execute("SELECT value FROM items WHERE generation = ? ORDER BY seq", (generation,)):
+            yield json.loads(value)
+    finally:
+        conn.close()
+
+
+def load_items(path: str | Path, kind: str, version: str) -> Iterator[Any] | None:
+    """Stream the values stored by a `CacheWriter` if the dataset and `version` still match, else None."""
+    source = Path(path)
+    conn = _connect(source, create=False)
+    if conn is None:
+        return None
+    generation = _generation(conn, source, kind, version)
+    if generation is None:
+        conn.close()
+        return None
+    return _stream(conn, generation)
+
+
+class CacheWriter:
+    """Stage a new generation of `kind` inside one transaction and publish it on `commit`.
+
+    Readers keep seeing the previous generation until then; `abort` (or a consumer
+    that stops early) rolls it back. `reusable` looks values up by key in the
+    previous generation, even one computed for an earlier revision of the dataset.
+    """
+
+    def __init__(self, path: str | Path, kind: str, version: str) -> None:
+        self.path = Path(path)
+        self.kind = kind
+        self.version = version
+        self.seq = 0
+        self.generation: int | None = None
+        self.previous: int | None = None
+        self.conn = _connect(self.path, create=True)
+        if self.conn is None:
+            return
+        try:
+            stat = self.path.stat()
+            self._header = (FORMAT_VERSION, version, stat.st_size, stat.st_mtime_ns, content_digest(self.path))
+            self.previous = _generation(self.conn, self.path, kind, version, stale_ok=True)
+            self.conn.execute("BEGIN IMMEDIATE")
+            self.generation = self.conn.execute("INSERT INTO generations DEFAULT VALUES").lastrowid
+        except (OSError, sqlite3.Error):
+            self.abort()
+
+    def reusable(self, key: bytes) -> Any | None:
+        if self.conn is None or self.previous is None:
+            return None
+        found = self.conn.execute(
+            "SELECT value FROM items WHERE generation = ? AND key = ? LIMIT 1", (self.previous, key)
+        ).fetchone()
+        return json.loads(found[0]) if found else None
+
+    def add(self, value: Any, key: bytes | None = None) -> None:
+        if self.generation is None:
+            return
+        try:
+            self.conn.execute(
+                "INSERT INTO items VALUES (?, ?, ?, ?)",
+                (self.generation, self.seq, key, json.dumps(value, separators=(",", ":"))),
+            )
+        except sqlite3.Error:
+            self.abort()
+            return
+        self.seq += 1
+
+    def commit(self) -> None:
+        if self.generation is None:
+            return
+        try:
+            self.conn.execute(
+                "DELETE FROM items WHERE generation IN (SELECT generation FROM entries WHERE kind = ?)", (self.kind,)
+            )
+            self.conn.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?)", (self.kind, self.generation, *self._header)
+            )
+            self.conn.execute("COMMIT")
+            self.generation = None
+        except sqlite3.Error:
+            pass
+        self.abort()
+
+    def abort(self) -> None:
+        if self.conn is None:
+            return
+        try:
+            if self.conn.in_transaction:
+                self.conn.execute("ROLLBACK")
+        except sqlite3.Error:
+            pass
+        self.conn.close()
+        self.conn = None
+        self.generation = None
+
+
+def decode_line(line_no: int, line: str) -> Record:
+    try:
+        return line_no, json.loads(line), None
+    except json.JSONDecodeError as exc:
+        return line_no, None, exc.msg
+
+
+def iter_records(path: str | Path, *, use_cache: bool = True) -> Iterator[Record]:
+    """Yield decoded `(line_no, payload, error)` records for non-blank JSONL lines.
+
+    The first full pass compiles them into chunks in the dataset's cache file (see
+    `cache_dir`); later passes decode one chunk per `CHUNK_ROWS` lines instead of
+    one JSON document per line.
+    """
+    source = Path(path)
+    if not use_cache:
+        for line_no, line in iter_jsonl_lines(source):
+            yield decode_line(line_no, line)
+        return
+
+    chunks = load_items(source, "rows", "")
+    if chunks is not None:
+        for chunk in chunks:
+            for line_no, payload, error in chunk:
+                yield line_no, payload, error
+        return
+
+    writer = CacheWriter(source, "rows", "")
+    chunk: list[Record] = []
+    try:
+        for line_no, line in iter_jsonl_lines(source):
+            record = decode_line(line_no, line)
+            chunk.append(record)
+            if len(chunk) >= CHUNK_ROWS:
+                writer.add(chunk)
+                chunk = []
+            yield record
+        if chunk:
+            writer.add(chunk)
+        writer.commit()
+    finally:
+        # A consumer that stops early (or an error) leaves no partial cache behind.
+        writer.abort()
+
+
+def iter_rows(path: str | Path, *, use_cache: bool = True) -> Iterator[dict[str, Any]]:
+    """Cached equivalent of `atlas.jsonl.iter_jsonl`."""
+    for line_no, payload, error in iter_records(path, use_cache=use_cache):
+        if error is not None:
+            raise JsonlError(path, line_no, f"invalid JSON: {error}")
+        if not isinstance(payload, dict):
+            raise JsonlError(path, line_no, "payload must be object")
+        yield payload
+
+
+def load_derived(path: str | Path, kind: str, version: str) -> Any | None:
+    """Return a payload stored by `store_derived` if the dataset and `version` still match."""
+    items = load_items(path, kind, version)
+    if items is None:
+        return None
+    try:
+        return next(items, None)
+    finally:
+        items.close()
+
+
+def store_derived(path: str | Path, kind: str, version: str, payload: Any) -> None:
+    writer = CacheWriter(path, kind, version)
+    writer.add(payload)
+    writer.commit()
@@ -3,12 +3,24 @@ from __future__ import annotations
 import argparse
 import json
 from collections import Counter
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from fractions import Fraction
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 
-from atlas.pipeline import parse_utterance
+from atlas.bootstrap import DEFAULT_CONFIDENCE_LEVEL, MetricSpec, bootstrap_intervals
+from atlas.dataset_cache import iter_rows
+from atlas.pipeline import finalize_utterance, parse_utterance, prepare_utterance
+from atlas.prediction_cache import PredictionCache, parser_fingerprint
+from atlas.run_history import DEFAULT_HISTORY_PATH, record_run
 from atlas.sequence import SequenceState, parse_turn_with_state
+from atlas.sharding import iter_shards, run_sharded
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; pure-Python paths produce identical numbers.
+    np = None
 
 DEFAULT_SEVERITY_WEIGHTS: dict[str, float] = {
     "altitude": 5.0,
@@ -24,6 +36,46 @@ DEFAULT_SEVERITY_WEIGHTS: dict[str, float] = {
 }
 
 
+# Report builders available to a single-pass `evaluate_run`.
+RUN_SECTIONS: tuple[str, ...] = ("core", "severity", "calibration", "safety", "hybrid")
+DEFAULT_RUN_SECTIONS: tuple[str, ...] = ("core", "severity", "calibration", "safety")
+DEFAULT_CALIBRATION_BINS = 10
+
+# Per-row outcome layouts kept for bootstrap resampling, and the headline metrics derived from them.
+CORE_OUTCOME_COLUMNS: tuple[str, ...] = (
+    "rows",
+    "intent_tp",
+    "intent_fp",
+    "intent_fn",
+    "slot_tp",
+    "slot_fp",
+    "slot_fn",
+    "status_correct",
+    "callsign_correct",
+    "weighted_total_error",
+)
+CORE_INTERVAL_METRICS: dict[str, MetricSpec] = {
+    "intent_f1": ({"intent_tp": 2}, {"intent_tp": 2, "intent_fp": 1, "intent_fn": 1}),
+    "slot_f1": ({"slot_tp": 2}, {"slot_tp": 2, "slot_fp": 1, "slot_fn": 1}),
+    "status_accuracy": ({"status_correct": 1}, {"rows": 1}),
+    "callsign_accuracy": ({"callsign_correct": 1}, {"rows": 1}),
+}
+SEVERITY_INTERVAL_METRICS: dict[str, MetricSpec] = {
+    "weighted_error_per_sample": ({"weighted_total_error": 1}, {"rows": 1}),
+}
+# Slice value for rows that lack a group-by field.
+MISSING_GROUP_VALUE = "unknown"
+READBACK_BATCH_ROWS = 100_000
+MAX_REPORTED_SEQUENCE_FAILURES = 100
+
+SAFETY_OUTCOME_COLUMNS: tuple[str, ...] = ("rows", "violations", "blocking", "expected_non_ok", "detected_non_ok")
+SAFETY_INTERVAL_METRICS: dict[str, MetricSpec] = {
+    "violation_rate": ({"violations": 1}, {"rows": 1}),
+    "blocking_status_rate": ({"blocking": 1}, {"rows": 1}),
+    "non_ok_detection_recall": ({"detected_non_ok": 1}, {"expected_non_ok": 1}),
+}
+
+
 def _safe_div(num: float, den: float) -> float:
     return num / den if den else 0.0
 
@@ -40,25 +92,13 @@ def _canonical_value(value: Any) -> Any:
     return value
 
 
-def _instruction_type_counter(instructions: list[dict[str, Any]]) -> Counter[str]:
-    return Counter(item["type"] for item in instructions)
+def slot_key(item: dict[str, Any]) -> tuple[Any, ...]:
+    """Comparable `(type, action, value, unit)` key for one instruction."""
+    return (item.get("type"), item.get("action"), _canonical_value(item.get("value")), item.get("unit"))
 
 
 def _slot_counter(instructions: list[dict[str, Any]]) -> Counter[tuple[Any, ...]]:
-    return Counter(
-        (
-            item.get("type"),
-            item.get("action"),
-            _canonical_value(item.get("value")),
-            item.get("unit"),
-        )
-        for item in instructions
-    )
-
-
-def _count_overlap(left: Counter[Any], right: Counter[Any]) -> int:
-    keys = set(left) | set(right)
-    return sum(min(left.get(k, 0), right.get(k, 0)) for k in keys)
+    return Counter(slot_key(item) for item in instructions)
 
 
 def _counter_difference_items(left: Counter[tuple[Any, ...]], right: Counter[tuple[Any, ...]]) -> list[dict[str, Any]]:
@@ -93,99 +133,609 @@ def _weighted_error_totals(
     }
 
 
-def _is_utterance_correct(expected: dict[str, Any], predicted: dict[str, Any]) -> bool:
-    if expected.get("status") != predicted.get("status"):
-        return False
-    if expected.get("callsign") != predicted.get("callsign"):
-        return False
-    return _slot_counter(expected.get("instructions", [])) == _slot_counter(predicted.get("instructions", []))
+def _calibration_bin_index(conf: float, bins: int) -> int | None:
+    if not 0.0 <= conf <= 1.0:
+        return None
+    idx = min(int(conf * bins), bins - 1)
+    # Guard against float rounding so bin edges match `low <= conf < high` exactly.
+    if idx > 0 and conf < idx / bins:
+        idx -= 1
+    elif idx < bins - 1 and conf >= (idx + 1) / bins:
+        idx += 1
+    return idx
 
 
-def _calibration_report(confidences: list[float], correctness: list[int], bins: int = 10) -> dict[str, Any]:
-    n = len(confidences)
-    if n == 0:
-        return {
-            "bins": bins,
-            "ece": 0.0,
-            "mce": 0.0,
-            "brier_score": 0.0,
-            "reliability_bins": [],
-        }
+def _calibration_bin_indices(values: list[float], bins: int) -> list[int]:
+    """Vectorized `_calibration_bin_index`; out-of-range values map to -1."""
+    if np is None or len(values) < 256:
+        return [-1 if (idx := _calibration_bin_index(value, bins)) is None else idx for value in values]
+
+    arr = np.asarray(values, dtype=np.float64)
+    idx = np.minimum((arr * bins).astype(np.int64), bins - 1)
+    idx = np.maximum(idx, 0)
+    idx = idx - ((idx > 0) & (arr < idx / bins))
+    idx = idx + ((idx < bins - 1) & (arr >= (idx + 1) / bins))
+    idx[(arr < 0.0) | (arr > 1.0) | np.isnan(arr)] = -1
+    return idx.tolist()
+
+
+def _exact_weighted_sum(histogram: dict[float, int]) -> Fraction:
+    return sum((Fraction(value) * count for value, count in histogram.items()), Fraction(0))
+
 
-    ece = 0.0
-    mce = 0.0
-    reliability_bins: list[dict[str, Any]] = []
-
-    for i in range(bins):
-        low = i / bins
-        high = (i + 1) / bins
-        # Include right edge only on final bin so 1.0 is captured.
-        bucket_idx = [
-            idx
-            for idx, conf in enumerate(confidences)
-            if (low <= conf < high) or (i == bins - 1 and low <= conf <= high)
-        ]
-        count = len(bucket_idx)
-        if count == 0:
+@dataclass(slots=True)
+class _CalibrationBins:
+    """Histogram of `confidence -> [count, correct]`, reduced to any bin layout on report.
+
+    Exported confidences are rounded to 3 decimals, so the histogram stays small and
+    exact sums over its distinct values are cheap; merges are plain count additions.
+    """
+
+    samples: int = 0
+    histogram: dict[float, list[int]] = field(default_factory=dict)
+
+    def add(self, conf: float, correct: int) -> None:
+        self.samples += 1
+        entry = self.histogram.get(conf)
+        if entry is None:
+            self.histogram[conf] = [1, correct]
+        else:
+            entry[0] += 1
+            entry[1] += correct
+
+    def merge(self, other: _CalibrationBins) -> None:
+        self.samples += other.samples
+        for conf, (count, correct) in other.histogram.items():
+            entry = self.histogram.get(conf)
+            if entry is None:
+                self.histogram[conf] = [count, correct]
+            else:
+                entry[0] += count
+                entry[1] += correct
+
+    def report(self, bins: int = DEFAULT_CALIBRATION_BINS) -> dict[str, Any]:
+        n = self.samples
+        if n == 0:
+            return {
+                "bins": bins,
+                "ece": 0.0,
+                "mce": 0.0,
+                "brier_score": 0.0,
+                "reliability_bins": [],
+            }
+
+        counts = [0] * bins
+        correct_counts = [0] * bins
+        confidence_sums = [Fraction(0)] * bins
+        brier_sum = Fraction(0)
+        confs = list(self.histogram)
+        for conf, idx in zip(confs, _calibration_bin_indices(confs, bins), strict=True):
+            count, correct = self.histogram[conf]
+            exact_conf = Fraction(conf)
+            brier_sum += correct * (exact_conf - 1) ** 2 + (count - correct) * exact_conf**2
+            if idx < 0:
+                continue
+            counts[idx] += count
+            correct_counts[idx] += correct
+            confidence_sums[idx] += exact_conf * count
+
+        ece = 0.0
+        mce = 0.0
+        reliability_bins: list[dict[str, Any]] = []
+        for i in range(bins):
+            low = i / bins
+            high = (i + 1) / bins
+            count = counts[i]
+            if count == 0:
+                reliability_bins.append(
+                    {
+                        "bin": i + 1,
+                        "low": round(low, 3),
+                        "high": round(high, 3),
+                        "count": 0,
+                        "avg_confidence": None,
+                        "accuracy": None,
+                        "gap": None,
+                    }
+                )
+                continue
+
+            avg_conf = float(confidence_sums[i] / count)
+            acc = correct_counts[i] / count
+            gap = abs(acc - avg_conf)
+            ece += (count / n) * gap
+            mce = max(mce, gap)
             reliability_bins.append(
                 {
                     "bin": i + 1,
                     "low": round(low, 3),
                     "high": round(high, 3),
-                    "count": 0,
-                    "avg_confidence": None,
-                    "accuracy": None,
-                    "gap": None,
+                    "count": count,
+                    "avg_confidence": round(avg_conf, 4),
+                    "accuracy": round(acc, 4),
+                    "gap": round(gap, 4),
                 }
             )
+
+        return {
+            "bins": bins,
+            "ece": round(ece, 4),
+            "mce": round(mce, 4),
+            "brier_score": round(float(brier_sum / n), 4),
+            "reliability_bins": reliability_bins,
+        }
+
+
+def _multiset_overlap(left: list[Any], right: list[Any]) -> int:
+    if not left or not right:
+        return 0
+    if len(left) == 1 and len(right) == 1:
+        return int(left[0] == right[0])
+    if left == right:
+        return len(left)
+    remaining = Counter(left)
+    overlap = 0
+    for key in right:
+        if remaining[key] > 0:
+            remaining[key] -= 1
+            overlap += 1
+    return overlap
+
+
+def _row_groups(row: dict[str, Any], group_by: tuple[str, ...]) -> list[tuple[str, str]]:
+    """Return the `(field, value)` slices a row belongs to.
+
+    Fields are read from the row itself, then from its `metadata` object.
+    `instruction_type` is multi-valued: a row joins one slice per expected type.
+    """
+    groups: list[tuple[str, str]] = []
+    metadata = row.get("metadata")
+    metadata = metadata if isinstance(metadata, dict) else {}
+    for name in group_by:
+        if name == "instruction_type":
+            types = {str(item.get("type")) for item in row.get("expected", {}).get("instructions", [])}
+            groups.extend((name, itype) for itype in sorted(types or {"none"}))
             continue
+        value = row.get(name, metadata.get(name))
+        if value is None and name == "speaker":
+            value = "ATC"
+        groups.append((name, MISSING_GROUP_VALUE if value is None else str(value)))
+    return groups
+
+
+def outcome_metrics(outcomes: Counter[tuple[float, ...]]) -> dict[str, Any]:
+    """Headline metrics from per-row outcome counts laid out as `CORE_OUTCOME_COLUMNS`."""
+    totals = dict.fromkeys(CORE_OUTCOME_COLUMNS[:-1], 0)
+    weighted_total = Fraction(0)
+    for outcome, count in outcomes.items():
+        for column, value in zip(CORE_OUTCOME_COLUMNS[:-1], outcome):
+            totals[column] += value * count
+        weighted_total += Fraction(outcome[-1]) * count
+    n = totals["rows"]
+    return {
+        "samples": n,
+        "intent_f1": round(_f1(totals["intent_tp"], totals["intent_fp"], totals["intent_fn"]), 4),
+        "slot_precision": round(_safe_div(totals["slot_tp"], totals["slot_tp"] + totals["slot_fp"]), 4),
+        "slot_recall": round(_safe_div(totals["slot_tp"], totals["slot_tp"] + totals["slot_fn"]), 4),
+        "slot_f1": round(_f1(totals["slot_tp"], totals["slot_fp"], totals["slot_fn"]), 4),
+        "status_accuracy": round(_safe_div(totals["status_correct"], n), 4),
+        "callsign_accuracy": round(_safe_div(totals["callsign_correct"], n), 4),
+        "weighted_error_per_sample": round(float(weighted_total / n) if n else 0.0, 4),
+    }
 
-        avg_conf = sum(confidences[idx] for idx in bucket_idx) / count
-        acc = sum(correctness[idx] for idx in bucket_idx) / count
-        gap = abs(acc - avg_conf)
-        ece += (count / n) * gap
-        mce = max(mce, gap)
-        reliability_bins.append(
-            {
-                "bin": i + 1,
-                "low": round(low, 3),
-                "high": round(high, 3),
-                "count": count,
-                "avg_confidence": round(avg_conf, 4),
-                "accuracy": round(acc, 4),
-                "gap": round(gap, 4),
-            }
+
+@dataclass(slots=True)
+class DatasetAggregate:
+    """Mergeable partial metrics for `evaluate_dataset`.
+
+    Float sums are kept as value histograms and reduced exactly on report, so
+    merging shards in any grouping reproduces the serial report bit for bit.
+    """
+
+    samples: int = 0
+    intent_tp: int = 0
+    intent_fp: int = 0
+    intent_fn: int = 0
+    slot_tp: int = 0
+    slot_fp: int = 0
+    slot_fn: int = 0
+    status_correct: int = 0
+    callsign_correct: int = 0
+    # Per-row weighted errors bucketed by value; summed exactly on report.
+    weighted_fp_counts: Counter[float] = field(default_factory=Counter)
+    weighted_fn_counts: Counter[float] = field(default_factory=Counter)
+    calibration: _CalibrationBins = field(default_factory=_CalibrationBins)
+    # Distinct per-row outcomes laid out as CORE_OUTCOME_COLUMNS, for bootstrap intervals.
+    outcomes: Counter[tuple[float, ...]] = field(default_factory=Counter)
+    # Per-slice outcome counters keyed by `(field, value)`; slice metrics are sums over them.
+    groups: dict[tuple[str, str], Counter[tuple[float, ...]]] = field(default_factory=dict)
+    cache_reused: int = 0
+
+    def add(
+        self,
+        expected: dict[str, Any],
+        predicted: dict[str, Any],
+        weights: dict[str, float],
+        groups: Iterable[tuple[str, str]] = (),
+    ) -> None:
+        self.samples += 1
+
+        expected_items = expected.get("instructions", [])
+        predicted_items = predicted.get("instructions", [])
+
+        tp_i = _multiset_overlap([item["type"] for item in expected_items], [item["type"] for item in predicted_items])
+        self.intent_tp += tp_i
+        self.intent_fp += len(predicted_items) - tp_i
+        self.intent_fn += len(expected_items) - tp_i
+
+        expected_keys = [slot_key(item) for item in expected_items]
+        predicted_keys = [slot_key(item) for item in predicted_items]
+        tp_s = _multiset_overlap(expected_keys, predicted_keys)
+        self.slot_tp += tp_s
+        self.slot_fp += len(predicted_keys) - tp_s
+        self.slot_fn += len(expected_keys) - tp_s
+        slots_match = tp_s == len(expected_keys) == len(predicted_keys)
+
+        weighted_total = 0.0
+        if not slots_match:
+            weighted = _weighted_error_totals(Counter(expected_keys), Counter(predicted_keys), weights)
+            if weighted["weighted_fp"]:
+                self.weighted_fp_counts[weighted["weighted_fp"]] += 1
+            if weighted["weighted_fn"]:
+                self.weighted_fn_counts[weighted["weighted_fn"]] += 1
+            weighted_total = weighted["weighted_total_error"]
+
+        status_ok = predicted.get("status") == expected.get("status")
+        callsign_ok = predicted.get("callsign") == expected.get("callsign")
+        self.status_correct += status_ok
+        self.callsign_correct += callsign_ok
+        outcome = (
+            1,
+            tp_i,
+            len(predicted_items) - tp_i,
+            len(expected_items) - tp_i,
+            tp_s,
+            len(predicted_keys) - tp_s,
+            len(expected_keys) - tp_s,
+            int(status_ok),
+            int(callsign_ok),
+            weighted_total,
+        )
+        self.outcomes[outcome] += 1
+        for key in groups:
+            group = self.groups.get(key)
+            if group is None:
+                group = self.groups[key] = Counter()
+            group[outcome] += 1
+        self.calibration.add(
+            float(predicted.get("confidence", 0.0)),
+            1 if status_ok and callsign_ok and slots_match else 0,
         )
 
-    brier = sum((conf - corr) ** 2 for conf, corr in zip(confidences, correctness, strict=True)) / n
+    def merge(self, other: DatasetAggregate) -> None:
+        self.samples += other.samples
+        self.intent_tp += other.intent_tp
+        self.intent_fp += other.intent_fp
+        self.intent_fn += other.intent_fn
+        self.slot_tp += other.slot_tp
+        self.slot_fp += other.slot_fp
+        self.slot_fn += other.slot_fn
+        self.status_correct += other.status_correct
+        self.callsign_correct += other.callsign_correct
+        self.weighted_fp_counts.update(other.weighted_fp_counts)
+        self.weighted_fn_counts.update(other.weighted_fn_counts)
+        self.calibration.merge(other.calibration)
+        self.outcomes.update(other.outcomes)
+        for key, outcomes in other.groups.items():
+            group = self.groups.get(key)
+            if group is None:
+                self.groups[key] = outcomes
+            else:
+                group.update(outcomes)
+        self.cache_reused += other.cache_reused
+
+    def slices(self) -> dict[str, dict[str, Any]]:
+        report: dict[str, dict[str, Any]] = {}
+        for name, value in sorted(self.groups):
+            report.setdefault(name, {})[value] = outcome_metrics(self.groups[(name, value)])
+        return report
+
+    def report(
+        self, path: Path, weights: dict[str, float], calibration_bins: int = DEFAULT_CALIBRATION_BINS
+    ) -> dict[str, Any]:
+        n = self.samples
+        exact_fp = _exact_weighted_sum(self.weighted_fp_counts)
+        exact_fn = _exact_weighted_sum(self.weighted_fn_counts)
+        weighted_fp = float(exact_fp)
+        weighted_fn = float(exact_fn)
+        weighted_total = float(exact_fp + exact_fn)
+        return {
+            "dataset": str(path),
+            "samples": n,
+            "intent": {
+                "precision": round(_safe_div(self.intent_tp, self.intent_tp + self.intent_fp), 4),
+                "recall": round(_safe_div(self.intent_tp, self.intent_tp + self.intent_fn), 4),
+                "f1": round(_f1(self.intent_tp, self.intent_fp, self.intent_fn), 4),
+                "tp": self.intent_tp,
+                "fp": self.intent_fp,
+                "fn": self.intent_fn,
+            },
+            "slot": {
+                "precision": round(_safe_div(self.slot_tp, self.slot_tp + self.slot_fp), 4),
+                "recall": round(_safe_div(self.slot_tp, self.slot_tp + self.slot_fn), 4),
+                "f1": round(_f1(self.slot_tp, self.slot_fp, self.slot_fn), 4),
+                "tp": self.slot_tp,
+                "fp": self.slot_fp,
+                "fn": self.slot_fn,
+            },
+            "status_accuracy": round(_safe_div(self.status_correct, n), 4),
+            "callsign_accuracy": round(_safe_div(self.callsign_correct, n), 4),
+            "severity_weighted_error": {
+                "weights": weights,
+                "weighted_fp": round(weighted_fp, 4),
+                "weighted_fn": round(weighted_fn, 4),
+                "weighted_total_error": round(weighted_total, 4),
+                "weighted_error_per_sample": round(_safe_div(weighted_total, n), 4),
+            },
+            "calibration": self.calibration.report(calibration_bins),
+        }
+
+
+def _variant_name(enable_hybrid: bool) -> str:
+    return "hybrid" if enable_hybrid else "baseline"
+
+
+def _open_cache(cache_path: str | None, fingerprint: str | None) -> PredictionCache | None:
+    return PredictionCache(cache_path, fingerprint=fingerprint) if cache_path else None
+
+
+def _predict_variants(
+    row: dict[str, Any],
+    variants: tuple[bool, ...],
+    cache: PredictionCache | None,
+) -> tuple[dict[bool, dict[str, Any]], bool]:
+    """Return predictions per `enable_hybrid` variant and whether all came from the cache."""
+    predictions: dict[bool, dict[str, Any]] = {}
+    if cache is not None:
+        for variant in variants:
+            cached = cache.get(row, _variant_name(variant))
+            if cached is not None:
+                predictions[variant] = cached
+    if len(predictions) == len(variants):
+        return predictions, True
+
+    prepared = prepare_utterance(
+        row["utterance"],
+        speaker=row.get("speaker", "ATC"),
+        utterance_id=row.get("id"),
+    )
+    for variant in variants:
+        if variant in predictions:
+            continue
+        predictions[variant] = finalize_utterance(prepared, enable_hybrid=variant)
+        if cache is not None:
+            cache.put(row, _variant_name(variant), predictions[variant])
+    return predictions, False
+
+
+def evaluate_rows(
+    rows: Iterable[dict[str, Any]],
+    weights: dict[str, float],
+    enable_hybrid: bool,
+    cache_path: str | None = None,
+    fingerprint: str | None = None,
+    group_by: tuple[str, ...] = (),
+) -> DatasetAggregate:
+    """Parse and score `rows` into a mergeable aggregate; the unit of work `run_sharded` distributes."""
+    aggregate = DatasetAggregate()
+    cache = _open_cache(cache_path, fingerprint)
+    try:
+        for row in rows:
+            predictions, reused = _predict_variants(row, (enable_hybrid,), cache)
+            aggregate.cache_reused += int(reused)
+            groups = _row_groups(row, group_by) if group_by else ()
+            aggregate.add(row["expected"], predictions[enable_hybrid], weights, groups)
+    finally:
+        if cache is not None:
+            cache.close()
+    return aggregate
+
+
+@dataclass(slots=True)
+class _SafetyAggregate:
+    min_operational_threshold: float = 0.60
+    samples: int = 0
+    violations: dict[str, int] = field(
+        default_factory=lambda: {
+            "silent_ok_without_instructions": 0,
+            "ok_below_operational_threshold": 0,
+            "unknown_with_instructions": 0,
+            "conflict_without_conflict_note": 0,
+        }
+    )
+    status_distribution: Counter[str] = field(default_factory=Counter)
+    expected_non_ok: int = 0
+    detected_non_ok: int = 0
+    # Distinct per-row outcomes laid out as SAFETY_OUTCOME_COLUMNS, for bootstrap intervals.
+    outcomes: Counter[tuple[int, ...]] = field(default_factory=Counter)
+
+    def add(self, expected: dict[str, Any], predicted: dict[str, Any]) -> None:
+        self.samples += 1
+        status = str(predicted.get("status"))
+        self.status_distribution[status] += 1
+
+        instructions = predicted.get("instructions", [])
+        confidence = float(predicted.get("confidence", 0.0))
+        notes = set(predicted.get("notes", []))
+
+        violations = 0
+        if status == "ok" and not instructions:
+            self.violations["silent_ok_without_instructions"] += 1
+            violations += 1
+        if status == "ok" and confidence < self.min_operational_threshold:
+            self.violations["ok_below_operational_threshold"] += 1
+            violations += 1
+        if status == "unknown" and instructions:
+            self.violations["unknown_with_instructions"] += 1
+            violations += 1
+        if status == "conflict" and not (
+            "slot_conflict_detected" in notes or "history_conflict_detected" in notes
+        ):
+            self.violations["conflict_without_conflict_note"] += 1
+            violations += 1
+
+        blocking = status in {"unknown", "ambiguous", "conflict"}
+        expected_non_ok = expected.get("status") in {"unknown", "ambiguous", "conflict"}
+        if expected_non_ok:
+            self.expected_non_ok += 1
+            if blocking:
+                self.detected_non_ok += 1
+        self.outcomes[(1, violations, int(blocking), int(expected_non_ok), int(expected_non_ok and blocking))] += 1
+
+    def merge(self, other: _SafetyAggregate) -> None:
+        self.samples += other.samples
+        for key, count in other.violations.items():
+            self.violations[key] += count
+        self.status_distribution.update(other.status_distribution)
+        self.expected_non_ok += other.expected_non_ok
+        self.detected_non_ok += other.detected_non_ok
+        self.outcomes.update(other.outcomes)
+
+    def report(self) -> dict[str, Any]:
+        n = self.samples
+        total_violations = sum(self.violations.values())
+        blocking = (
+            self.status_distribution.get("unknown", 0)
+            + self.status_distribution.get("ambiguous", 0)
+            + self.status_distribution.get("conflict", 0)
+        )
+        return {
+            "policy_conformance": {
+                "min_operational_threshold": self.min_operational_threshold,
+                "total_violations": total_violations,
+                "violations": dict(self.violations),
+                "violation_rate": round(_safe_div(total_violations, n), 4),
+            },
+            "fallback_behavior": {
+                "status_distribution": dict(self.status_distribution),
+                "blocking_status_rate": round(_safe_div(blocking, n), 4),
+            },
+            "failure_mode_detection": {
+                "expected_non_ok": self.expected_non_ok,
+                "detected_non_ok": self.detected_non_ok,
+                "non_ok_detection_recall": round(_safe_div(self.detected_non_ok, self.expected_non_ok), 4),
+            },
+        }
+
+
+def _evaluate_safety_rows(rows: Iterable[dict[str, Any]], min_operational_threshold: float) -> _SafetyAggregate:
+    aggregate = _SafetyAggregate(min_operational_threshold=min_operational_threshold)
+    for row in rows:
+        predicted = parse_utterance(
+            text=row["utterance"],
+            speaker=row.get("speaker", "ATC"),
+            utterance_id=row.get("id"),
+        )
+        aggregate.add(row.get("expected", {}), predicted)
+    return aggregate
+
+
+@dataclass(slots=True)
+class _RunAggregate:
+    samples: int = 0
+    core: DatasetAggregate | None = None
+    safety: _SafetyAggregate | None = None
+    baseline: DatasetAggregate | None = None
+    cache_reused: int = 0
+
+    def merge(self, other: _RunAggregate) -> None:
+        self.samples += other.samples
+        self.cache_reused += other.cache_reused
+        for name in ("core", "safety", "baseline"):
+            mine = getattr(self, name)
+            theirs = getattr(other, name)
+            if theirs is None:
+                continue
+            if mine is None:
+                setattr(self, name, theirs)
+            else:
+                mine.merge(theirs)
+
+
+def _new_run_aggregate(sections: tuple[str, ...], min_operational_threshold: float) -> _RunAggregate:
+    core_needed = bool({"core", "severity", "calibration", "hybrid"} & set(sections))
+    return _RunAggregate(
+        core=DatasetAggregate() if core_needed else None,
+        safety=_SafetyAggregate(min_operational_threshold=min_operational_threshold) if "safety" in sections else None,
+        baseline=DatasetAggregate() if "hybrid" in sections else None,
+    )
+
+
+def _evaluate_run_rows(
+    rows: Iterable[dict[str, Any]],
+    weights: dict[str, float],
+    sections: tuple[str, ...],
+    min_operational_threshold: float,
+    cache_path: str | None = None,
+    fingerprint: str | None = None,
+) -> _RunAggregate:
+    aggregate = _new_run_aggregate(sections, min_operational_threshold)
+    # Only the disambiguation stage differs between variants, so rows are prepared once.
+    variants = (True, False) if aggregate.baseline is not None else (True,)
+    cache = _open_cache(cache_path, fingerprint)
+    try:
+        for row in rows:
+            aggregate.samples += 1
+            expected = row.get("expected", {})
+            predictions, reused = _predict_variants(row, variants, cache)
+            aggregate.cache_reused += int(reused)
+            predicted = predictions[True]
+            if aggregate.core is not None:
+                aggregate.core.add(expected, predicted, weights)
+            if aggregate.safety is not None:
+                aggregate.safety.add(expected, predicted)
+            if aggregate.baseline is not None:
+                aggregate.baseline.add(expected, predictions[False], weights)
+    finally:
+        if cache is not None:
+            cache.close()
+    return aggregate
+
+
+def _cache_summary(cache_path: str | None, fingerprint: str | None, samples: int, reused: int) -> dict[str, Any]:
     return {
-        "bins": bins,
-        "ece": round(ece, 4),
-        "mce": round(mce, 4),
-        "brier_score": round(brier, 4),
-        "reliability_bins": reliability_bins,
+        "path": cache_path,
+        "fingerprint": fingerprint,
+        "reused": reused,
+        "parsed": samples - reused,
     }
 
 
-def compare_readback(atc_utterance: str, pilot_utterance: str) -> dict[str, Any]:
-    atc = parse_utterance(atc_utterance, speaker="ATC")
-    pilot = parse_utterance(pilot_utterance, speaker="PILOT")
+ReadbackParse = tuple[str | None, Counter[tuple[Any, ...]]]
+
+
+def _readback_parse(utterance: str, speaker: str) -> ReadbackParse:
+    parsed = parse_utterance(utterance, speaker=speaker)
+    return parsed.get("callsign"), _slot_counter(parsed.get("instructions", []))
+
 
-    atc_slots = _slot_counter(atc.get("instructions", []))
-    pilot_slots = _slot_counter(pilot.get("instructions", []))
+def readback_result(atc: ReadbackParse, pilot: ReadbackParse) -> dict[str, Any]:
+    """Compare a clearance with its readback, each given as `(callsign, Counter of slot_key)`."""
+    atc_callsign, atc_slots = atc
+    pilot_callsign, pilot_slots = pilot
 
     missing_in_pilot = _counter_difference_items(atc_slots, pilot_slots)
     unexpected_in_pilot = _counter_difference_items(pilot_slots, atc_slots)
 
     callsign_mismatch = False
-    if atc.get("callsign") and pilot.get("callsign") and atc["callsign"] != pilot["callsign"]:
+    if atc_callsign and pilot_callsign and atc_callsign != pilot_callsign:
         callsign_mismatch = True
 
     mismatch_detected = bool(missing_in_pilot or unexpected_in_pilot or callsign_mismatch)
 
     return {
-        "callsign_expected": atc.get("callsign"),
-        "callsign_readback": pilot.get("callsign"),
+        "callsign_expected": atc_callsign,
+        "callsign_readback": pilot_callsign,
         "callsign_mismatch": callsign_mismatch,
         "missing_in_readback": missing_in_pilot,
         "unexpected_in_readback": unexpected_in_pilot,
@@ -193,97 +743,111 @@ def compare_readback(atc_utterance: str, pilot_utterance: str) -> dict[str, Any]
     }
 
 
+def compare_readback(atc_utterance: str, pilot_utterance: str) -> dict[str, Any]:
+    return readback_result(_readback_parse(atc_utterance, "ATC"), _readback_parse(pilot_utterance, "PILOT"))
+
+
+@dataclass(slots=True)
+class _ReadbackBatch:
+    """Mergeable `compare_readbacks` results keyed by input position."""
+
+    results: dict[int, dict[str, Any]] = field(default_factory=dict)
+
+    def merge(self, other: _ReadbackBatch) -> None:
+        self.results.update(other.results)
+
+
+def _compare_readback_groups(groups: Iterable[tuple[str, list[tuple[int, str]]]]) -> _ReadbackBatch:
+    batch = _ReadbackBatch()
+    pilots: dict[str, ReadbackParse] = {}
+    for atc_utterance, attempts in groups:
+        atc = _readback_parse(atc_utterance, "ATC")
+        for idx, pilot_utterance in attempts:
+            pilot = pilots.get(pilot_utterance)
+            if pilot is None:
+                pilot = pilots[pilot_utterance] = _readback_parse(pilot_utterance, "PILOT")
+            batch.results[idx] = readback_result(atc, pilot)
+    return batch
+
+
+def compare_readbacks(
+    pairs: Iterable[tuple[str, str]],
+    *,
+    workers: int = 1,
+    shard_size: int = 1000,
+) -> list[dict[str, Any]]:
+    """`compare_readback` over `(atc_utterance, pilot_utterance)` pairs, in input order.
+
+    Each distinct clearance is parsed once for all of its readback attempts;
+    clearances are sharded across `workers` processes.
+    """
+    attempts_by_clearance: dict[str, list[tuple[int, str]]] = {}
+    count = 0
+    for count, (atc_utterance, pilot_utterance) in enumerate(pairs, start=1):
+        attempts_by_clearance.setdefault(atc_utterance, []).append((count - 1, pilot_utterance))
+
+    batch = run_sharded(
+        attempts_by_clearance.items(),
+        _compare_readback_groups,
+        (),
+        _ReadbackBatch(),
+        workers=workers,
+        shard_size=shard_size,
+    )
+    return [batch.results[idx] for idx in range(count)]
+
+
 def evaluate_dataset(
     path: Path,
     severity_weights: dict[str, float] | None = None,
     *,
     enable_hybrid: bool = True,
+    workers: int = 1,
+    shard_size: int = 1000,
+    prediction_cache: str | Path | None = None,
+    bootstrap: int = 0,
+    confidence_level: float = DEFAULT_CONFIDENCE_LEVEL,
+    bootstrap_seed: int = 0,
+    group_by: Iterable[str] = (),
+    calibration_bins: int = DEFAULT_CALIBRATION_BINS,
+    use_cache: bool = True,
 ) -> dict[str, Any]:
-    rows = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines() if line.strip()]
+    if calibration_bins < 1:
+        raise ValueError("calibration_bins must be at least 1")
+    rows = iter_rows(path, use_cache=use_cache)
 
     weights = severity_weights or DEFAULT_SEVERITY_WEIGHTS
-
-    intent_tp = intent_fp = intent_fn = 0
-    slot_tp = slot_fp = slot_fn = 0
-    status_correct = 0
-    callsign_correct = 0
-    weighted_fp = 0.0
-    weighted_fn = 0.0
-    confidences: list[float] = []
-    correctness: list[int] = []
-
-    for row in rows:
-        expected = row["expected"]
-        predicted = parse_utterance(
-            text=row["utterance"],
-            speaker=row.get("speaker", "ATC"),
-            utterance_id=row.get("id"),
-            enable_hybrid=enable_hybrid,
+    group_fields = tuple(dict.fromkeys(group_by))
+    cache_path = str(prediction_cache) if prediction_cache else None
+    fingerprint = parser_fingerprint() if cache_path else None
+
+    aggregate = run_sharded(
+        rows,
+        evaluate_rows,
+        (weights, enable_hybrid, cache_path, fingerprint, group_fields),
+        DatasetAggregate(),
+        workers=workers,
+        shard_size=shard_size,
+    )
+    report = aggregate.report(path, weights, calibration_bins)
+    if bootstrap:
+        report["confidence_intervals"] = bootstrap_intervals(
+            aggregate.outcomes,
+            CORE_OUTCOME_COLUMNS,
+            {**CORE_INTERVAL_METRICS, **SEVERITY_INTERVAL_METRICS},
+            resamples=bootstrap,
+            confidence=confidence_level,
+            seed=bootstrap_seed,
         )
+    if group_fields:
+        report["slices"] = {name: {} for name in group_fields}
+        report["slices"].update(aggregate.slices())
+    if cache_path:
+        report["prediction_cache"] = _cache_summary(cache_path, fingerprint, aggregate.samples, aggregate.cache_reused)
+    return report
 
-        expected_types = _instruction_type_counter(expected.get("instructions", []))
-        predicted_types = _instruction_type_counter(predicted.get("instructions", []))
-        tp_i = _count_overlap(expected_types, predicted_types)
-        intent_tp += tp_i
-        intent_fp += sum(predicted_types.values()) - tp_i
-        intent_fn += sum(expected_types.values()) - tp_i
-
-        expected_slots = _slot_counter(expected.get("instructions", []))
-        predicted_slots = _slot_counter(predicted.get("instructions", []))
-        tp_s = _count_overlap(expected_slots, predicted_slots)
-        slot_tp += tp_s
-        slot_fp += sum(predicted_slots.values()) - tp_s
-        slot_fn += sum(expected_slots.values()) - tp_s
-
-        weighted = _weighted_error_totals(expected_slots, predicted_slots, weights)
-        weighted_fp += weighted["weighted_fp"]
-        weighted_fn += weighted["weighted_fn"]
-
-        if predicted.get("status") == expected.get("status"):
-            status_correct += 1
-        if predicted.get("callsign") == expected.get("callsign"):
-            callsign_correct += 1
-        confidences.append(float(predicted.get("confidence", 0.0)))
-        correctness.append(1 if _is_utterance_correct(expected, predicted) else 0)
-
-    n = len(rows)
-    weighted_total = weighted_fp + weighted_fn
-    return {
-        "dataset": str(path),
-        "samples": n,
-        "intent": {
-            "precision": round(_safe_div(intent_tp, intent_tp + intent_fp), 4),
-            "recall": round(_safe_div(intent_tp, intent_tp + intent_fn), 4),
-            "f1": round(_f1(intent_tp, intent_fp, intent_fn), 4),
-            "tp": intent_tp,
-            "fp": intent_fp,
-            "fn": intent_fn,
-        },
-        "slot": {
-            "precision": round(_safe_div(slot_tp, slot_tp + slot_fp), 4),
-            "recall": round(_safe_div(slot_tp, slot_tp + slot_fn), 4),
-            "f1": round(_f1(slot_tp, slot_fp, slot_fn), 4),
-            "tp": slot_tp,
-            "fp": slot_fp,
-            "fn": slot_fn,
-        },
-        "status_accuracy": round(_safe_div(status_correct, n), 4),
-        "callsign_accuracy": round(_safe_div(callsign_correct, n), 4),
-        "severity_weighted_error": {
-            "weights": weights,
-            "weighted_fp": round(weighted_fp, 4),
-            "weighted_fn": round(weighted_fn, 4),
-            "weighted_total_error": round(weighted_total, 4),
-            "weighted_error_per_sample": round(_safe_div(weighted_total, n), 4),
-        },
-        "calibration": _calibration_report(confidences, correctness, bins=10),
-    }
-
-
-def evaluate_hybrid_ambiguity(path: Path) -> dict[str, Any]:
-    baseline = evaluate_dataset(path, enable_hybrid=False)
-    hybrid = evaluate_dataset(path, enable_hybrid=True)
 
+def _hybrid_summary(path: Path, baseline: dict[str, Any], hybrid: dict[str, Any]) -> dict[str, Any]:
     return {
         "dataset": str(path),
         "baseline": {
@@ -304,25 +868,50 @@ def evaluate_hybrid_ambiguity(path: Path) -> dict[str, Any]:
     }
 
 
-def evaluate_readback_dataset(path: Path) -> dict[str, Any]:
-    rows = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines() if line.strip()]
+def evaluate_hybrid_ambiguity(
+    path: Path,
+    *,
+    workers: int = 1,
+    prediction_cache: str | Path | None = None,
+) -> dict[str, Any]:
+    report = evaluate_run(path, sections=("hybrid",), workers=workers, prediction_cache=prediction_cache)
+    summary = report["hybrid_compare"]
+    if "prediction_cache" in report:
+        summary["prediction_cache"] = report["prediction_cache"]
+    return summary
 
+
+def evaluate_readback_dataset(
+    path: Path,
+    *,
+    workers: int = 1,
+    shard_size: int = 1000,
+    batch_size: int = READBACK_BATCH_ROWS,
+    use_cache: bool = True,
+) -> dict[str, Any]:
+    n = 0
     tp = fp = fn = tn = 0
-    for row in rows:
-        result = compare_readback(row["atc_utterance"], row["pilot_utterance"])
-        predicted = bool(result["mismatch_detected"])
-        expected = bool(row["expected_mismatch"])
-
-        if predicted and expected:
-            tp += 1
-        elif predicted and not expected:
-            fp += 1
-        elif not predicted and expected:
-            fn += 1
-        else:
-            tn += 1
+    # Clearances are deduplicated within each batch; batches keep memory bounded.
+    for block in iter_shards(iter_rows(path, use_cache=use_cache), batch_size):
+        results = compare_readbacks(
+            ((row["atc_utterance"], row["pilot_utterance"]) for row in block),
+            workers=workers,
+            shard_size=shard_size,
+        )
+        for row, result in zip(block, results, strict=True):
+            n += 1
+            predicted = bool(result["mismatch_detected"])
+            expected = bool(row["expected_mismatch"])
+
+            if predicted and expected:
+                tp += 1
+            elif predicted and not expected:
+                fp += 1
+            elif not predicted and expected:
+                fn += 1
+            else:
+                tn += 1
 
-    n = len(rows)
     return {
         "dataset": str(path),
         "samples": n,
@@ -339,29 +928,66 @@ def evaluate_readback_dataset(path: Path) -> dict[str, Any]:
     }
 
 
-def evaluate_sequence_dataset(path: Path) -> dict[str, Any]:
-    rows = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines() if line.strip()]
-
-    turn_total = 0
-    turn_correct = 0
-    state_total = 0
-    state_correct = 0
-
-    def _sequence_slot_counter(instructions: list[dict[str, Any]]) -> Counter[tuple[Any, ...]]:
-        return Counter(
-            (
-                item.get("type"),
-                item.get("action"),
-                _canonical_value(item.get("value")),
-                item.get("unit"),
-                item.get("condition"),
-            )
-            for item in instructions
+def _sequence_slot_counter(instructions: list[dict[str, Any]]) -> Counter[tuple[Any, ...]]:
+    return Counter(
+        (
+            item.get("type"),
+            item.get("action"),
+            _canonical_value(item.get("value")),
+            item.get("unit"),
+            item.get("condition"),
         )
+        for item in instructions
+    )
 
+
+def _final_state_matches(expected_active: dict[str, Any], predicted_active: dict[str, Any]) -> bool:
+    # Compare only keys/values required by benchmark.
+    for slot_type, expected_slot in expected_active.items():
+        pred_slot = predicted_active.get(slot_type)
+        if not pred_slot:
+            return False
+        if pred_slot.get("type") != expected_slot.get("type") or pred_slot.get("value") != expected_slot.get("value"):
+            return False
+        if "condition" in expected_slot and pred_slot.get("condition") != expected_slot.get("condition"):
+            return False
+    return set(predicted_active) == set(expected_active)
+
+
+@dataclass(slots=True)
+class _SequenceAggregate:
+    """Mergeable partial metrics for `evaluate_sequence_dataset`; shards merge in dataset order."""
+
+    sessions: int = 0
+    turn_total: int = 0
+    turn_correct: int = 0
+    state_correct: int = 0
+    failing_sessions: int = 0
+    # First MAX_REPORTED_SEQUENCE_FAILURES failing sessions, in dataset order.
+    failures: list[dict[str, Any]] = field(default_factory=list)
+
+    def add_failure(self, failure: dict[str, Any]) -> None:
+        self.failing_sessions += 1
+        if len(self.failures) < MAX_REPORTED_SEQUENCE_FAILURES:
+            self.failures.append(failure)
+
+    def merge(self, other: _SequenceAggregate) -> None:
+        self.sessions += other.sessions
+        self.turn_total += other.turn_total
+        self.turn_correct += other.turn_correct
+        self.state_correct += other.state_correct
+        self.failing_sessions += other.failing_sessions
+        room = MAX_REPORTED_SEQUENCE_FAILURES - len(self.failures)
+        self.failures.extend(other.failures[: max(room, 0)])
+
+
+def _evaluate_sequence_rows(rows: Iterable[dict[str, Any]]) -> _SequenceAggregate:
+    aggregate = _SequenceAggregate()
     for row in rows:
+        aggregate.sessions += 1
         state = SequenceState()
         callsign_for_state = str(row["expected_final_state"]["callsign"])
+        failed_turns: list[int] = []
 
         for idx, turn in enumerate(row["turns"]):
             predicted = parse_turn_with_state(
@@ -372,114 +998,167 @@ def evaluate_sequence_dataset(path: Path) -> dict[str, Any]:
             )
             expected = turn["expected"]
 
-            turn_total += 1
+            aggregate.turn_total += 1
             if (
                 predicted.get("status") == expected.get("status")
                 and predicted.get("callsign") == expected.get("callsign")
                 and _sequence_slot_counter(predicted.get("instructions", []))
                 == _sequence_slot_counter(expected.get("instructions", []))
             ):
-                turn_correct += 1
-
-        expected_active = row["expected_final_state"]["active"]
-        predicted_active = state.active_by_callsign.get(callsign_for_state, {})
-        state_total += 1
-
-        # Compare only keys/values required by benchmark.
-        state_ok = True
-        for slot_type, expected_slot in expected_active.items():
-            pred_slot = predicted_active.get(slot_type)
-            if not pred_slot:
-                state_ok = False
-                break
-            if pred_slot.get("type") != expected_slot.get("type") or pred_slot.get("value") != expected_slot.get("value"):
-                state_ok = False
-                break
-            if "condition" in expected_slot and pred_slot.get("condition") != expected_slot.get("condition"):
-                state_ok = False
-                break
-        if state_ok and set(predicted_active) == set(expected_active):
-            state_correct += 1
+                aggregate.turn_correct += 1
+            else:
+                failed_turns.append(idx)
+
+        state_ok = _final_state_matches(
+            row["expected_final_state"]["active"],
+            state.active_by_callsign.get(callsign_for_state, {}),
+        )
+        aggregate.state_correct += state_ok
+        if failed_turns or not state_ok:
+            aggregate.add_failure(
+                {"session_id": row["session_id"], "failed_turns": failed_turns, "final_state_ok": state_ok}
+            )
+    return aggregate
 
+
+def evaluate_sequence_dataset(
+    path: Path, *, workers: int = 1, shard_size: int = 200, use_cache: bool = True
+) -> dict[str, Any]:
+    """Replay each session through its own `SequenceState`; sessions are sharded across `workers`.
+
+    `failures` lists failing sessions (0-based `failed_turns` indices and whether
+    the final state matched) in dataset order, capped at MAX_REPORTED_SEQUENCE_FAILURES.
+    """
+    aggregate = run_sharded(
+        iter_rows(path, use_cache=use_cache),
+        _evaluate_sequence_rows,
+        (),
+        _SequenceAggregate(),
+        workers=workers,
+        shard_size=shard_size,
+    )
     return {
         "dataset": str(path),
-        "sessions": len(rows),
-        "turns": turn_total,
-        "turn_accuracy": round(_safe_div(turn_correct, turn_total), 4),
-        "final_state_accuracy": round(_safe_div(state_correct, state_total), 4),
+        "sessions": aggregate.sessions,
+        "turns": aggregate.turn_total,
+        "turn_accuracy": round(_safe_div(aggregate.turn_correct, aggregate.turn_total), 4),
+        "final_state_accuracy": round(_safe_div(aggregate.state_correct, aggregate.sessions), 4),
+        "failing_sessions": aggregate.failing_sessions,
+        "failures": aggregate.failures,
     }
 
 
-def evaluate_safety_dataset(path: Path, min_operational_threshold: float = 0.60) -> dict[str, Any]:
-    rows = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines() if line.strip()]
+def _safety_intervals(
+    aggregate: _SafetyAggregate,
+    bootstrap: int,
+    confidence_level: float,
+    bootstrap_seed: int,
+) -> dict[str, Any]:
+    return bootstrap_intervals(
+        aggregate.outcomes,
+        SAFETY_OUTCOME_COLUMNS,
+        SAFETY_INTERVAL_METRICS,
+        resamples=bootstrap,
+        confidence=confidence_level,
+        seed=bootstrap_seed,
+    )
 
-    violations = {
-        "silent_ok_without_instructions": 0,
-        "ok_below_operational_threshold": 0,
-        "unknown_with_instructions": 0,
-        "conflict_without_conflict_note": 0,
-    }
-    status_distribution: Counter[str] = Counter()
-    expected_non_ok = 0
-    detected_non_ok = 0
 
-    for row in rows:
-        expected = row.get("expected", {})
-        predicted = parse_utterance(
-            text=row["utterance"],
-            speaker=row.get("speaker", "ATC"),
-            utterance_id=row.get("id"),
-        )
-        status = str(predicted.get("status"))
-        status_distribution[status] += 1
-
-        instructions = predicted.get("instructions", [])
-        confidence = float(predicted.get("confidence", 0.0))
-        notes = set(predicted.get("notes", []))
+def evaluate_safety_dataset(
+    path: Path,
+    min_operational_threshold: float = 0.60,
+    *,
+    workers: int = 1,
+    shard_size: int = 1000,
+    bootstrap: int = 0,
+    confidence_level: float = DEFAULT_CONFIDENCE_LEVEL,
+    bootstrap_seed: int = 0,
+) -> dict[str, Any]:
+    aggregate = run_sharded(
+        iter_rows(path),
+        _evaluate_safety_rows,
+        (min_operational_threshold,),
+        _SafetyAggregate(min_operational_threshold=min_operational_threshold),
+        workers=workers,
+        shard_size=shard_size,
+    )
+    safety = aggregate.report()
+    if bootstrap:
+        safety["confidence_intervals"] = _safety_intervals(aggregate, bootstrap, confidence_level, bootstrap_seed)
+    return {
+        "dataset": str(path),
+        "samples": aggregate.samples,
+        "safety": safety,
+    }
 
-        if status == "ok" and not instructions:
-            violations["silent_ok_without_instructions"] += 1
-        if status == "ok" and confidence < min_operational_threshold:
-            violations["ok_below_operational_threshold"] += 1
-        if status == "unknown" and instructions:
-            violations["unknown_with_instructions"] += 1
-        if status == "conflict" and not (
-            "slot_conflict_detected" in notes or "history_conflict_detected" in notes
-        ):
-            violations["conflict_without_conflict_note"] += 1
 
-        if expected.get("status") in {"unknown", "ambiguous", "conflict"}:
-            expected_non_ok += 1
-            if status in {"unknown", "ambiguous", "conflict"}:
-                detected_non_ok += 1
+def evaluate_run(
+    path: Path,
+    *,
+    sections: Iterable[str] = DEFAULT_RUN_SECTIONS,
+    severity_weights: dict[str, float] | None = None,
+    min_operational_threshold: float = 0.60,
+    workers: int = 1,
+    shard_size: int = 1000,
+    prediction_cache: str | Path | None = None,
+    bootstrap: int = 0,
+    confidence_level: float = DEFAULT_CONFIDENCE_LEVEL,
+    bootstrap_seed: int = 0,
+    calibration_bins: int = DEFAULT_CALIBRATION_BINS,
+) -> dict[str, Any]:
+    requested = tuple(dict.fromkeys(sections))
+    unknown = [name for name in requested if name not in RUN_SECTIONS]
+    if unknown:
+        raise ValueError(f"unknown report sections: {', '.join(unknown)}")
+    if calibration_bins < 1:
+        raise ValueError("calibration_bins must be at least 1")
 
-    n = len(rows)
-    total_violations = sum(violations.values())
-    blocking = status_distribution.get("unknown", 0) + status_distribution.get("ambiguous", 0) + status_distribution.get(
-        "conflict", 0
+    weights = severity_weights or DEFAULT_SEVERITY_WEIGHTS
+    cache_path = str(prediction_cache) if prediction_cache else None
+    fingerprint = parser_fingerprint() if cache_path else None
+    aggregate = run_sharded(
+        iter_rows(path),
+        _evaluate_run_rows,
+        (weights, requested, min_operational_threshold, cache_path, fingerprint),
+        _new_run_aggregate(requested, min_operational_threshold),
+        workers=workers,
+        shard_size=shard_size,
     )
 
-    return {
-        "dataset": str(path),
-        "samples": n,
-        "safety": {
-            "policy_conformance": {
-                "min_operational_threshold": min_operational_threshold,
-                "total_violations": total_violations,
-                "violations": violations,
-                "violation_rate": round(_safe_div(total_violations, n), 4),
-            },
-            "fallback_behavior": {
-                "status_distribution": dict(status_distribution),
-                "blocking_status_rate": round(_safe_div(blocking, n), 4),
-            },
-            "failure_mode_detection": {
-                "expected_non_ok": expected_non_ok,
-                "detected_non_ok": detected_non_ok,
-                "non_ok_detection_recall": round(_safe_div(detected_non_ok, expected_non_ok), 4),
-            },
-        },
-    }
+    report: dict[str, Any] = {"dataset": str(path), "samples": aggregate.samples, "sections": list(requested)}
+    if aggregate.core is not None:
+        core = aggregate.core.report(path, weights, calibration_bins)
+        if "core" in requested:
+            for key in ("intent", "slot", "status_accuracy", "callsign_accuracy"):
+                report[key] = core[key]
+        if "severity" in requested:
+            report["severity_weighted_error"] = core["severity_weighted_error"]
+        if "calibration" in requested:
+            report["calibration"] = core["calibration"]
+        if aggregate.baseline is not None:
+            report["hybrid_compare"] = _hybrid_summary(path, aggregate.baseline.report(path, weights), core)
+        interval_metrics = {
+            **(CORE_INTERVAL_METRICS if "core" in requested else {}),
+            **(SEVERITY_INTERVAL_METRICS if "severity" in requested else {}),
+        }
+        if bootstrap and interval_metrics:
+            report["confidence_intervals"] = bootstrap_intervals(
+                aggregate.core.outcomes,
+                CORE_OUTCOME_COLUMNS,
+                interval_metrics,
+                resamples=bootstrap,
+                confidence=confidence_level,
+                seed=bootstrap_seed,
+            )
+    if aggregate.safety is not None:
+        report["safety"] = aggregate.safety.report()
+        if bootstrap:
+            report["safety"]["confidence_intervals"] = _safety_intervals(
+                aggregate.safety, bootstrap, confidence_level, bootstrap_seed
+            )
+    if cache_path:
+        report["prediction_cache"] = _cache_summary(cache_path, fingerprint, aggregate.samples, aggregate.cache_reused)
+    return report
 
 
 def _load_weights(path: str | None) -> dict[str, float] | None:
@@ -518,32 +1197,95 @@ def _render_markdown_report(report: dict[str, Any]) -> str:
                 "",
             ]
         )
-        if "severity_weighted_error" in report:
-            sev = report["severity_weighted_error"]
-            lines.extend(
-                [
-                    "## Severity-Weighted Error",
-                    "",
-                    f"- Weighted FP: `{sev['weighted_fp']}`",
-                    f"- Weighted FN: `{sev['weighted_fn']}`",
-                    f"- Weighted Total Error: `{sev['weighted_total_error']}`",
-                    f"- Weighted Error / Sample: `{sev['weighted_error_per_sample']}`",
-                    "",
-                ]
-            )
-        if "calibration" in report:
-            cal = report["calibration"]
-            lines.extend(
-                [
-                    "## Calibration",
-                    "",
-                    f"- ECE: `{cal['ece']}`",
-                    f"- MCE: `{cal['mce']}`",
-                    f"- Brier Score: `{cal['brier_score']}`",
-                    f"- Bins: `{cal['bins']}`",
-                    "",
-                ]
+
+    if "severity_weighted_error" in report:
+        sev = report["severity_weighted_error"]
+        lines.extend(
+            [
+                "## Severity-Weighted Error",
+                "",
+                f"- Weighted FP: `{sev['weighted_fp']}`",
+                f"- Weighted FN: `{sev['weighted_fn']}`",
+                f"- Weighted Total Error: `{sev['weighted_total_error']}`",
+                f"- Weighted Error / Sample: `{sev['weighted_error_per_sample']}`",
+                "",
+            ]
+        )
+
+    if "calibration" in report:
+        cal = report["calibration"]
+        lines.extend(
+            [
+                "## Calibration",
+                "",
+                f"- ECE: `{cal['ece']}`",
+                f"- MCE: `{cal['mce']}`",
+                f"- Brier Score: `{cal['brier_score']}`",
+                f"- Bins: `{cal['bins']}`",
+                "",
+            ]
+        )
+
+    if "safety" in report:
+        safety = report["safety"]
+        conformance = safety["policy_conformance"]
+        fallback = safety["fallback_behavior"]
+        failure = safety["failure_mode_detection"]
+        lines.extend(
+            [
+                "## Safety",
+                "",
+                f"- Policy Violations: `{conformance['total_violations']}` (rate `{conformance['violation_rate']}`)",
+                f"- Blocking Status Rate: `{fallback['blocking_status_rate']}`",
+                f"- Non-OK Detection Recall: `{failure['non_ok_detection_recall']}`",
+                "",
+            ]
+        )
+
+    for name, values in report.get("slices", {}).items():
+        lines.extend(
+            [
+                f"## Slices by {name}",
+                "",
+                "| Value | Samples | Intent F1 | Slot F1 | Status Acc | Callsign Acc |",
+                "|---|---|---|---|---|---|",
+            ]
+        )
+        for value, metrics in values.items():
+            lines.append(
+                f"| {value} | {metrics['samples']} | {metrics['intent_f1']} | {metrics['slot_f1']} "
+                f"| {metrics['status_accuracy']} | {metrics['callsign_accuracy']} |"
             )
+        lines.append("")
+
+    intervals = [report.get("confidence_intervals"), report.get("safety", {}).get("confidence_intervals")]
+    intervals = [item for item in intervals if item]
+    if intervals:
+        first = intervals[0]
+        lines.extend(
+            [
+                "## Confidence Intervals",
+                "",
+                f"- Method: `{first['method']}` ({first['resamples']} resamples, {first['confidence']:.0%})",
+            ]
+        )
+        for item in intervals:
+            for name, bounds in item["metrics"].items():
+                lines.append(f"- {name}: `[{bounds['lower']}, {bounds['upper']}]`")
+        lines.append("")
+
+    if "hybrid_compare" in report:
+        delta = report["hybrid_compare"]["delta"]
+        lines.extend(
+            [
+                "## Hybrid vs Baseline",
+                "",
+                f"- Slot F1 Delta: `{delta['slot_f1']}`",
+                f"- Intent F1 Delta: `{delta['intent_f1']}`",
+                f"- Status Accuracy Delta: `{delta['status_accuracy']}`",
+                "",
+            ]
+        )
 
     if "readback_mismatch" in report:
         rb = report["readback_mismatch"]
@@ -588,26 +1330,109 @@ def main() -> None:
     parser.add_argument("--hybrid-compare", action="store_true", help="Compare baseline deterministic vs hybrid mode")
     parser.add_argument("--disable-hybrid", action="store_true", help="Run single-dataset evaluation with hybrid disabled")
     parser.add_argument("--severity-weights", default=None, help="Optional JSON file with per-intent weights")
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes for every evaluation mode")
+    parser.add_argument(
+        "--prediction-cache",
+        default=None,
+        help="SQLite file caching predictions by row content and parser fingerprint",
+    )
+    parser.add_argument(
+        "--reports",
+        default=None,
+        help=f"Comma-separated report sections built from one parse pass ({', '.join(RUN_SECTIONS)})",
+    )
+    parser.add_argument(
+        "--group-by",
+        default=None,
+        help="Comma-separated row metadata fields to break single-dataset metrics down by "
+        "(e.g. region,speaker,instruction_type,noise_level,source)",
+    )
+    parser.add_argument(
+        "--bootstrap",
+        type=int,
+        default=0,
+        help="Bootstrap resamples for confidence intervals on headline metrics (0 disables)",
+    )
+    parser.add_argument(
+        "--calibration-bins",
+        type=int,
+        default=None,
+        help=f"Reliability bins for the calibration report (default {DEFAULT_CALIBRATION_BINS})",
+    )
+    parser.add_argument("--confidence-level", type=float, default=DEFAULT_CONFIDENCE_LEVEL)
+    parser.add_argument("--bootstrap-seed", type=int, default=0)
     parser.add_argument("--write-report", action="store_true", help="Write timestamped JSON and markdown reports")
     parser.add_argument("--report-dir", default="reports", help="Directory for report artifacts")
-    parser.add_argument("--report-label", default="evaluation", help="Label used in report filename")
+    parser.add_argument("--report-label", default="evaluation", help="Label used in report filename and run history")
+    parser.add_argument(
+        "--history",
+        default=None,
+        metavar="PATH",
+        help=f"Append this run to a run-history SQLite file (e.g. {DEFAULT_HISTORY_PATH})",
+    )
     args = parser.parse_args()
+    intervals = {
+        "bootstrap": args.bootstrap,
+        "confidence_level": args.confidence_level,
+        "bootstrap_seed": args.bootstrap_seed,
+    }
 
-    if args.readback_dataset:
-        report = evaluate_readback_dataset(Path(args.readback_dataset))
-    elif args.safety_dataset:
-        report = evaluate_safety_dataset(Path(args.safety_dataset))
-    elif args.sequence_dataset:
-        report = evaluate_sequence_dataset(Path(args.sequence_dataset))
-    elif args.hybrid_compare:
+    modes = {
+        "readback": args.readback_dataset,
+        "safety": args.safety_dataset,
+        "sequence": args.sequence_dataset,
+        "run": args.reports,
+        "hybrid_compare": args.hybrid_compare,
+    }
+    selected = [name for name, value in modes.items() if value]
+    if len(selected) > 1:
+        parser.error(f"choose one evaluation mode, got: {', '.join(selected)}")
+    kind = selected[0] if selected else "dataset"
+    if args.dataset and kind in ("readback", "safety", "sequence"):
+        parser.error(f"--dataset cannot be combined with --{kind}-dataset")
+    for flag, value, kinds in (
+        ("--disable-hybrid", args.disable_hybrid, ("dataset",)),
+        ("--group-by", args.group_by, ("dataset",)),
+        ("--severity-weights", args.severity_weights, ("dataset", "run")),
+        ("--calibration-bins", args.calibration_bins, ("dataset", "run")),
+        ("--prediction-cache", args.prediction_cache, ("dataset", "run", "hybrid_compare")),
+        ("--bootstrap", args.bootstrap, ("dataset", "run", "safety")),
+    ):
+        if value and kind not in kinds:
+            parser.error(f"{flag} is not supported for {kind} evaluations")
+    calibration_bins = DEFAULT_CALIBRATION_BINS if args.calibration_bins is None else args.calibration_bins
+
+    if kind == "readback":
+        report = evaluate_readback_dataset(Path(args.readback_dataset), workers=args.workers)
+    elif kind == "safety":
+        report = evaluate_safety_dataset(Path(args.safety_dataset), workers=args.workers, **intervals)
+    elif kind == "sequence":
+        report = evaluate_sequence_dataset(Path(args.sequence_dataset), workers=args.workers)
+    elif kind == "run":
+        dataset = args.dataset or "data/gold/v0_slice.jsonl"
+        report = evaluate_run(
+            Path(dataset),
+            sections=[name.strip() for name in args.reports.split(",") if name.strip()],
+            severity_weights=_load_weights(args.severity_weights),
+            workers=args.workers,
+            prediction_cache=args.prediction_cache,
+            calibration_bins=calibration_bins,
+            **intervals,
+        )
+    elif kind == "hybrid_compare":
         dataset = args.dataset or "data/gold/v0_ambiguity_slice.jsonl"
-        report = evaluate_hybrid_ambiguity(Path(dataset))
+        report = evaluate_hybrid_ambiguity(Path(dataset), workers=args.workers, prediction_cache=args.prediction_cache)
     else:
         dataset = args.dataset or "data/gold/v0_slice.jsonl"
         report = evaluate_dataset(
             Path(dataset),
             severity_weights=_load_weights(args.severity_weights),
             enable_hybrid=not args.disable_hybrid,
+            workers=args.workers,
+            prediction_cache=args.prediction_cache,
+            group_by=[name.strip() for name in (args.group_by or "").split(",") if name.strip()],
+            calibration_bins=calibration_bins,
+            **intervals,
         )
 
     if args.write_report:
@@ -617,6 +1442,8 @@ def main() -> None:
             label=args.report_label,
         )
         report["report_artifacts"] = artifact_paths
+    if args.history:
+        report["run_history"] = record_run(report, args.history, kind=kind, label=args.report_label)
 
     print(json.dumps(report, indent=2, sort_keys=False))
 
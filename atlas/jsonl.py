@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import gzip
+import io
+import json
+from pathlib import Path
+from typing import IO, Any, Iterator
+
+READ_CHUNK_BYTES = 1 << 20
+GZIP_MAGIC = b"\x1f\x8b"
+
+
+class JsonlError(ValueError):
+    def __init__(self, path: str | Path, line_no: int, message: str) -> None:
+        super().__init__(f"{path}:{line_no}: {message}")
+        self.path = str(path)
+        self.line_no = line_no
+        self.message = message
+
+
+def open_jsonl(path: str | Path) -> IO[str]:
+    with open(path, "rb") as probe:
+        is_gzip = probe.read(len(GZIP_MAGIC)) == GZIP_MAGIC
+    if is_gzip:
+        binary: IO[bytes] = io.BufferedReader(gzip.open(path, "rb"), buffer_size=READ_CHUNK_BYTES)
+    else:
+        binary = open(path, "rb", buffering=READ_CHUNK_BYTES)
+    return io.TextIOWrapper(binary, encoding="utf-8")
+
+
+def iter_jsonl_lines(path: str | Path) -> Iterator[tuple[int, str]]:
+    """Yield `(line_no, line)` for non-blank lines, reading the file in buffered chunks."""
+    with open_jsonl(path) as stream:
+        for line_no, line in enumerate(stream, start=1):
+            if line.strip():
+                yield line_no, line
+
+
+def iter_jsonl(path: str | Path) -> Iterator[dict[str, Any]]:
+    for line_no, line in iter_jsonl_lines(path):
+        try:
+            payload = json.loads(line)
+        except json.JSONDecodeError as exc:
+            raise JsonlError(path, line_no, f"invalid JSON: {exc.msg}") from exc
+        if not isinstance(payload, dict):
+            raise JsonlError(path, line_no, "payload must be object")
+        yield payload
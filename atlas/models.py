@@ -43,7 +43,7 @@ class ParseResult:
                     "unit": item.unit,
                     "condition": item.condition,
                     "update": item.update,
-                    "trace": item.trace,
+                    "trace": dict(item.trace),
                 }
                 for item in self.instructions
             ],
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+from typing import Any
+
+from atlas.bench import DEFAULT_BASELINE, run_benchmarks
+
+# Tail percentiles over fewer calls (e.g. whole evaluator runs) are too noisy to gate on.
+MIN_TAIL_CALLS = 100
+
+
+def _load_baseline(path: Path) -> dict[str, Any]:
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    if not isinstance(payload, dict):
+        raise ValueError("baseline payload must be an object")
+    benchmarks = payload.get("benchmarks")
+    if not isinstance(benchmarks, dict) or not benchmarks:
+        raise ValueError("baseline missing benchmarks section")
+    for name, entry in benchmarks.items():
+        if not isinstance(entry, dict) or "throughput_per_sec" not in entry or "latency_ms" not in entry:
+            raise ValueError(f"baseline benchmark {name} missing throughput_per_sec or latency_ms")
+    return payload
+
+
+def _relative_change(current: float, baseline: float) -> float:
+    return round((current - baseline) / baseline, 4) if baseline else 0.0
+
+
+def run_perf_review(
+    *,
+    baseline_path: Path,
+    max_throughput_drop: float = 0.20,
+    max_p95_growth: float = 0.30,
+    max_p99_growth: float = 0.50,
+    max_rss_growth: float | None = None,
+    report: dict[str, Any] | None = None,
+    repeat: int = 10,
+    synthetic: int = 2000,
+    seed: int = 0,
+) -> tuple[dict, bool, list[str]]:
+    reasons: list[str] = []
+    try:
+        baseline = _load_baseline(baseline_path)
+    except (OSError, json.JSONDecodeError, ValueError, TypeError) as exc:
+        return report or {}, False, [f"invalid perf baseline: {exc}"]
+
+    # Only benchmarks present in the baseline are run, so the gate compares like with like.
+    if report is None:
+        report = run_benchmarks(only=list(baseline["benchmarks"]), repeat=repeat, synthetic=synthetic, seed=seed)
+
+    comparison: dict[str, Any] = {}
+    for name, base in baseline["benchmarks"].items():
+        current = report.get("benchmarks", {}).get(name)
+        if current is None:
+            reasons.append(f"{name} missing from current benchmark report")
+            continue
+
+        throughput_change = _relative_change(current["throughput_per_sec"], base["throughput_per_sec"])
+        p95_change = _relative_change(current["latency_ms"]["p95"], base["latency_ms"]["p95"])
+        p99_change = _relative_change(current["latency_ms"]["p99"], base["latency_ms"]["p99"])
+        tail_gated = min(int(current.get("calls", 0)), int(base.get("calls", 0))) >= MIN_TAIL_CALLS
+        entry = {
+            "throughput_change": throughput_change,
+            "p95_change": p95_change,
+            "p99_change": p99_change,
+            "tail_gated": tail_gated,
+        }
+
+        if -throughput_change > max_throughput_drop:
+            reasons.append(f"{name} throughput dropped {-throughput_change} beyond max_throughput_drop {max_throughput_drop}")
+        if tail_gated and p95_change > max_p95_growth:
+            reasons.append(f"{name} p95 latency grew {p95_change} beyond max_p95_growth {max_p95_growth}")
+        if tail_gated and p99_change > max_p99_growth:
+            reasons.append(f"{name} p99 latency grew {p99_change} beyond max_p99_growth {max_p99_growth}")
+        if max_rss_growth is not None and current.get("peak_rss_mb") and base.get("peak_rss_mb"):
+            rss_change = _relative_change(current["peak_rss_mb"], base["peak_rss_mb"])
+            entry["peak_rss_change"] = rss_change
+            if rss_change > max_rss_growth:
+                reasons.append(f"{name} peak RSS grew {rss_change} beyond max_rss_growth {max_rss_growth}")
+        comparison[name] = entry
+
+    report["comparison"] = comparison
+    return report, len(reasons) == 0, reasons
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="ATLAS performance regression gate")
+    parser.add_argument("--baseline-perf-json", default=DEFAULT_BASELINE)
+    parser.add_argument("--max-throughput-drop", type=float, default=0.20, help="Allowed fractional throughput drop")
+    parser.add_argument("--max-p95-growth", type=float, default=0.30, help="Allowed fractional p95 latency growth")
+    parser.add_argument("--max-p99-growth", type=float, default=0.50, help="Allowed fractional p99 latency growth")
+    parser.add_argument("--max-rss-growth", type=float, default=None, help="Allowed fractional peak RSS growth")
+    parser.add_argument("--report-json", default=None, help="Gate an existing atlas.bench report instead of re-running")
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--synthetic", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    precomputed = None
+    if args.report_json:
+        precomputed = json.loads(Path(args.report_json).read_text(encoding="utf-8"))
+
+    report, passed, reasons = run_perf_review(
+        baseline_path=Path(args.baseline_perf_json),
+        max_throughput_drop=args.max_throughput_drop,
+        max_p95_growth=args.max_p95_growth,
+        max_p99_growth=args.max_p99_growth,
+        max_rss_growth=args.max_rss_growth,
+        report=precomputed,
+        repeat=args.repeat,
+        synthetic=args.synthetic,
+        seed=args.seed,
+    )
+
+    output = {
+        "passed": passed,
+        "reasons": reasons,
+        "report": report,
+        "thresholds": {
+            "baseline_perf_json": args.baseline_perf_json,
+            "max_throughput_drop": args.max_throughput_drop,
+            "max_p95_growth": args.max_p95_growth,
+            "max_p99_growth": args.max_p99_growth,
+            "max_rss_growth": args.max_rss_growth,
+        },
+    }
+    print(json.dumps(output, indent=2, sort_keys=False))
+
+    if not passed:
+        raise SystemExit(2)
+
+
+if __name__ == "__main__":
+    main()
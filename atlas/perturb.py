@@ -0,0 +1,321 @@
+from __future__ import annotations
+
+import argparse
+import json
+import random
+from collections import Counter
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator
+
+from atlas.dataset_cache import iter_rows
+from atlas.evaluate import (
+    DEFAULT_SEVERITY_WEIGHTS,
+    DatasetAggregate,
+    evaluate_rows,
+    outcome_metrics,
+)
+from atlas.sharding import run_sharded
+
+PERTURBATION_TYPES: tuple[str, ...] = ("word_drop", "homophone", "split", "merge", "digit_confusion")
+DEFAULT_INTENSITIES: tuple[float, ...] = (0.1, 0.2, 0.3, 0.5)
+DEFAULT_VARIANTS = 5
+CLEAN_LEVEL = "clean"
+CURVE_METRICS: tuple[str, ...] = ("intent_f1", "slot_f1", "status_accuracy", "callsign_accuracy")
+
+# ASR substitutions. The first block is what `normalize_text` repairs via
+# PHRASE_REPLACEMENTS; the rest are plausible confusions it does not know about.
+HOMOPHONES: dict[str, tuple[str, ...]] = {
+    "HEADING": ("HEDING",),
+    "DESCEND": ("DECEND",),
+    "LAM": ("LAMB",),
+    "CPT": ("CAP TEA",),
+    "TO": ("TOO", "TWO"),
+    "CLIMB": ("CLIME",),
+    "RIGHT": ("WRITE",),
+    "FOR": ("FOUR",),
+    "SPEED": ("SPEAD",),
+    "SQUAWK": ("SQUAK",),
+    "CONTACT": ("CONTRACT",),
+    "TOWER": ("TOUR",),
+    "LEVEL": ("LEVELL",),
+    "HOLD": ("HOLED",),
+    "REDUCE": ("REDUSE",),
+    "MAINTAIN": ("MAINTAINED",),
+}
+# Acoustically close spoken digits (FIVE/NINE, TWO/THREE, ...).
+DIGIT_CONFUSIONS: dict[str, str] = {
+    "0": "8",
+    "1": "7",
+    "2": "3",
+    "3": "2",
+    "4": "1",
+    "5": "9",
+    "6": "0",
+    "7": "1",
+    "8": "0",
+    "9": "5",
+}
+
+
+def _match_case(source: str, replacement: str) -> str:
+    if source.isupper():
+        return replacement.upper()
+    if source[:1].isupper():
+        return replacement.capitalize()
+    return replacement.lower()
+
+
+def _edit_count(eligible: int, intensity: float) -> int:
+    return min(eligible, max(1, round(intensity * eligible))) if eligible else 0
+
+
+def _word_drop(tokens: list[str], rng: random.Random, intensity: float) -> list[str]:
+    # Always keep one token so the variant is still an utterance.
+    dropped = set(rng.sample(range(len(tokens)), _edit_count(len(tokens) - 1, intensity)))
+    return [token for idx, token in enumerate(tokens) if idx not in dropped]
+
+
+def _homophone(tokens: list[str], rng: random.Random, intensity: float) -> list[str]:
+    eligible = [idx for idx, token in enumerate(tokens) if token.upper() in HOMOPHONES]
+    out = list(tokens)
+    for idx in rng.sample(eligible, _edit_count(len(eligible), intensity)):
+        out[idx] = _match_case(tokens[idx], rng.choice(HOMOPHONES[tokens[idx].upper()]))
+    return out
+
+
+def _split(tokens: list[str], rng: random.Random, intensity: float) -> list[str]:
+    eligible = [idx for idx, token in enumerate(tokens) if len(token) >= 4 or (len(token) >= 2 and token.isdigit())]
+    chosen = set(rng.sample(eligible, _edit_count(len(eligible), intensity)))
+    out: list[str] = []
+    for idx, token in enumerate(tokens):
+        if idx in chosen:
+            cut = rng.randint(1, len(token) - 1)
+            out.extend((token[:cut], token[cut:]))
+        else:
+            out.append(token)
+    return out
+
+
+def _merge(tokens: list[str], rng: random.Random, intensity: float) -> list[str]:
+    # Merge points are gaps between tokens; adjacent gaps chain into one longer token.
+    gaps = set(rng.sample(range(1, len(tokens)), _edit_count(len(tokens) - 1, intensity)))
+    out = [tokens[0]] if tokens else []
+    for idx in range(1, len(tokens)):
+        if idx in gaps:
+            out[-1] += tokens[idx]
+        else:
+            out.append(tokens[idx])
+    return out
+
+
+def _digit_confusion(tokens: list[str], rng: random.Random, intensity: float) -> list[str]:
+    positions = [(idx, pos) for idx, token in enumerate(tokens) for pos, char in enumerate(token) if char.isdigit()]
+    out = [list(token) for token in tokens]
+    for idx, pos in rng.sample(positions, _edit_count(len(positions), intensity)):
+        out[idx][pos] = DIGIT_CONFUSIONS[out[idx][pos]]
+    return ["".join(chars) for chars in out]
+
+
+_PERTURBERS: dict[str, Callable[[list[str], random.Random, float], list[str]]] = {
+    "word_drop": _word_drop,
+    "homophone": _homophone,
+    "split": _split,
+    "merge": _merge,
+    "digit_confusion": _digit_confusion,
+}
+
+
+def perturb_utterance(text: str, kind: str, intensity: float, rng: random.Random) -> str:
+    """Apply `kind` noise to about `intensity` of the eligible tokens (at least one)."""
+    if kind not in _PERTURBERS:
+        raise ValueError(f"unknown perturbation type: {kind}")
+    tokens = text.split()
+    if not tokens:
+        return text
+    return " ".join(_PERTURBERS[kind](tokens, rng, intensity))
+
+
+def _validate(kinds: tuple[str, ...], intensities: tuple[float, ...], variants: int) -> None:
+    unknown = [kind for kind in kinds if kind not in _PERTURBERS]
+    if unknown:
+        raise ValueError(f"unknown perturbation types: {', '.join(unknown)}")
+    if any(not 0.0 < intensity <= 1.0 for intensity in intensities):
+        raise ValueError("intensities must be in (0, 1]")
+    if variants < 1:
+        raise ValueError("variants must be at least 1")
+
+
+def expand_rows(
+    rows: Iterable[dict[str, Any]],
+    *,
+    variants: int = DEFAULT_VARIANTS,
+    kinds: Iterable[str] = PERTURBATION_TYPES,
+    intensities: Iterable[float] = DEFAULT_INTENSITIES,
+    seed: int = 0,
+    include_clean: bool = True,
+    changed: Counter[str] | None = None,
+) -> Iterator[dict[str, Any]]:
+    """Yield each row (tagged `clean`) followed by its noisy variants.
+
+    Variants are seeded per (row, type, intensity, index), so expansion is
+    reproducible and independent of row order or sharding. `changed` counts
+    variants whose text differs from the source, keyed by perturbation level.
+    """
+    kinds = tuple(kinds)
+    intensities = tuple(intensities)
+    _validate(kinds, intensities, variants)
+    return _expand(rows, variants, kinds, intensities, seed, include_clean, changed)
+
+
+def _expand(
+    rows: Iterable[dict[str, Any]],
+    variants: int,
+    kinds: tuple[str, ...],
+    intensities: tuple[float, ...],
+    seed: int,
+    include_clean: bool,
+    changed: Counter[str] | None,
+) -> Iterator[dict[str, Any]]:
+    for row_idx, row in enumerate(rows):
+        source_id = row.get("id", f"row-{row_idx + 1}")
+        metadata = row.get("metadata")
+        metadata = dict(metadata) if isinstance(metadata, dict) else {}
+        if include_clean:
+            yield {**row, "metadata": {**metadata, "perturbation_level": CLEAN_LEVEL}}
+        for kind in kinds:
+            for intensity in intensities:
+                level = f"{kind}@{intensity}"
+                for variant in range(variants):
+                    rng = random.Random(f"atlas-perturb:{seed}:{source_id}:{level}:{variant}")
+                    noisy = perturb_utterance(row["utterance"], kind, intensity, rng)
+                    if changed is not None and noisy != row["utterance"]:
+                        changed[level] += 1
+                    yield {
+                        **row,
+                        "id": f"{source_id}~{level}~{variant}",
+                        "utterance": noisy,
+                        "metadata": {
+                            **metadata,
+                            "source_id": source_id,
+                            "perturbation": kind,
+                            "intensity": intensity,
+                            "perturbation_level": level,
+                        },
+                    }
+
+
+def evaluate_robustness(
+    path: Path,
+    *,
+    variants: int = DEFAULT_VARIANTS,
+    kinds: Iterable[str] = PERTURBATION_TYPES,
+    intensities: Iterable[float] = DEFAULT_INTENSITIES,
+    seed: int = 0,
+    enable_hybrid: bool = True,
+    workers: int = 1,
+    shard_size: int = 1000,
+) -> dict[str, Any]:
+    kinds = tuple(dict.fromkeys(kinds))
+    intensities = tuple(sorted(set(intensities)))
+    changed: Counter[str] = Counter()
+    rows = expand_rows(
+        iter_rows(path),
+        variants=variants,
+        kinds=kinds,
+        intensities=intensities,
+        seed=seed,
+        changed=changed,
+    )
+    aggregate = run_sharded(
+        rows,
+        evaluate_rows,
+        (DEFAULT_SEVERITY_WEIGHTS, enable_hybrid, None, None, ("perturbation_level",)),
+        DatasetAggregate(),
+        workers=workers,
+        shard_size=shard_size,
+    )
+
+    levels = {value: outcomes for (_name, value), outcomes in aggregate.groups.items()}
+    clean = outcome_metrics(levels.get(CLEAN_LEVEL, Counter()))
+    curves: dict[str, list[dict[str, Any]]] = {}
+    for kind in kinds:
+        points = []
+        for intensity in intensities:
+            level = f"{kind}@{intensity}"
+            metrics = outcome_metrics(levels.get(level, Counter()))
+            points.append(
+                {
+                    "intensity": intensity,
+                    "changed_rate": round(changed[level] / metrics["samples"], 4) if metrics["samples"] else 0.0,
+                    **metrics,
+                    "degradation": {name: round(clean[name] - metrics[name], 4) for name in CURVE_METRICS},
+                }
+            )
+        curves[kind] = points
+
+    return {
+        "dataset": str(path),
+        "source_rows": clean["samples"],
+        "variants_per_row": variants,
+        "seed": seed,
+        "samples": aggregate.samples,
+        "clean": clean,
+        "curves": curves,
+    }
+
+
+def write_expanded(
+    path: Path,
+    output: Path,
+    *,
+    variants: int = DEFAULT_VARIANTS,
+    kinds: Iterable[str] = PERTURBATION_TYPES,
+    intensities: Iterable[float] = DEFAULT_INTENSITIES,
+    seed: int = 0,
+) -> int:
+    written = 0
+    with open(output, "w", encoding="utf-8") as handle:
+        for row in expand_rows(iter_rows(path), variants=variants, kinds=kinds, intensities=intensities, seed=seed):
+            handle.write(json.dumps(row) + "\n")
+            written += 1
+    return written
+
+
+def _csv(value: str | None) -> list[str]:
+    return [item.strip() for item in (value or "").split(",") if item.strip()]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="ATLAS ASR-noise robustness evaluation")
+    parser.add_argument("--dataset", default="data/gold/v0_slice.jsonl")
+    parser.add_argument("--variants", type=int, default=DEFAULT_VARIANTS, help="Noisy variants per row, type and intensity")
+    parser.add_argument("--types", default=None, help=f"Comma-separated perturbation types ({', '.join(PERTURBATION_TYPES)})")
+    parser.add_argument("--intensities", default=None, help="Comma-separated fractions of eligible tokens to perturb")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--disable-hybrid", action="store_true")
+    parser.add_argument("--output-jsonl", default=None, help="Write the expanded rows instead of evaluating them")
+    args = parser.parse_args()
+
+    options = {
+        "variants": args.variants,
+        "kinds": _csv(args.types) or PERTURBATION_TYPES,
+        "intensities": [float(value) for value in _csv(args.intensities)] or DEFAULT_INTENSITIES,
+        "seed": args.seed,
+    }
+    if args.output_jsonl:
+        written = write_expanded(Path(args.dataset), Path(args.output_jsonl), **options)
+        print(json.dumps({"output": args.output_jsonl, "rows": written}))
+        return
+
+    report = evaluate_robustness(
+        Path(args.dataset),
+        enable_hybrid=not args.disable_hybrid,
+        workers=args.workers,
+        **options,
+    )
+    print(json.dumps(report, indent=2, sort_keys=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
+
 from atlas.disambiguate import hybrid_disambiguate_segment
-from atlas.models import ParseResult
+from atlas.models import Instruction, ParseResult
 from atlas.normalize import normalize_callsign, normalize_text
 from atlas.observability import build_parse_trace
 from atlas.parse import parse_instruction
@@ -10,22 +12,28 @@ from atlas.trace_log import append_trace_jsonl
 from atlas.validate import apply_confidence_policy, confidence_tier, detect_conflict, score_confidence
 
 
-def parse_utterance(
+@dataclass(frozen=True, slots=True)
+class PreparedUtterance:
+    """Pipeline state up to (not including) disambiguation; shared across variants."""
+
+    text: str
+    speaker: str
+    utterance_id: str | None
+    normalized: str
+    callsign: str | None
+    correction_mode: bool
+    segments: list[str]
+    parsed_by_segment: list[list[Instruction]]
+    explicit_altitude_context: bool
+
+
+def prepare_utterance(
     text: str,
     speaker: str = "ATC",
     utterance_id: str | None = None,
-    enable_hybrid: bool = True,
-    include_trace: bool = False,
-    trace_log_path: str | None = None,
-) -> dict:
-    result = ParseResult(utterance_id=utterance_id, speaker=speaker)
-
+) -> PreparedUtterance:
     normalized = normalize_text(text)
-    result.callsign = normalize_callsign(normalized)
     correction_mode = "CORRECTION" in normalized
-    if correction_mode:
-        result.notes.append("amendment_detected")
-
     segments = split_instructions(normalized)
     parsed_by_segment = [parse_instruction(segment, correction_mode=correction_mode) for segment in segments]
 
@@ -35,6 +43,55 @@ def parse_utterance(
         for instr in segment_items
     )
 
+    return PreparedUtterance(
+        text=text,
+        speaker=speaker,
+        utterance_id=utterance_id,
+        normalized=normalized,
+        callsign=normalize_callsign(normalized),
+        correction_mode=correction_mode,
+        segments=segments,
+        parsed_by_segment=parsed_by_segment,
+        explicit_altitude_context=explicit_altitude_context,
+    )
+
+
+def parse_utterance(
+    text: str,
+    speaker: str = "ATC",
+    utterance_id: str | None = None,
+    enable_hybrid: bool = True,
+    include_trace: bool = False,
+    trace_log_path: str | None = None,
+) -> dict:
+    return finalize_utterance(
+        prepare_utterance(text, speaker=speaker, utterance_id=utterance_id),
+        enable_hybrid=enable_hybrid,
+        include_trace=include_trace,
+        trace_log_path=trace_log_path,
+    )
+
+
+def finalize_utterance(
+    prepared: PreparedUtterance,
+    *,
+    enable_hybrid: bool = True,
+    include_trace: bool = False,
+    trace_log_path: str | None = None,
+) -> dict:
+    text = prepared.text
+    speaker = prepared.speaker
+    utterance_id = prepared.utterance_id
+    normalized = prepared.normalized
+    correction_mode = prepared.correction_mode
+    segments = prepared.segments
+    parsed_by_segment = prepared.parsed_by_segment
+
+    result = ParseResult(utterance_id=utterance_id, speaker=speaker)
+    result.callsign = prepared.callsign
+    if correction_mode:
+        result.notes.append("amendment_detected")
+
     instructions = []
     for segment, segment_items in zip(segments, parsed_by_segment, strict=True):
         if not enable_hybrid:
@@ -45,7 +102,7 @@ def parse_utterance(
             segment,
             segment_items,
             correction_mode=correction_mode,
-            explicit_altitude_context=explicit_altitude_context,
+            explicit_altitude_context=prepared.explicit_altitude_context,
         )
         instructions.extend(resolved_items)
         result.notes.extend(hybrid_notes)
@@ -90,6 +147,7 @@ def parse_utterance(
                     "confidence": output.get("confidence"),
                     "confidence_tier": output.get("confidence_tier"),
                     "callsign": output.get("callsign"),
+                    "instructions": output.get("instructions", []),
                     "notes": output.get("notes", []),
                     "trace": trace_payload,
                 },
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+from functools import lru_cache
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+from atlas import disambiguate, models, normalize, parse, pipeline, segment, validate
+
+# Modules whose source determines `parse_utterance` output.
+PIPELINE_MODULES: tuple[ModuleType, ...] = (models, normalize, segment, parse, disambiguate, validate, pipeline)
+
+
+@lru_cache(maxsize=1)
+def _pipeline_source_digest() -> str:
+    digest = hashlib.sha256()
+    for module in PIPELINE_MODULES:
+        digest.update(module.__name__.encode("utf-8"))
+        digest.update(Path(str(module.__file__)).read_bytes())
+    return digest.hexdigest()
+
+
+def parser_fingerprint() -> str:
+    # Tables are hashed on every call because callers may patch them at runtime.
+    tables = {
+        "phrase_replacements": normalize.PHRASE_REPLACEMENTS,
+        "airline_aliases": normalize.AIRLINE_ALIASES,
+        "spoken_digits": normalize.SPOKEN_DIGITS,
+        "confidence_policy": validate.CONFIDENCE_POLICY,
+    }
+    digest = hashlib.sha256(_pipeline_source_digest().encode("utf-8"))
+    digest.update(json.dumps(tables, sort_keys=True).encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+def row_key(row: dict[str, Any], variant: str, fingerprint: str) -> str:
+    # Only parse inputs are hashed, so relabelling `expected` keeps cached predictions valid.
+    inputs = {
+        "utterance": row.get("utterance"),
+        "speaker": row.get("speaker", "ATC"),
+        "id": row.get("id"),
+        "variant": variant,
+    }
+    payload = fingerprint + json.dumps(inputs, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class PredictionCache:
+    def __init__(self, path: str | Path, fingerprint: str | None = None) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.fingerprint = fingerprint or parser_fingerprint()
+        self._conn = sqlite3.connect(self.path, timeout=30.0)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS predictions (key TEXT PRIMARY KEY, fingerprint TEXT NOT NULL, payload TEXT NOT NULL)"
+        )
+        self._pending: list[tuple[str, str, str]] = []
+
+    def get(self, row: dict[str, Any], variant: str) -> dict[str, Any] | None:
+        found = self._conn.execute(
+            "SELECT payload FROM predictions WHERE key = ?",
+            (row_key(row, variant, self.fingerprint),),
+        ).fetchone()
+        return json.loads(found[0]) if found else None
+
+    def put(self, row: dict[str, Any], variant: str, predicted: dict[str, Any]) -> None:
+        self._pending.append((row_key(row, variant, self.fingerprint), self.fingerprint, json.dumps(predicted)))
+        if len(self._pending) >= 500:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._pending:
+            return
+        with self._conn:
+            self._conn.executemany("INSERT OR REPLACE INTO predictions VALUES (?, ?, ?)", self._pending)
+        self._pending.clear()
+
+    def prune_stale(self) -> int:
+        self.flush()
+        with self._conn:
+            cursor = self._conn.execute("DELETE FROM predictions WHERE fingerprint != ?", (self.fingerprint,))
+        return cursor.rowcount
+
+    def close(self) -> None:
+        self.flush()
+        self._conn.close()
+
+    def __enter__(self) -> PredictionCache:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
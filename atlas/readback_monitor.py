@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import heapq
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from atlas.evaluate import readback_result, slot_key
+from atlas.pipeline import parse_utterance
+from atlas.sequence import SequenceState, parse_turn_with_state
+
+DEFAULT_READBACK_TIMEOUT = 10.0
+
+
+@dataclass(slots=True)
+class PendingReadback:
+    callsign: str
+    # Unacknowledged slot keys by instruction type; a newer clearance replaces a type, like the sequence state.
+    slots: dict[str, list[tuple[Any, ...]]]
+    clearance: str
+    utterance_id: str | None
+    issued_at: float
+    deadline: float
+    attempts: int = 0
+    last_readback: str | None = None
+    last_comparison: dict[str, Any] | None = None
+
+    def slot_counter(self) -> Counter[tuple[Any, ...]]:
+        return Counter(key for keys in self.slots.values() for key in keys)
+
+
+@dataclass(slots=True)
+class ReadbackMonitor:
+    """Pair interleaved PILOT readbacks with pending ATC clearances on one frequency.
+
+    ATC turns run through `parse_turn_with_state`, so `state` tracks active
+    clearances as usual, and leave a pending readback per callsign. A PILOT turn
+    is compared with its callsign's pending clearance: a full readback confirms
+    and evicts it; a mismatching one is kept as the latest attempt. Clearances
+    still pending after `timeout` seconds raise `readback_mismatch` (if a wrong
+    readback was heard) or `readback_missing`.
+
+    Readback windows run on the transmission `timestamp`, or on `clock` when a
+    turn has none. Only explicit timestamps reach `state`, so its validity
+    intervals never mix caller time with the monitor's clock. Explicit
+    timestamps, ATC or PILOT, must not go backwards.
+    """
+
+    timeout: float = DEFAULT_READBACK_TIMEOUT
+    clock: Callable[[], float] = time.monotonic
+    state: SequenceState = field(default_factory=SequenceState)
+    pending: dict[str, PendingReadback] = field(default_factory=dict)
+    # Min-heap of (deadline, callsign); entries whose deadline moved on are stale.
+    deadlines: list[tuple[float, str]] = field(default_factory=list)
+    last_issued: str | None = None
+    last_timestamp: float | None = None
+
+    def __post_init__(self) -> None:
+        if self.timeout <= 0:
+            raise ValueError("timeout must be positive")
+
+    def __len__(self) -> int:
+        return len(self.pending)
+
+    def _emit(self, events: list[dict[str, Any]], kind: str, entry: PendingReadback, at: float) -> None:
+        event = {
+            "event": kind,
+            "callsign": entry.callsign,
+            "slot_type": None,
+            "clearance": entry.clearance,
+            "clearance_id": entry.utterance_id,
+            "issued_at": entry.issued_at,
+            "at": at,
+            "attempts": entry.attempts,
+            "readback": entry.last_readback,
+            "comparison": entry.last_comparison,
+        }
+        events.append(event)
+        if self.state.subscriptions is not None:
+            self.state.subscriptions.dispatch_event(event)
+
+    def expire(self, timestamp: float) -> list[dict[str, Any]]:
+        """Raise events for clearances whose readback window closed at or before `timestamp`."""
+        events: list[dict[str, Any]] = []
+        queue = self.deadlines
+        while queue and queue[0][0] <= timestamp:
+            deadline, callsign = heapq.heappop(queue)
+            entry = self.pending.get(callsign)
+            if entry is None or entry.deadline != deadline:
+                continue
+            del self.pending[callsign]
+            kind = "readback_mismatch" if entry.last_comparison is not None else "readback_missing"
+            self._emit(events, kind, entry, deadline)
+        return events
+
+    def _issue(self, result: dict[str, Any], text: str, timestamp: float) -> None:
+        callsign = result.get("callsign")
+        instructions = result.get("instructions", [])
+        if not callsign or not instructions:
+            return
+        slots: dict[str, list[tuple[Any, ...]]] = {}
+        for item in instructions:
+            slots.setdefault(item["type"], []).append(slot_key(item))
+
+        entry = self.pending.get(callsign)
+        deadline = timestamp + self.timeout
+        if entry is None:
+            self.pending[callsign] = PendingReadback(
+                callsign=callsign,
+                slots=slots,
+                clearance=text,
+                utterance_id=result.get("utterance_id"),
+                issued_at=timestamp,
+                deadline=deadline,
+            )
+        else:
+            # Follow-up clearances before a good readback fold into the pending one.
+            entry.slots.update(slots)
+            entry.clearance = f"{entry.clearance} / {text}"
+            entry.deadline = deadline
+        heapq.heappush(self.deadlines, (deadline, callsign))
+        self.last_issued = callsign
+
+    def _readback(self, result: dict[str, Any], text: str, timestamp: float, events: list[dict[str, Any]]) -> None:
+        instructions = result.get("instructions", [])
+        if not instructions:
+            # "Roger"/"wilco" style acknowledgements are not readbacks.
+            return
+        callsign = result.get("callsign")
+        # Readbacks without a callsign answer the latest clearance on frequency, if it is still open.
+        entry = self.pending.get(callsign or self.last_issued or "")
+        if entry is None:
+            return
+
+        comparison = readback_result(
+            (entry.callsign, entry.slot_counter()),
+            (callsign, Counter(slot_key(item) for item in instructions)),
+        )
+        entry.attempts += 1
+        entry.last_readback = text
+        entry.last_comparison = comparison
+        if comparison["mismatch_detected"]:
+            return
+        del self.pending[entry.callsign]
+        self._emit(events, "readback_confirmed", entry, timestamp)
+
+    def observe(
+        self,
+        text: str,
+        *,
+        speaker: str = "ATC",
+        timestamp: float | None = None,
+        utterance_id: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Process one transmission and return the readback events it caused."""
+        if timestamp is not None:
+            if self.last_timestamp is not None and timestamp < self.last_timestamp:
+                raise ValueError(f"timestamp {timestamp} precedes previous turn at {self.last_timestamp}")
+            self.last_timestamp = timestamp
+        now = self.clock() if timestamp is None else timestamp
+        events = self.expire(now)
+        if speaker == "PILOT":
+            # Readbacks are compared, not applied: they must not overwrite controller state.
+            result = parse_utterance(text, speaker="PILOT", utterance_id=utterance_id)
+            self._readback(result, text, now, events)
+        else:
+            result = parse_turn_with_state(
+                text,
+                state=self.state,
+                speaker=speaker,
+                utterance_id=utterance_id,
+                timestamp=timestamp,
+            )
+            self._issue(result, text, now)
+        return events
@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import argparse
+import json
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterable
+
+from atlas.jsonl import iter_jsonl_lines
+from atlas.pipeline import parse_utterance
+from atlas.shadow import diff_results
+from atlas.sharding import run_sharded
+
+MAX_REPLAY_EXAMPLES = 50
+REPLAY_FIELDS: tuple[str, ...] = ("status", "callsign", "instructions", "confidence", "confidence_tier", "notes")
+
+
+def _instruction_rule(item: dict[str, Any]) -> str:
+    # The rule that produced the instruction; records without a trace fall back to its type.
+    trace = item.get("trace")
+    if isinstance(trace, dict) and trace.get("rule"):
+        return str(trace["rule"])
+    return str(item.get("type"))
+
+
+def _segment_types(trace: Any) -> Counter[str]:
+    # Instruction types the rule stage extracted per segment, before hybrid disambiguation.
+    if not isinstance(trace, list):
+        return Counter()
+    return Counter(
+        str(itype)
+        for event in trace
+        if isinstance(event, dict) and event.get("stage") == "segment"
+        for itype in event.get("parsed_instruction_types", [])
+    )
+
+
+@dataclass(slots=True)
+class _ReplayAggregate:
+    """Mergeable replay counts; every counter is keyed by a small vocabulary, so memory stays flat."""
+
+    records: int = 0
+    invalid: int = 0
+    changed: int = 0
+    fields: Counter[str] = field(default_factory=Counter)
+    status_changes: Counter[str] = field(default_factory=Counter)
+    # "removed"/"added" counts per producing rule (`trace.rule`, e.g. hybrid_disambiguation) and per note.
+    rules: dict[str, Counter[str]] = field(default_factory=dict)
+    notes: dict[str, Counter[str]] = field(default_factory=dict)
+    examples: list[dict[str, Any]] = field(default_factory=list)
+    max_examples: int = MAX_REPLAY_EXAMPLES
+
+    def _count(self, table: dict[str, Counter[str]], key: str, side: str, amount: int = 1) -> None:
+        table.setdefault(key, Counter())[side] += amount
+
+    def add(self, record: dict[str, Any], replayed: dict[str, Any]) -> None:
+        recorded = {name: record[name] for name in REPLAY_FIELDS if name in record}
+        diff = {name: value for name, value in diff_results(recorded, replayed).items() if name in recorded}
+        if "instructions" not in recorded:
+            # Logs written before instructions were recorded: fall back to the rule-stage types in the trace.
+            before = _segment_types(record.get("trace"))
+            after = _segment_types(replayed.get("trace"))
+            if before != after:
+                diff["parsed_instruction_types"] = {
+                    "removed": sorted((before - after).elements()),
+                    "added": sorted((after - before).elements()),
+                }
+        if not diff:
+            return
+
+        self.changed += 1
+        self.fields.update(diff.keys())
+        if "status" in diff:
+            self.status_changes["->".join(str(value) for value in diff["status"])] += 1
+        if "instructions" in diff:
+            for side in ("removed", "added"):
+                for item in diff["instructions"][side]:
+                    self._count(self.rules, _instruction_rule(item), side)
+        elif "parsed_instruction_types" in diff:
+            for side in ("removed", "added"):
+                for itype in diff["parsed_instruction_types"][side]:
+                    self._count(self.rules, itype, side)
+        if "notes" in diff:
+            for side in ("removed", "added"):
+                for note in diff["notes"][side]:
+                    self._count(self.notes, str(note), side)
+        if len(self.examples) < self.max_examples:
+            self.examples.append({"utterance_id": record.get("utterance_id"), "text": record.get("text"), "diff": diff})
+
+    def merge(self, other: _ReplayAggregate) -> None:
+        self.records += other.records
+        self.invalid += other.invalid
+        self.changed += other.changed
+        self.fields.update(other.fields)
+        self.status_changes.update(other.status_changes)
+        for mine, theirs in ((self.rules, other.rules), (self.notes, other.notes)):
+            for key, counts in theirs.items():
+                mine.setdefault(key, Counter()).update(counts)
+        room = self.max_examples - len(self.examples)
+        self.examples.extend(other.examples[: max(room, 0)])
+
+
+def _replay_lines(lines: Iterable[tuple[int, str]], enable_hybrid: bool, max_examples: int) -> _ReplayAggregate:
+    aggregate = _ReplayAggregate(max_examples=max_examples)
+    for _line_no, line in lines:
+        aggregate.records += 1
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            aggregate.invalid += 1
+            continue
+        if not isinstance(record, dict) or not isinstance(record.get("text"), str):
+            aggregate.invalid += 1
+            continue
+        replayed = parse_utterance(
+            record["text"],
+            speaker=str(record.get("speaker") or "ATC"),
+            utterance_id=record.get("utterance_id"),
+            enable_hybrid=enable_hybrid,
+            include_trace="instructions" not in record,
+        )
+        aggregate.add(record, replayed)
+    return aggregate
+
+
+def _ranked(table: dict[str, Counter[str]]) -> dict[str, dict[str, int]]:
+    ordered = sorted(table.items(), key=lambda item: (-sum(item[1].values()), item[0]))
+    return {key: {"removed": counts["removed"], "added": counts["added"]} for key, counts in ordered}
+
+
+def replay_trace_log(
+    path: Path,
+    *,
+    workers: int = 1,
+    shard_size: int = 1000,
+    enable_hybrid: bool = True,
+    max_examples: int = MAX_REPLAY_EXAMPLES,
+) -> dict[str, Any]:
+    """Re-parse every `append_trace_jsonl` record and diff the current output against the recorded one.
+
+    The log is streamed line by line and sharded across `workers`, so memory is
+    bounded by the shard window, not the log size. Gzipped logs are read as-is.
+    """
+    aggregate = run_sharded(
+        iter_jsonl_lines(path),
+        _replay_lines,
+        (enable_hybrid, max_examples),
+        _ReplayAggregate(max_examples=max_examples),
+        workers=workers,
+        shard_size=shard_size,
+    )
+    replayed = aggregate.records - aggregate.invalid
+    return {
+        "log": str(path),
+        "records": aggregate.records,
+        "replayed": replayed,
+        "invalid": aggregate.invalid,
+        "changed": aggregate.changed,
+        "changed_rate": round(aggregate.changed / replayed, 4) if replayed else 0.0,
+        "fields": dict(aggregate.fields.most_common()),
+        "status_changes": dict(aggregate.status_changes.most_common()),
+        "rules": _ranked(aggregate.rules),
+        "notes": _ranked(aggregate.notes),
+        "examples": aggregate.examples,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Replay ATLAS trace logs through the current parser and diff outputs")
+    parser.add_argument("--log", required=True, help="JSONL (or gzipped JSONL) trace log written by --trace-log")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--shard-size", type=int, default=1000)
+    parser.add_argument("--disable-hybrid", action="store_true")
+    parser.add_argument("--max-examples", type=int, default=MAX_REPLAY_EXAMPLES, help="Differing records to include")
+    args = parser.parse_args()
+
+    report = replay_trace_log(
+        Path(args.log),
+        workers=args.workers,
+        shard_size=args.shard_size,
+        enable_hybrid=not args.disable_hybrid,
+        max_examples=args.max_examples,
+    )
+    print(json.dumps(report, indent=2, sort_keys=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,261 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sqlite3
+import statistics
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from atlas.prediction_cache import parser_fingerprint
+
+DEFAULT_HISTORY_PATH = "reports/run_history.sqlite"
+DEFAULT_TREND_LIMIT = 200
+DEFAULT_BASELINE_WINDOW = 20
+
+# Headline metric -> report paths to try in order (evaluators nest the same figure differently).
+HEADLINE_METRICS: dict[str, tuple[tuple[str, ...], ...]] = {
+    "samples": (("samples",),),
+    "intent_f1": (("intent", "f1"),),
+    "slot_f1": (("slot", "f1"),),
+    "status_accuracy": (("status_accuracy",),),
+    "callsign_accuracy": (("callsign_accuracy",),),
+    "weighted_error_per_sample": (("severity_weighted_error", "weighted_error_per_sample"),),
+    "ece": (("calibration", "ece"),),
+    "brier_score": (("calibration", "brier_score"),),
+    "readback_f1": (("readback_mismatch", "f1"),),
+    "readback_accuracy": (("readback_mismatch", "accuracy"),),
+    "turns": (("turns",),),
+    "turn_accuracy": (("turn_accuracy",),),
+    "final_state_accuracy": (("final_state_accuracy",),),
+    "violation_rate": (("safety", "policy_conformance", "violation_rate"),),
+    "total_violations": (("safety", "policy_conformance", "total_violations"),),
+    "blocking_status_rate": (("safety", "fallback_behavior", "blocking_status_rate"),),
+    "non_ok_detection_recall": (("safety", "failure_mode_detection", "non_ok_detection_recall"),),
+    "hybrid_slot_f1_delta": (("hybrid_compare", "delta", "slot_f1"), ("delta", "slot_f1")),
+    "hybrid_intent_f1_delta": (("hybrid_compare", "delta", "intent_f1"), ("delta", "intent_f1")),
+}
+
+_SCHEMA = (
+    """CREATE TABLE IF NOT EXISTS runs (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        recorded_at TEXT NOT NULL,
+        kind TEXT NOT NULL,
+        dataset TEXT NOT NULL,
+        label TEXT NOT NULL,
+        parser_fingerprint TEXT NOT NULL,
+        report TEXT NOT NULL
+    )""",
+    # Dataset, label and time are copied onto each metric row so trend queries read one index.
+    """CREATE TABLE IF NOT EXISTS metrics (
+        run_id INTEGER NOT NULL REFERENCES runs(id),
+        name TEXT NOT NULL,
+        dataset TEXT NOT NULL,
+        label TEXT NOT NULL,
+        recorded_at TEXT NOT NULL,
+        value REAL NOT NULL
+    )""",
+    "CREATE INDEX IF NOT EXISTS metrics_by_series ON metrics (name, dataset, label, recorded_at, run_id, value)",
+    "CREATE INDEX IF NOT EXISTS metrics_by_time ON metrics (name, recorded_at, run_id)",
+    "CREATE INDEX IF NOT EXISTS runs_by_time ON runs (recorded_at)",
+)
+
+
+def headline_metrics(report: dict[str, Any]) -> dict[str, float]:
+    metrics: dict[str, float] = {}
+    for name, paths in HEADLINE_METRICS.items():
+        for path in paths:
+            value: Any = report
+            for key in path:
+                value = value.get(key) if isinstance(value, dict) else None
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                metrics[name] = float(value)
+                break
+    return metrics
+
+
+def _utc_now() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+class RunHistory:
+    """Append-only SQLite store of evaluation and safety-review runs."""
+
+    def __init__(self, path: str | Path = DEFAULT_HISTORY_PATH) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, timeout=30.0)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        with self._conn:
+            for statement in _SCHEMA:
+                self._conn.execute(statement)
+
+    def record(
+        self,
+        report: dict[str, Any],
+        *,
+        kind: str,
+        label: str,
+        recorded_at: str | None = None,
+        extra_metrics: dict[str, float] | None = None,
+    ) -> int:
+        """Store `report` and its headline metrics; returns the run id."""
+        at = recorded_at or _utc_now()
+        dataset = str(report.get("dataset", ""))
+        metrics = {**headline_metrics(report), **(extra_metrics or {})}
+        with self._conn:
+            cursor = self._conn.execute(
+                "INSERT INTO runs (recorded_at, kind, dataset, label, parser_fingerprint, report) VALUES (?, ?, ?, ?, ?, ?)",
+                (at, kind, dataset, label, parser_fingerprint(), json.dumps(report, separators=(",", ":"))),
+            )
+            run_id = int(cursor.lastrowid or 0)
+            self._conn.executemany(
+                "INSERT INTO metrics VALUES (?, ?, ?, ?, ?, ?)",
+                [(run_id, name, dataset, label, at, float(value)) for name, value in metrics.items()],
+            )
+        return run_id
+
+    def _series(
+        self,
+        metric: str,
+        dataset: str | None,
+        label: str | None,
+        limit: int,
+        since: str | None = None,
+    ) -> list[dict[str, Any]]:
+        clauses = ["name = ?"]
+        params: list[Any] = [metric]
+        for column, value in (("dataset", dataset), ("label", label)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if since is not None:
+            clauses.append("recorded_at >= ?")
+            params.append(since)
+        rows = self._conn.execute(
+            f"SELECT run_id, recorded_at, dataset, label, value FROM metrics WHERE {' AND '.join(clauses)} "
+            "ORDER BY recorded_at DESC, run_id DESC LIMIT ?",
+            (*params, limit),
+        ).fetchall()
+        return [
+            {"run_id": run_id, "recorded_at": at, "dataset": ds, "label": lb, "value": value}
+            for run_id, at, ds, lb, value in reversed(rows)
+        ]
+
+    def trend(
+        self,
+        metric: str,
+        *,
+        dataset: str | None = None,
+        label: str | None = None,
+        limit: int = DEFAULT_TREND_LIMIT,
+        since: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Last `limit` values of `metric`, oldest first."""
+        if limit < 1:
+            raise ValueError("limit must be at least 1")
+        return self._series(metric, dataset, label, limit, since)
+
+    def baseline(
+        self,
+        metric: str,
+        *,
+        dataset: str | None = None,
+        label: str | None = None,
+        window: int = DEFAULT_BASELINE_WINDOW,
+    ) -> dict[str, Any]:
+        """Compare the latest run of `metric` with the `window` runs before it."""
+        if window < 1:
+            raise ValueError("window must be at least 1")
+        series = self._series(metric, dataset, label, window + 1)
+        latest = series[-1] if series else None
+        values = [point["value"] for point in series[:-1]]
+        result: dict[str, Any] = {
+            "metric": metric,
+            "dataset": dataset,
+            "label": label,
+            "window": window,
+            "runs": len(values),
+            "latest": latest,
+        }
+        if values:
+            mean = statistics.fmean(values)
+            result.update(
+                {
+                    "mean": round(mean, 4),
+                    "median": round(statistics.median(values), 4),
+                    "min": min(values),
+                    "max": max(values),
+                    "stdev": round(statistics.stdev(values), 4) if len(values) > 1 else 0.0,
+                    "delta": round(latest["value"] - mean, 4) if latest else None,
+                }
+            )
+        return result
+
+    def runs(self, *, limit: int = 20) -> list[dict[str, Any]]:
+        rows = self._conn.execute(
+            "SELECT id, recorded_at, kind, dataset, label, parser_fingerprint FROM runs ORDER BY recorded_at DESC, id DESC LIMIT ?",
+            (limit,),
+        ).fetchall()
+        return [
+            {"run_id": run_id, "recorded_at": at, "kind": kind, "dataset": ds, "label": lb, "parser_fingerprint": fp}
+            for run_id, at, kind, ds, lb, fp in rows
+        ]
+
+    def report(self, run_id: int) -> dict[str, Any] | None:
+        found = self._conn.execute("SELECT report FROM runs WHERE id = ?", (run_id,)).fetchone()
+        return json.loads(found[0]) if found else None
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> RunHistory:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+def record_run(report: dict[str, Any], path: str | Path, *, kind: str, label: str, **kwargs: Any) -> dict[str, Any]:
+    with RunHistory(path) as history:
+        run_id = history.record(report, kind=kind, label=label, **kwargs)
+    return {"path": str(path), "run_id": run_id}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Query the ATLAS evaluation run history")
+    parser.add_argument("--history", default=DEFAULT_HISTORY_PATH, help="Run-history SQLite file")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    trend = commands.add_parser("trend", help="Values of one metric over recent runs, oldest first")
+    baseline = commands.add_parser("baseline", help="Latest value of a metric against a rolling baseline")
+    for sub in (trend, baseline):
+        sub.add_argument("--metric", required=True, help=f"Headline metric ({', '.join(HEADLINE_METRICS)})")
+        sub.add_argument("--dataset", default=None)
+        sub.add_argument("--label", default=None)
+    trend.add_argument("--limit", type=int, default=DEFAULT_TREND_LIMIT)
+    trend.add_argument("--since", default=None, help="ISO-8601 UTC lower bound, e.g. 2026-01-01")
+    baseline.add_argument("--window", type=int, default=DEFAULT_BASELINE_WINDOW, help="Runs before the latest one")
+    runs = commands.add_parser("runs", help="Most recent runs")
+    runs.add_argument("--limit", type=int, default=20)
+    show = commands.add_parser("show", help="Full stored report of one run")
+    show.add_argument("run_id", type=int)
+    args = parser.parse_args()
+
+    with RunHistory(args.history) as history:
+        if args.command == "trend":
+            output: Any = history.trend(
+                args.metric, dataset=args.dataset, label=args.label, limit=args.limit, since=args.since
+            )
+        elif args.command == "baseline":
+            output = history.baseline(args.metric, dataset=args.dataset, label=args.label, window=args.window)
+        elif args.command == "runs":
+            output = history.runs(limit=args.limit)
+        else:
+            output = history.report(args.run_id)
+    print(json.dumps(output, indent=2, sort_keys=False))
+
+
+if __name__ == "__main__":
+    main()
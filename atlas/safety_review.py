@@ -2,10 +2,18 @@ from __future__ import annotations
 
 import argparse
 import json
+import math
 from pathlib import Path
 from typing import Any
 
+from atlas.bootstrap import DEFAULT_BOOTSTRAP_RESAMPLES, DEFAULT_CONFIDENCE_LEVEL, resample_backend
 from atlas.evaluate import evaluate_safety_dataset
+from atlas.run_history import DEFAULT_HISTORY_PATH, record_run
+
+# "point" gates on point estimates; the others gate on confidence interval bounds.
+# "pessimistic" uses the worse bound (fails unless the whole interval passes) and
+# "optimistic" the better one (fails only when the whole interval breaches).
+GATE_BOUNDS: tuple[str, ...] = ("point", "pessimistic", "optimistic")
 
 
 def _load_baseline(path: Path) -> dict[str, Any]:
@@ -25,6 +33,44 @@ def _load_baseline(path: Path) -> dict[str, Any]:
     return payload
 
 
+def _gated_value(
+    safety: dict[str, Any],
+    metric: str,
+    point: float,
+    gate_bound: str,
+    higher_is_better: bool,
+) -> float:
+    if gate_bound == "point":
+        return point
+    bounds = safety["confidence_intervals"]["metrics"][metric]
+    use_lower = (gate_bound == "pessimistic") == higher_is_better
+    return float(bounds["lower"] if use_lower else bounds["upper"])
+
+
+def _check_precomputed(
+    report: dict[str, Any], dataset: Path, min_operational_threshold: float, gate_bound: str
+) -> None:
+    # The gate must judge the dataset, threshold and intervals the caller asked for,
+    # not whatever the report was built with.
+    if "safety" not in report:
+        raise ValueError("report is missing the safety section")
+    if Path(str(report.get("dataset"))) != Path(dataset):
+        raise ValueError(f"report was computed for {report.get('dataset')}, not {dataset}")
+    threshold = report["safety"].get("policy_conformance", {}).get("min_operational_threshold")
+    if not isinstance(threshold, (int, float)) or not math.isclose(threshold, min_operational_threshold):
+        raise ValueError(
+            f"report min_operational_threshold {threshold} does not match requested {min_operational_threshold}"
+        )
+    if gate_bound == "point":
+        return
+    intervals = report["safety"].get("confidence_intervals")
+    if intervals is None:
+        raise ValueError("report is missing safety confidence intervals required for interval gating")
+    # NumPy and pure-Python resampling give different bounds for the same seed.
+    if intervals.get("backend") != resample_backend():
+        raise ValueError(f"report intervals were resampled with {intervals.get('backend')}, not {resample_backend()}")
+
+
 def run_safety_review(
     *,
     dataset: Path,
@@ -34,8 +80,28 @@ def run_safety_review(
     max_blocking_status_rate: float | None = None,
     baseline_path: Path | None = None,
     max_blocking_rate_delta: float | None = None,
+    report: dict[str, Any] | None = None,
+    gate_bound: str = "point",
+    bootstrap: int = 0,
+    confidence_level: float = DEFAULT_CONFIDENCE_LEVEL,
+    bootstrap_seed: int = 0,
 ) -> tuple[dict, bool, list[str]]:
-    report = evaluate_safety_dataset(dataset, min_operational_threshold=min_operational_threshold)
+    if gate_bound not in GATE_BOUNDS:
+        raise ValueError(f"gate_bound must be one of: {', '.join(GATE_BOUNDS)}")
+    if gate_bound != "point" and not bootstrap:
+        bootstrap = DEFAULT_BOOTSTRAP_RESAMPLES
+
+    # A precomputed report (e.g. from `evaluate_run`) skips re-parsing the dataset.
+    if report is None:
+        report = evaluate_safety_dataset(
+            dataset,
+            min_operational_threshold=min_operational_threshold,
+            bootstrap=bootstrap,
+            confidence_level=confidence_level,
+            bootstrap_seed=bootstrap_seed,
+        )
+    else:
+        _check_precomputed(report, dataset, min_operational_threshold, gate_bound)
     safety = report["safety"]
     conformance = safety["policy_conformance"]
     failure = safety["failure_mode_detection"]
@@ -45,14 +111,18 @@ def run_safety_review(
     recall = float(failure["non_ok_detection_recall"])
     blocking_rate = float(fallback["blocking_status_rate"])
 
+    gated_recall = _gated_value(safety, "non_ok_detection_recall", recall, gate_bound, higher_is_better=True)
+    gated_blocking = _gated_value(safety, "blocking_status_rate", blocking_rate, gate_bound, higher_is_better=False)
+    suffix = "" if gate_bound == "point" else f" ({gate_bound} bound)"
+
     reasons: list[str] = []
     if violations > max_violations:
         reasons.append(f"violations {violations} exceed max_violations {max_violations}")
-    if recall < min_non_ok_recall:
-        reasons.append(f"non_ok_detection_recall {recall} below min_non_ok_recall {min_non_ok_recall}")
-    if max_blocking_status_rate is not None and blocking_rate > max_blocking_status_rate:
+    if gated_recall < min_non_ok_recall:
+        reasons.append(f"non_ok_detection_recall {gated_recall}{suffix} below min_non_ok_recall {min_non_ok_recall}")
+    if max_blocking_status_rate is not None and gated_blocking > max_blocking_status_rate:
         reasons.append(
-            f"blocking_status_rate {blocking_rate} exceeds max_blocking_status_rate {max_blocking_status_rate}"
+            f"blocking_status_rate {gated_blocking}{suffix} exceeds max_blocking_status_rate {max_blocking_status_rate}"
         )
 
     baseline_used: dict[str, Any] | None = None
@@ -66,9 +136,10 @@ def run_safety_review(
                 "current_blocking_status_rate": blocking_rate,
                 "delta_blocking_status_rate": round(delta, 4),
             }
-            if max_blocking_rate_delta is not None and delta > max_blocking_rate_delta:
+            gated_delta = gated_blocking - baseline_blocking
+            if max_blocking_rate_delta is not None and gated_delta > max_blocking_rate_delta:
                 reasons.append(
-                    f"blocking_status_rate delta {round(delta,4)} exceeds max_blocking_rate_delta {max_blocking_rate_delta}"
+                    f"blocking_status_rate delta {round(gated_delta,4)}{suffix} exceeds max_blocking_rate_delta {max_blocking_rate_delta}"
                 )
         except (OSError, json.JSONDecodeError, ValueError, TypeError) as exc:
             reasons.append(f"invalid baseline_safety_json: {exc}")
@@ -85,8 +156,33 @@ def main() -> None:
     parser.add_argument("--max-blocking-status-rate", type=float, default=None)
     parser.add_argument("--baseline-safety-json", default=None)
     parser.add_argument("--max-blocking-rate-delta", type=float, default=None)
+    parser.add_argument(
+        "--report-json",
+        default=None,
+        help="Gate an existing evaluation report with a safety section instead of re-parsing the dataset",
+    )
+    parser.add_argument(
+        "--gate-bound",
+        choices=GATE_BOUNDS,
+        default="point",
+        help="Gate on point estimates or on bootstrap confidence interval bounds",
+    )
+    parser.add_argument("--bootstrap", type=int, default=0, help="Bootstrap resamples for confidence intervals")
+    parser.add_argument("--confidence-level", type=float, default=DEFAULT_CONFIDENCE_LEVEL)
+    parser.add_argument("--bootstrap-seed", type=int, default=0)
+    parser.add_argument(
+        "--history",
+        default=None,
+        metavar="PATH",
+        help=f"Append this review to a run-history SQLite file (e.g. {DEFAULT_HISTORY_PATH})",
+    )
+    parser.add_argument("--history-label", default="safety_review", help="Label for this review in the run history")
     args = parser.parse_args()
 
+    precomputed = None
+    if args.report_json:
+        precomputed = json.loads(Path(args.report_json).read_text(encoding="utf-8"))
+
     report, passed, reasons = run_safety_review(
         dataset=Path(args.dataset),
         min_non_ok_recall=args.min_non_ok_recall,
@@ -95,6 +191,11 @@ def main() -> None:
         max_blocking_status_rate=args.max_blocking_status_rate,
         baseline_path=Path(args.baseline_safety_json) if args.baseline_safety_json else None,
         max_blocking_rate_delta=args.max_blocking_rate_delta,
+        report=precomputed,
+        gate_bound=args.gate_bound,
+        bootstrap=args.bootstrap,
+        confidence_level=args.confidence_level,
+        bootstrap_seed=args.bootstrap_seed,
     )
 
     output = {
@@ -108,8 +209,17 @@ def main() -> None:
             "max_blocking_status_rate": args.max_blocking_status_rate,
             "baseline_safety_json": args.baseline_safety_json,
             "max_blocking_rate_delta": args.max_blocking_rate_delta,
+            "gate_bound": args.gate_bound,
         },
     }
+    if args.history:
+        output["run_history"] = record_run(
+            report,
+            args.history,
+            kind="safety_review",
+            label=args.history_label,
+            extra_metrics={"passed": float(passed)},
+        )
     print(json.dumps(output, indent=2, sort_keys=False))
 
     if not passed:
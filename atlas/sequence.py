@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import heapq
 import re
+from bisect import bisect_right
 from dataclasses import dataclass, field
 
 from atlas.normalize import normalize_text
 from atlas.pipeline import parse_utterance
+from atlas.subscriptions import SubscriptionRegistry
 from atlas.validate import confidence_tier
 
 CANCEL_TYPE_PATTERNS: list[tuple[re.Pattern[str], str]] = [
@@ -19,12 +22,41 @@ CANCEL_TYPE_PATTERNS: list[tuple[re.Pattern[str], str]] = [
     (re.compile(r"\bCANCEL\s+RUNWAY\b"), "runway"),
 ]
 
+# Pilot position reports that satisfy fix-keyed temporal conditions.
+FIX_REPORT_PATTERN = re.compile(r"\b(?:OVER|PASSING|ABEAM)\s+([A-Z]{2,6})\b")
+# Phraseology words that follow OVER/PASSING/ABEAM/UNTIL/AFTER but never name a fix
+# ("passing flight level 180", "until the runway").
+NON_FIX_WORDS = frozenset(
+    "FLIGHT LEVEL ALTITUDE HEADING SPEED RUNWAY FEET KNOTS THE AND THEN NOW FIX POSITION WAYPOINT "
+    "TOWER GROUND APPROACH DEPARTURE CENTER FURTHER ADVISED".split()
+)
+
+# Slot types checked for duplicate assignments across different callsigns.
+CROSS_AIRCRAFT_SLOT_TYPES: tuple[str, ...] = ("altitude", "squawk", "frequency")
+
+
+@dataclass(slots=True)
+class SlotInterval:
+    start: float
+    end: float | None
+    slot: dict
+
 
 @dataclass(slots=True)
 class SequenceState:
     active_by_callsign: dict[str, dict[str, dict]] = field(default_factory=dict)
     history_by_callsign: dict[str, list[dict]] = field(default_factory=dict)
     last_callsign: str | None = None
+    subscriptions: SubscriptionRegistry | None = None
+    # Seconds a slot stays valid after it is set, keyed by instruction type.
+    expiry_rules: dict[str, float] = field(default_factory=dict)
+    last_timestamp: float | None = None
+    timeline_by_callsign: dict[str, dict[str, list[SlotInterval]]] = field(default_factory=dict)
+    expiry_queue: list[tuple[float, str, str, float]] = field(default_factory=list)
+    cross_aircraft_types: tuple[str, ...] = CROSS_AIRCRAFT_SLOT_TYPES
+    assignment_index: dict[tuple[str, object], set[str]] = field(default_factory=dict)
+    # (callsign, fix) -> {slot_type: "after" | "until"} for slots waiting on that fix.
+    pending_by_fix: dict[tuple[str, str], dict[str, str]] = field(default_factory=dict)
 
 
 def _extract_cancel_targets(normalized_text: str) -> list[str] | None:
@@ -58,7 +90,220 @@ def _extract_temporal_condition(normalized_text: str) -> str | None:
     return None
 
 
-def _apply_temporal_condition(result: dict, temporal_condition: str, active: dict[str, dict]) -> None:
+def _state_event(
+    event: str,
+    *,
+    callsign: str,
+    slot_type: str,
+    before: dict | None,
+    after: dict | None,
+    utterance_id: str | None,
+) -> dict:
+    return {
+        "event": event,
+        "callsign": callsign,
+        "slot_type": slot_type,
+        "before": dict(before) if before is not None else None,
+        "after": dict(after) if after is not None else None,
+        "utterance_id": utterance_id,
+    }
+
+
+def _record_timeline(state: SequenceState, events: list[dict], timestamp: float) -> None:
+    for event in events:
+        if event["event"] == "conflict_raised":
+            continue
+        intervals = state.timeline_by_callsign.setdefault(event["callsign"], {}).setdefault(event["slot_type"], [])
+        at = timestamp
+        if event["event"] == "slot_expired":
+            at = float(event["before"]["expires_at"])
+        if intervals and intervals[-1].end is None:
+            intervals[-1].end = at
+        if event["after"] is not None:
+            intervals.append(SlotInterval(start=at, end=None, slot=event["after"]))
+
+
+def _index_assignments(state: SequenceState, events: list[dict]) -> None:
+    index = state.assignment_index
+    for event in events:
+        if event["slot_type"] not in state.cross_aircraft_types:
+            continue
+        if event["event"] == "conflict_raised":
+            continue
+        before = event["before"]
+        if before is not None:
+            key = (event["slot_type"], before.get("value"))
+            owners = index.get(key)
+            if owners is not None:
+                owners.discard(event["callsign"])
+                if not owners:
+                    del index[key]
+        after = event["after"]
+        if after is not None:
+            index.setdefault((event["slot_type"], after.get("value")), set()).add(event["callsign"])
+
+
+def _split_condition(condition: str | None) -> tuple[str, str] | None:
+    if not condition:
+        return None
+    kind, _, fix = condition.partition(" ")
+    if kind not in {"after", "until"} or not fix or fix in NON_FIX_WORDS:
+        return None
+    return kind, fix
+
+
+def _indexed(state: SequenceState, slot_type: str, before: dict | None, after: dict | None) -> bool:
+    """Whether a change feeds `assignment_index` or `pending_by_fix`, which are maintained from events."""
+    return (
+        slot_type in state.cross_aircraft_types
+        or _split_condition((before or {}).get("condition")) is not None
+        or _split_condition((after or {}).get("condition")) is not None
+    )
+
+
+def _same_slot(before: dict, after: dict) -> bool:
+    return all(before.get(name) == after.get(name) for name in ("type", "action", "value", "unit", "condition"))
+
+
+def _index_pending_conditions(state: SequenceState, events: list[dict]) -> None:
+    index = state.pending_by_fix
+    for event in events:
+        if event["event"] == "conflict_raised":
+            continue
+        callsign = event["callsign"]
+        slot_type = event["slot_type"]
+        before = _split_condition((event["before"] or {}).get("condition"))
+        if before is not None:
+            key = (callsign, before[1])
+            pending = index.get(key)
+            if pending is not None:
+                pending.pop(slot_type, None)
+                if not pending:
+                    del index[key]
+        after = _split_condition((event["after"] or {}).get("condition"))
+        if after is not None:
+            index.setdefault((callsign, after[1]), {})[slot_type] = after[0]
+
+
+def _mentioned_fixes(normalized_text: str, result: dict, speaker: str) -> list[str]:
+    fixes = [str(item["value"]) for item in result.get("instructions", []) if item.get("type") == "waypoint"]
+    if speaker == "PILOT":
+        fixes.extend(fix for fix in FIX_REPORT_PATTERN.findall(normalized_text) if fix not in NON_FIX_WORDS)
+    return list(dict.fromkeys(fixes))
+
+
+def _trigger_pending_conditions(
+    state: SequenceState,
+    result: dict,
+    fixes: list[str],
+    events: list[dict],
+) -> None:
+    callsign = str(result.get("callsign"))
+    active = state.active_by_callsign.get(callsign, {})
+    for fix in fixes:
+        pending = state.pending_by_fix.pop((callsign, fix), None)
+        if not pending:
+            continue
+        for slot_type, kind in pending.items():
+            slot = active.get(slot_type)
+            # Pending entries for slots cancelled earlier in this turn are stale.
+            if slot is None or slot.get("condition") != f"{kind} {fix}":
+                continue
+            before = dict(slot)
+            if kind == "after":
+                slot["condition"] = None
+                after: dict | None = slot
+                event = "condition_activated"
+            else:
+                del active[slot_type]
+                after = None
+                event = "condition_released"
+            events.append(
+                _state_event(
+                    event,
+                    callsign=callsign,
+                    slot_type=slot_type,
+                    before=before,
+                    after=after,
+                    utterance_id=result.get("utterance_id"),
+                )
+            )
+            result["notes"].append(f"{event}:{slot_type}:{kind} {fix}")
+
+
+def callsigns_assigned(state: SequenceState, slot_type: str, value: object) -> set[str]:
+    return set(state.assignment_index.get((slot_type, value), ()))
+
+
+def _pop_expired(state: SequenceState, timestamp: float) -> list[dict]:
+    events: list[dict] = []
+    queue = state.expiry_queue
+    while queue and queue[0][0] <= timestamp:
+        expires_at, callsign, slot_type, valid_from = heapq.heappop(queue)
+        active = state.active_by_callsign.get(callsign, {})
+        slot = active.get(slot_type)
+        # Entries for slots that were replaced or cancelled since are stale.
+        if slot is None or slot.get("valid_from") != valid_from or slot.get("expires_at") != expires_at:
+            continue
+        del active[slot_type]
+        events.append(
+            _state_event(
+                "slot_expired",
+                callsign=callsign,
+                slot_type=slot_type,
+                before=slot,
+                after=None,
+                utterance_id=slot.get("utterance_id"),
+            )
+        )
+    return events
+
+
+def expire_clearances(state: SequenceState, timestamp: float) -> list[dict]:
+    events = _pop_expired(state, timestamp)
+    _record_timeline(state, events, timestamp)
+    _index_assignments(state, events)
+    _index_pending_conditions(state, events)
+    if state.subscriptions is not None:
+        for event in events:
+            state.subscriptions.dispatch_event(event)
+    return events
+
+
+def slot_at(state: SequenceState, callsign: str, slot_type: str, timestamp: float) -> dict | None:
+    intervals = state.timeline_by_callsign.get(callsign, {}).get(slot_type, [])
+    idx = bisect_right(intervals, timestamp, key=lambda interval: interval.start) - 1
+    if idx < 0:
+        return None
+    interval = intervals[idx]
+    if interval.end is not None and timestamp >= interval.end:
+        return None
+    return interval.slot
+
+
+def active_at(state: SequenceState, callsign: str, timestamp: float) -> dict[str, dict]:
+    snapshot: dict[str, dict] = {}
+    for slot_type in state.timeline_by_callsign.get(callsign, {}):
+        slot = slot_at(state, callsign, slot_type, timestamp)
+        if slot is not None:
+            snapshot[slot_type] = slot
+    return snapshot
+
+
+def _dispatch_subscriptions(state: SequenceState, result: dict, events: list[dict]) -> None:
+    if state.subscriptions is None:
+        return
+    for event in events:
+        state.subscriptions.dispatch_event(event)
+    state.subscriptions.dispatch_notes(result)
+
+
+def _apply_temporal_condition(
+    result: dict,
+    temporal_condition: str,
+    active: dict[str, dict],
+    events: list[dict],
+) -> None:
     instructions = result.get("instructions", [])
     if instructions:
         applied = False
@@ -73,8 +318,19 @@ def _apply_temporal_condition(result: dict, temporal_condition: str, active: dic
     if not active:
         return
 
-    for slot in active.values():
+    for slot_type, slot in active.items():
+        before = dict(slot)
         slot["condition"] = temporal_condition
+        events.append(
+            _state_event(
+                "condition_applied",
+                callsign=str(result.get("callsign")),
+                slot_type=slot_type,
+                before=before,
+                after=slot,
+                utterance_id=result.get("utterance_id"),
+            )
+        )
     result["notes"].append(f"temporal_condition_applied_to_active:{temporal_condition}")
 
 
@@ -85,7 +341,14 @@ def parse_turn_with_state(
     speaker: str = "ATC",
     utterance_id: str | None = None,
     enable_hybrid: bool = True,
+    emit_events: bool = False,
+    timestamp: float | None = None,
 ) -> dict:
+    if timestamp is not None:
+        if state.last_timestamp is not None and timestamp < state.last_timestamp:
+            raise ValueError(f"timestamp {timestamp} precedes previous turn at {state.last_timestamp}")
+        state.last_timestamp = timestamp
+
     normalized = normalize_text(text)
     result = parse_utterance(
         text,
@@ -109,10 +372,25 @@ def parse_turn_with_state(
     if _has_temporal_link(normalized):
         result["notes"].append("temporal_link_detected")
 
+    expired = expire_clearances(state, timestamp) if timestamp is not None and state.expiry_queue else []
+    for event in expired:
+        result["notes"].append(f"clearance_expired:{event['callsign']}:{event['slot_type']}")
+
+    # Expired events are already recorded and dispatched; they are only echoed here.
+    events: list[dict] = []
+    if emit_events:
+        result["state_events"] = list(expired)
+        events = result["state_events"]
+    turn_events_start = len(events)
+    # Otherwise only changes the indexes need become events.
+    track_all = emit_events or timestamp is not None or state.subscriptions is not None
+
     if not callsign:
+        _dispatch_subscriptions(state, result, events[turn_events_start:])
         return result
 
     state.last_callsign = callsign
+    utterance_id = result.get("utterance_id")
 
     active = state.active_by_callsign.setdefault(callsign, {})
     history = state.history_by_callsign.setdefault(callsign, [])
@@ -122,36 +400,98 @@ def parse_turn_with_state(
         if cancel_targets:
             for target in cancel_targets:
                 if target in active:
-                    del active[target]
+                    prev = active.pop(target)
+                    if track_all or _indexed(state, target, prev, None):
+                        events.append(
+                            _state_event(
+                                "slot_cancelled",
+                                callsign=callsign,
+                                slot_type=target,
+                                before=prev,
+                                after=None,
+                                utterance_id=utterance_id,
+                            )
+                        )
                 result["notes"].append(f"cancellation_applied:{target}")
         else:
+            for slot_type, slot in active.items():
+                if track_all or _indexed(state, slot_type, slot, None):
+                    events.append(
+                        _state_event(
+                            "slot_cancelled",
+                            callsign=callsign,
+                            slot_type=slot_type,
+                            before=slot,
+                            after=None,
+                            utterance_id=utterance_id,
+                        )
+                    )
             active.clear()
             result["notes"].append("cancellation_applied:all")
 
+    fixes = _mentioned_fixes(normalized, result, speaker)
+    if fixes and state.pending_by_fix:
+        _trigger_pending_conditions(state, result, fixes, events)
+
     if temporal_condition:
-        _apply_temporal_condition(result, temporal_condition, active)
+        _apply_temporal_condition(result, temporal_condition, active, events)
 
     contradictions: list[str] = []
     correction_mode = "amendment_detected" in result.get("notes", [])
 
     for instruction in result.get("instructions", []):
-        prev = active.get(instruction["type"])
-        if (
-            prev
-            and prev.get("value") != instruction.get("value")
-            and not correction_mode
-            and instruction.get("update") != "replace"
-        ):
-            contradictions.append(instruction["type"])
-
-        active[instruction["type"]] = {
+        slot_type = instruction["type"]
+        prev = active.get(slot_type)
+        slot = {
             "type": instruction.get("type"),
             "action": instruction.get("action"),
             "value": instruction.get("value"),
             "unit": instruction.get("unit"),
             "condition": instruction.get("condition"),
-            "utterance_id": result.get("utterance_id"),
+            "utterance_id": utterance_id,
         }
+        if timestamp is not None:
+            ttl = state.expiry_rules.get(slot_type)
+            slot["valid_from"] = timestamp
+            slot["expires_at"] = timestamp + ttl if ttl is not None else None
+            if ttl is not None:
+                heapq.heappush(state.expiry_queue, (timestamp + ttl, callsign, slot_type, timestamp))
+        if (
+            prev
+            and prev.get("value") != instruction.get("value")
+            and not correction_mode
+            and instruction.get("update") != "replace"
+        ):
+            contradictions.append(slot_type)
+            if track_all:
+                events.append(
+                    _state_event(
+                        "conflict_raised",
+                        callsign=callsign,
+                        slot_type=slot_type,
+                        before=prev,
+                        after=slot,
+                        utterance_id=utterance_id,
+                    )
+                )
+
+        if track_all or _indexed(state, slot_type, prev, slot):
+            if prev is None:
+                kind = "slot_set"
+            else:
+                # Re-asserting the same clearance confirms it (and restarts its validity), it does not replace it.
+                kind = "slot_confirmed" if _same_slot(prev, slot) else "slot_replaced"
+            events.append(
+                _state_event(
+                    kind,
+                    callsign=callsign,
+                    slot_type=slot_type,
+                    before=prev,
+                    after=slot,
+                    utterance_id=utterance_id,
+                )
+            )
+        active[slot_type] = slot
 
     if contradictions:
         uniq = sorted(set(contradictions))
@@ -163,7 +503,30 @@ def parse_turn_with_state(
             result["confidence"] = min(float(result.get("confidence", 0.0)), 0.4)
             result["confidence_tier"] = confidence_tier(float(result["confidence"]))
 
+    turn_events = events[turn_events_start:]
+    _index_assignments(state, turn_events)
+    _index_pending_conditions(state, turn_events)
+    duplicate_types: list[str] = []
+    for instruction in result.get("instructions", []):
+        slot_type = instruction["type"]
+        if slot_type not in state.cross_aircraft_types or slot_type in duplicate_types:
+            continue
+        slot = active.get(slot_type)
+        if slot is None:
+            continue
+        owners = state.assignment_index.get((slot_type, slot.get("value")), ())
+        # Own callsign is always an owner here, so any second owner is a duplicate.
+        if len(owners) > 1:
+            duplicate_types.append(slot_type)
+    if duplicate_types:
+        result["notes"].append("cross_aircraft_duplicate_detected")
+        for slot_type in duplicate_types:
+            result["notes"].append(f"cross_aircraft_duplicate:{slot_type}")
+
     history.append(result)
+    if timestamp is not None:
+        _record_timeline(state, turn_events, timestamp)
+    _dispatch_subscriptions(state, result, turn_events)
     return result
 
 
@@ -172,7 +535,11 @@ def parse_sequence(
     *,
     speaker: str = "ATC",
     enable_hybrid: bool = True,
+    emit_events: bool = False,
+    timestamps: list[float] | None = None,
 ) -> dict:
+    if timestamps is not None and len(timestamps) != len(utterances):
+        raise ValueError("timestamps must align with utterances")
     state = SequenceState()
     turns = [
         parse_turn_with_state(
@@ -181,6 +548,8 @@ def parse_sequence(
             speaker=speaker,
             utterance_id=f"turn-{idx + 1:04d}",
             enable_hybrid=enable_hybrid,
+            emit_events=emit_events,
+            timestamp=timestamps[idx] if timestamps is not None else None,
         )
         for idx, utterance in enumerate(utterances)
     ]
@@ -0,0 +1,264 @@
+from __future__ import annotations
+
+import copy
+import json
+import multiprocessing
+import os
+import queue
+import random
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+from atlas import normalize, validate
+from atlas.pipeline import parse_utterance
+
+# Rule-pack section -> the parser table it overlays (the same tables `parser_fingerprint` hashes).
+RULE_PACK_TABLES: dict[str, tuple[ModuleType, str]] = {
+    "phrase_replacements": (normalize, "PHRASE_REPLACEMENTS"),
+    "airline_aliases": (normalize, "AIRLINE_ALIASES"),
+    "spoken_digits": (normalize, "SPOKEN_DIGITS"),
+    "confidence_policy": (validate, "CONFIDENCE_POLICY"),
+}
+DIFF_FIELDS: tuple[str, ...] = ("status", "callsign", "instructions", "confidence", "confidence_tier", "notes")
+# Instructions compare on what was extracted, not on `trace` (the pattern text and normalized segment).
+INSTRUCTION_FIELDS: tuple[str, ...] = ("type", "action", "value", "unit", "condition", "update")
+DEFAULT_SAMPLE_RATE = 0.1
+DEFAULT_QUEUE_SIZE = 1000
+# The worker yields CPU to the primary path when they share cores.
+SHADOW_NICENESS = 10
+
+
+@dataclass(frozen=True, slots=True)
+class ShadowConfig:
+    """Secondary parser configuration: `enable_hybrid` plus rule-pack overlays on the parser tables."""
+
+    name: str = "candidate"
+    enable_hybrid: bool = True
+    rule_pack: dict[str, dict[str, Any]] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        unknown = [key for key in self.rule_pack if key not in RULE_PACK_TABLES]
+        if unknown:
+            raise ValueError(f"unknown rule pack sections: {', '.join(unknown)}")
+        if any(not isinstance(overrides, dict) for overrides in self.rule_pack.values()):
+            raise ValueError("rule pack sections must be objects")
+
+
+def load_rule_pack(path: str | Path) -> dict[str, dict[str, Any]]:
+    payload = json.loads(Path(path).read_text(encoding="utf-8"))
+    if not isinstance(payload, dict):
+        raise ValueError("rule pack must be an object")
+    return payload
+
+
+def apply_rule_pack(rule_pack: dict[str, dict[str, Any]]) -> None:
+    """Overlay `rule_pack` onto this process's parser tables; a null value removes an entry."""
+    for section, overrides in rule_pack.items():
+        module, name = RULE_PACK_TABLES[section]
+        table = getattr(module, name)
+        for key, value in overrides.items():
+            if value is None:
+                table.pop(key, None)
+            else:
+                table[key] = value
+
+
+def _instruction_key(item: dict[str, Any]) -> str:
+    return json.dumps([item.get(name) for name in INSTRUCTION_FIELDS])
+
+
+def _instruction_changes(
+    before: list[dict[str, Any]], after: list[dict[str, Any]]
+) -> dict[str, list[dict[str, Any]]] | None:
+    """Multiset difference of instructions by slot fields; reported items keep their own `trace`."""
+    left = Counter(_instruction_key(item) for item in before)
+    right = Counter(_instruction_key(item) for item in after)
+    if left == right:
+        return None
+    changes: dict[str, list[dict[str, Any]]] = {}
+    for side, items, surplus in (("removed", before, left - right), ("added", after, right - left)):
+        changes[side] = []
+        for item in items:
+            key = _instruction_key(item)
+            if surplus[key] > 0:
+                surplus[key] -= 1
+                changes[side].append(item)
+    return changes
+
+
+def diff_results(primary: dict[str, Any], shadow: dict[str, Any]) -> dict[str, Any]:
+    """Per-field differences; instructions and notes are reported as multiset removals/additions.
+
+    Instructions match on `INSTRUCTION_FIELDS`, so a rule or normalization change
+    that only rewrites a pattern or the traced segment reports no difference.
+    """
+    diff: dict[str, Any] = {}
+    for name in DIFF_FIELDS:
+        before, after = primary.get(name), shadow.get(name)
+        if name == "instructions":
+            changes = _instruction_changes(before or [], after or [])
+            if changes is not None:
+                diff[name] = changes
+        elif name == "notes":
+            left, right = Counter(before or []), Counter(after or [])
+            if left != right:
+                diff[name] = {"removed": list((left - right).elements()), "added": list((right - left).elements())}
+        elif name == "confidence" and before is not None and after is not None:
+            if abs(float(before) - float(after)) > 1e-9:
+                diff[name] = [before, after]
+        elif before != after:
+            diff[name] = [before, after]
+    return diff
+
+
+def _shadow_worker(
+    config: ShadowConfig,
+    inbox: Any,
+    outbox: Any,
+    output_path: str | None,
+) -> None:
+    # A separate process, so rule-pack overlays never touch the primary parser's tables.
+    if hasattr(os, "nice"):
+        os.nice(SHADOW_NICENESS)
+    apply_rule_pack(config.rule_pack)
+    compared = 0
+    differing = 0
+    errors = 0
+    field_counts: Counter[str] = Counter()
+    status_changes: Counter[str] = Counter()
+    sink = open(output_path, "a", encoding="utf-8") if output_path else None
+    try:
+        while True:
+            item = inbox.get()
+            if item is None:
+                break
+            text, speaker, utterance_id, primary = item
+            try:
+                shadow = parse_utterance(
+                    text, speaker=speaker, utterance_id=utterance_id, enable_hybrid=config.enable_hybrid
+                )
+            except Exception:  # a candidate config that crashes is a finding, not a reason to stop comparing
+                errors += 1
+                continue
+            compared += 1
+            diff = diff_results(primary, shadow)
+            if not diff:
+                continue
+            differing += 1
+            field_counts.update(diff.keys())
+            if "status" in diff:
+                status_changes["->".join(str(value) for value in diff["status"])] += 1
+            if sink is not None:
+                record = {"utterance_id": utterance_id, "speaker": speaker, "text": text, "diff": diff}
+                sink.write(json.dumps(record, separators=(",", ":")) + "\n")
+    finally:
+        if sink is not None:
+            sink.close()
+        outbox.put(
+            {
+                "compared": compared,
+                "differing": differing,
+                "errors": errors,
+                "field_counts": dict(field_counts),
+                "status_changes": dict(status_changes),
+            }
+        )
+
+
+class ShadowParser:
+    """Run `parse_utterance` as usual and compare a sampled share of traffic against `config`.
+
+    The primary result is returned unchanged. Sampled calls only enqueue the text
+    and primary result with `put_nowait`; the secondary parse, the diff and the
+    JSONL diff records (`output_path`) happen in a background process. When the
+    bounded queue is full, the sample is dropped instead of blocking.
+    """
+
+    def __init__(
+        self,
+        config: ShadowConfig,
+        *,
+        sample_rate: float = DEFAULT_SAMPLE_RATE,
+        output_path: str | Path | None = None,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        seed: int | None = None,
+    ) -> None:
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError("sample_rate must be in [0, 1]")
+        if queue_size < 1:
+            raise ValueError("queue_size must be at least 1")
+        self.config = config
+        self.sample_rate = sample_rate
+        self.seen = 0
+        self.sampled = 0
+        self.dropped = 0
+        self._rng = random.Random(seed)
+        self._inbox: Any = multiprocessing.Queue(maxsize=queue_size)
+        self._outbox: Any = multiprocessing.Queue()
+        self._worker = multiprocessing.Process(
+            target=_shadow_worker,
+            args=(config, self._inbox, self._outbox, str(output_path) if output_path else None),
+            daemon=True,
+        )
+        self._worker.start()
+        self._summary: dict[str, Any] | None = None
+
+    def submit(self, text: str, speaker: str, utterance_id: str | None, primary: dict[str, Any]) -> bool:
+        """Offer an already-parsed utterance for shadow comparison; returns whether it was queued."""
+        if self._summary is not None:
+            raise ValueError("shadow parser is closed")
+        self.seen += 1
+        if self.sample_rate < 1.0 and self._rng.random() >= self.sample_rate:
+            return False
+        self.sampled += 1
+        # Snapshot now: the queue pickles in a feeder thread, after the caller may have mutated `primary`.
+        payload = copy.deepcopy({name: primary.get(name) for name in DIFF_FIELDS})
+        try:
+            self._inbox.put_nowait((text, speaker, utterance_id, payload))
+        except queue.Full:
+            self.dropped += 1
+            return False
+        return True
+
+    def parse_utterance(self, text: str, speaker: str = "ATC", utterance_id: str | None = None, **kwargs: Any) -> dict:
+        result = parse_utterance(text, speaker=speaker, utterance_id=utterance_id, **kwargs)
+        self.submit(text, speaker, utterance_id, result)
+        return result
+
+    def close(self) -> dict[str, Any]:
+        """Drain queued samples, stop the worker and return the comparison summary."""
+        if self._summary is None:
+            while self._worker.is_alive():
+                try:
+                    self._inbox.put(None, timeout=0.1)
+                    break
+                except queue.Full:
+                    continue
+            worker: dict[str, Any] = {}
+            while True:
+                try:
+                    worker = self._outbox.get(timeout=0.1)
+                    break
+                except queue.Empty:
+                    if not self._worker.is_alive() and self._outbox.empty():
+                        break
+            self._worker.join()
+            # Samples left behind by a worker that died must not block interpreter exit.
+            self._inbox.cancel_join_thread()
+            self._summary = {
+                "config": self.config.name,
+                "seen": self.seen,
+                "sampled": self.sampled,
+                "dropped": self.dropped,
+                **worker,
+            }
+        return self._summary
+
+    def __enter__(self) -> ShadowParser:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, Iterable, Iterator
+
+
+def iter_shards(rows: Iterable[Any], shard_size: int) -> Iterator[list[Any]]:
+    shard: list[Any] = []
+    for row in rows:
+        shard.append(row)
+        if len(shard) >= shard_size:
+            yield shard
+            shard = []
+    if shard:
+        yield shard
+
+
+def run_sharded(
+    rows: Iterable[Any],
+    process: Callable[..., Any],
+    args: tuple[Any, ...],
+    aggregate: Any,
+    *,
+    workers: int,
+    shard_size: int,
+) -> Any:
+    """Merge `process(shard, *args)` for every shard of `rows` into `aggregate`, in row order.
+
+    `process` must be a picklable module-level function returning an object with
+    `merge`; with `workers > 1` shards run in a process pool.
+    """
+    if workers <= 1:
+        aggregate.merge(process(rows, *args))
+        return aggregate
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # Bound in-flight shards so memory stays flat however large the dataset is.
+        pending: deque[Future[Any]] = deque()
+        for shard in iter_shards(rows, shard_size):
+            pending.append(pool.submit(process, shard, *args))
+            if len(pending) >= workers * 2:
+                aggregate.merge(pending.popleft().result())
+        while pending:
+            aggregate.merge(pending.popleft().result())
+    return aggregate
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import copy
+import itertools
+import logging
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
+
+Callback = Callable[[dict[str, Any]], None]
+
+# Filter key for state events: (callsign, slot_type, event); None acts as a wildcard.
+EventKey = tuple[str | None, str | None, str | None]
+# Filter key for notes: (note, callsign); None callsign acts as a wildcard.
+NoteKey = tuple[str, str | None]
+
+
+@dataclass(slots=True)
+class Subscription:
+    token: int
+    callback: Callback
+    callsign: str | None = None
+    slot_type: str | None = None
+    event: str | None = None
+    note: str | None = None
+    asynchronous: bool = False
+
+
+class SubscriptionRegistry:
+    """Route sequence state events and turn notes to filtered subscribers.
+
+    Subscribers are bucketed by their exact filter tuple, so dispatching one
+    event probes a fixed number of buckets regardless of how many
+    non-matching subscribers are registered. Each subscriber gets its own copy
+    of the payload; a callback that raises is logged and counted in `failures`
+    instead of interrupting the turn that dispatched it.
+    """
+
+    def __init__(self) -> None:
+        self._tokens = itertools.count(1)
+        self._by_token: dict[int, Subscription] = {}
+        self._event_index: defaultdict[EventKey, list[Subscription]] = defaultdict(list)
+        self._note_index: defaultdict[NoteKey, list[Subscription]] = defaultdict(list)
+        self._executor: ThreadPoolExecutor | None = None
+        self.failures = 0
+
+    def subscribe(
+        self,
+        callback: Callback,
+        *,
+        callsign: str | None = None,
+        slot_type: str | None = None,
+        event: str | None = None,
+        note: str | None = None,
+        asynchronous: bool = False,
+    ) -> int:
+        if note is not None and (slot_type is not None or event is not None):
+            raise ValueError("note subscriptions cannot also filter on slot_type or event")
+
+        sub = Subscription(
+            token=next(self._tokens),
+            callback=callback,
+            callsign=callsign,
+            slot_type=slot_type,
+            event=event,
+            note=note,
+            asynchronous=asynchronous,
+        )
+        self._by_token[sub.token] = sub
+        if note is not None:
+            self._note_index[(note, callsign)].append(sub)
+        else:
+            self._event_index[(callsign, slot_type, event)].append(sub)
+        return sub.token
+
+    def unsubscribe(self, token: int) -> bool:
+        sub = self._by_token.pop(token, None)
+        if sub is None:
+            return False
+        if sub.note is not None:
+            key: Any = (sub.note, sub.callsign)
+            index: Any = self._note_index
+        else:
+            key = (sub.callsign, sub.slot_type, sub.event)
+            index = self._event_index
+        bucket = index[key]
+        bucket.remove(sub)
+        if not bucket:
+            del index[key]
+        return True
+
+    def __len__(self) -> int:
+        return len(self._by_token)
+
+    def _failed(self, sub: Subscription, exc: BaseException) -> None:
+        self.failures += 1
+        logger.error("subscription %d callback failed", sub.token, exc_info=exc)
+
+    def _deliver(self, sub: Subscription, payload: dict[str, Any]) -> None:
+        payload = copy.deepcopy(payload)
+        if not sub.asynchronous:
+            try:
+                sub.callback(payload)
+            except Exception as exc:  # the sequence state is already updated; the turn must still complete
+                self._failed(sub, exc)
+            return
+        if self._executor is None:
+            # One worker keeps async delivery in dispatch order.
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="atlas-subscriptions")
+
+        def _check(future: Future[None]) -> None:
+            exc = future.exception()
+            if exc is not None:
+                self._failed(sub, exc)
+
+        self._executor.submit(sub.callback, payload).add_done_callback(_check)
+
+    def dispatch_event(self, event: dict[str, Any]) -> int:
+        if not self._event_index:
+            return 0
+        delivered = 0
+        # dict.fromkeys drops the duplicate wildcard probe for fields the event leaves as None.
+        for callsign in dict.fromkeys((event.get("callsign"), None)):
+            for slot_type in dict.fromkeys((event.get("slot_type"), None)):
+                for kind in dict.fromkeys((event.get("event"), None)):
+                    for sub in self._event_index.get((callsign, slot_type, kind), ()):
+                        self._deliver(sub, event)
+                        delivered += 1
+        return delivered
+
+    def dispatch_notes(self, result: dict[str, Any]) -> int:
+        if not self._note_index:
+            return 0
+        delivered = 0
+        callsign = result.get("callsign")
+        for note in dict.fromkeys(result.get("notes", [])):
+            for key_callsign in (callsign, None) if callsign is not None else (None,):
+                for sub in self._note_index.get((note, key_callsign), ()):
+                    self._deliver(
+                        sub,
+                        {
+                            "event": "note",
+                            "note": note,
+                            "callsign": callsign,
+                            "utterance_id": result.get("utterance_id"),
+                            "status": result.get("status"),
+                        },
+                    )
+                    delivered += 1
+        return delivered
+
+    def flush(self) -> None:
+        """Block until all queued asynchronous deliveries have run."""
+        if self._executor is not None:
+            self._executor.submit(lambda: None).result()
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
@@ -0,0 +1,366 @@
+from __future__ import annotations
+
+import argparse
+import gzip
+import json
+import random
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+from atlas.normalize import AIRLINE_ALIASES
+
+INSTRUCTION_CLASSES: tuple[str, ...] = (
+    "altitude",
+    "speed",
+    "heading",
+    "frequency",
+    "runway",
+    "direct",
+    "waypoint",
+    "squawk",
+    "hold",
+    "climb_rate",
+)
+
+ICAO_AIRLINES = ("AAL", "UAL", "DAL", "AFR", "BAW", "QFA", "JAL", "SIA", "DLH", "KLM", "EZY", "RYR")
+FIXES = ("LAM", "CPT", "BIG", "OCK", "DET", "BNN", "MAY", "ABNUR", "DINKY", "GODLU", "KOPUL", "TIMBA")
+# Temporal conditions only reference these, never a waypoint target, so a waypoint
+# instruction cannot release a pending "until" condition in generated sessions.
+CONDITION_FIXES = ("ROSUN", "WILLO", "SAM", "BOGNA", "ODLEG", "SFD")
+
+ROW_SHAPES: dict[str, int] = {
+    "single": 40,
+    "multi": 18,
+    "correction": 8,
+    "temporal": 8,
+    "hybrid": 8,
+    "conflict": 6,
+    "unknown": 12,
+}
+SESSION_MOVES: dict[str, int] = {"build": 30, "amend": 20, "cancel": 15, "then": 15, "temporal": 10, "until": 10}
+
+_SPOKEN_AIRLINES: dict[str, list[str]] = {}
+for _alias, _code in AIRLINE_ALIASES.items():
+    _SPOKEN_AIRLINES.setdefault(_code, []).append(_alias.title())
+
+_DIGIT_WORDS = ("zero", "one", "two", "three", "four", "five", "six", "seven", "eight", "nine")
+_UNKNOWN_PHRASES = (
+    "standby",
+    "stand by",
+    "say again",
+    "report when ready",
+    "expect further clearance",
+    "cancel speed restrictions",
+)
+_CANCEL_PHRASES: dict[str, tuple[str, ...]] = {
+    "speed": ("cancel speed restrictions", "cancel speed restriction"),
+    "altitude": ("cancel level restriction", "cancel altitude restriction"),
+    "heading": ("cancel heading",),
+    "hold": ("cancel hold",),
+    "direct": ("cancel direct",),
+    "squawk": ("cancel squawk",),
+    "frequency": ("cancel frequency",),
+    "runway": ("cancel runway assignment",),
+}
+_TEMPORAL_CLASSES = ("altitude", "speed", "heading")
+
+Label = dict[str, Any]
+
+
+def _label(itype: str, action: str, value: Any, unit: str | None) -> Label:
+    return {"type": itype, "action": action, "value": value, "unit": unit}
+
+
+def _altitude(rng: random.Random) -> tuple[str, Label]:
+    level = rng.randrange(60, 420, 10)
+    action = rng.choice(("descend", "climb", "maintain"))
+    if action == "maintain":
+        return f"maintain flight level {level}", _label("altitude", "maintain", level, "FL")
+    form = rng.choice(("{a} flight level {v}", "{a} and maintain flight level {v}", "{a} to flight level {v}", "{a} to level {v}"))
+    return form.format(a=action, v=level), _label("altitude", action, level, "FL")
+
+
+def _speed(rng: random.Random) -> tuple[str, Label]:
+    value = rng.randrange(160, 310, 10)
+    action = rng.choice(("reduce", "increase", "maintain"))
+    text = f"maintain speed {value}" if action == "maintain" else f"{action} speed to {value}"
+    return text, _label("speed", action, value, "kt")
+
+
+def _heading(rng: random.Random) -> tuple[str, Label]:
+    value = rng.randrange(10, 361, 5)
+    action = rng.choice(("left", "right", "maintain"))
+    text = f"fly heading {value:03d}" if action == "maintain" else f"turn {action} heading {value:03d}"
+    return text, _label("heading", action, value, "deg")
+
+
+def _frequency(rng: random.Random) -> tuple[str, Label]:
+    text = f"{rng.randint(118, 135)}.{rng.choice(('1', '25', '5', '7', '75', '85', '825', '35'))}"
+    form = rng.choice(("contact tower on {f}", "contact approach on {f}", "contact {f}", "monitor {f}"))
+    return form.format(f=text), _label("frequency", "contact", float(text), "MHz")
+
+
+def _runway(rng: random.Random) -> tuple[str, Label]:
+    value = f"{rng.randint(1, 36):02d}{rng.choice(('', 'L', 'R', 'C'))}"
+    form = rng.choice(("runway {r}", "cleared ILS approach runway {r}", "cleared to land runway {r}"))
+    return form.format(r=value), _label("runway", "assign", value, None)
+
+
+def _direct(rng: random.Random) -> tuple[str, Label]:
+    fix = rng.choice(FIXES)
+    form = rng.choice(("proceed direct {f}", "direct {f}", "cleared direct to {f}"))
+    return form.format(f=fix), _label("direct", "direct", fix, None)
+
+
+def _waypoint(rng: random.Random) -> tuple[str, Label]:
+    fix = rng.choice(FIXES)
+    form = rng.choice(("proceed to {f}", "report over {f}", "cross {f}"))
+    return form.format(f=fix), _label("waypoint", "navigate", fix, None)
+
+
+def _squawk(rng: random.Random) -> tuple[str, Label]:
+    code = f"{rng.randint(0, 0o7777):04o}"
+    return f"squawk {code}", _label("squawk", "assign", code, "octal")
+
+
+def _hold(rng: random.Random) -> tuple[str, Label]:
+    fix = rng.choice(FIXES)
+    return f"hold at {fix}", _label("hold", "hold", fix, None)
+
+
+def _climb_rate(rng: random.Random) -> tuple[str, Label]:
+    action = rng.choice(("climb", "descend"))
+    value = rng.choice((500, 1000, 1500, 2000, 2500, 3000))
+    unit_text = rng.choice(("feet per minute", "fpm"))
+    return f"{action} at {value} {unit_text}", _label("climb_rate", action, value, "fpm")
+
+
+_GENERATORS: dict[str, Callable[[random.Random], tuple[str, Label]]] = {
+    "altitude": _altitude,
+    "speed": _speed,
+    "heading": _heading,
+    "frequency": _frequency,
+    "runway": _runway,
+    "direct": _direct,
+    "waypoint": _waypoint,
+    "squawk": _squawk,
+    "hold": _hold,
+    "climb_rate": _climb_rate,
+}
+
+
+def _instruction(rng: random.Random, itype: str, exclude: Any = None) -> tuple[str, Label]:
+    while True:
+        text, label = _GENERATORS[itype](rng)
+        if label["value"] != exclude:
+            return text, label
+
+
+def _callsign(rng: random.Random) -> tuple[str, str]:
+    """Return `(spoken form, normalized callsign)`."""
+    code = rng.choice(ICAO_AIRLINES)
+    if code in _SPOKEN_AIRLINES and rng.random() < 0.5:
+        airline = rng.choice(_SPOKEN_AIRLINES[code])
+        if rng.random() < 0.5:
+            # normalize_callsign keeps only the first and last of longer spoken digit groups.
+            digits = [rng.randint(1, 9), rng.randint(0, 9)]
+            words = [("niner" if d == 9 and rng.random() < 0.5 else _DIGIT_WORDS[d]) for d in digits]
+            return f"{airline} {' '.join(words)}", f"{code}{int(''.join(map(str, digits)))}"
+        number = rng.randint(1, 9999)
+        return f"{airline} {number}", f"{code}{number}"
+    number = rng.randint(1, 9999)
+    spacer = " " if rng.random() < 0.2 else ""
+    return f"{code}{spacer}{number}", f"{code}{number}"
+
+
+def _weighted(rng: random.Random, weights: dict[str, int]) -> str:
+    return rng.choices(tuple(weights), weights=tuple(weights.values()))[0]
+
+
+def _row_rng(seed: int, index: int, kind: str) -> random.Random:
+    # Each row has its own stream, so any index range can be generated independently.
+    return random.Random(f"atlas-synthetic:{kind}:{seed}:{index}")
+
+
+def _utterance_row(seed: int, index: int) -> dict[str, Any]:
+    rng = _row_rng(seed, index, "row")
+    spoken, callsign = _callsign(rng)
+    shape = _weighted(rng, ROW_SHAPES)
+    status = "ok"
+    labels: list[Label] = []
+
+    if shape == "single":
+        text, label = _instruction(rng, rng.choice(INSTRUCTION_CLASSES))
+        utterance, labels = f"{spoken} {text}", [label]
+    elif shape == "multi":
+        parts = [_instruction(rng, itype) for itype in rng.sample(INSTRUCTION_CLASSES, rng.randint(2, 3))]
+        joiner = rng.choice((" then ", " and ", ", "))
+        utterance = f"{spoken} " + joiner.join(text for text, _ in parts)
+        labels = [label for _, label in parts]
+    elif shape == "correction":
+        text, label = _instruction(rng, rng.choice(INSTRUCTION_CLASSES))
+        utterance, labels = f"{spoken} correction {text}", [label]
+    elif shape == "temporal":
+        text, label = _instruction(rng, rng.choice(_TEMPORAL_CLASSES))
+        condition = f"{rng.choice(('until', 'after'))} {rng.choice(CONDITION_FIXES)}"
+        utterance, labels = f"{spoken} {text} {condition}", [{**label, "condition": condition}]
+    elif shape == "hybrid":
+        # Bare "maintain N": knots or a low value reads as speed, a high value as a flight level.
+        if rng.random() < 0.5:
+            value = rng.randrange(160, 260, 10)
+            suffix = rng.choice(("", " knots"))
+            utterance, labels = f"{spoken} maintain {value}{suffix}", [_label("speed", "maintain", value, "kt")]
+        else:
+            value = rng.randrange(300, 420, 10)
+            utterance, labels = f"{spoken} maintain {value}", [_label("altitude", "maintain", value, "FL")]
+    elif shape == "conflict":
+        status = "conflict"
+        itype = rng.choice(("altitude", "speed"))
+        first_text, first = _instruction(rng, itype)
+        second_text, second = _instruction(rng, itype, exclude=first["value"])
+        utterance, labels = f"{spoken} {first_text} then {second_text}", [first, second]
+    else:
+        status = "unknown"
+        utterance = f"{spoken} {rng.choice(_UNKNOWN_PHRASES)}"
+
+    return {
+        "id": f"syn-{seed}-{index:08d}",
+        "utterance": utterance,
+        "speaker": "ATC",
+        "expected": {"status": status, "callsign": callsign, "instructions": labels},
+        "metadata": {"source": "synthetic", "shape": shape},
+    }
+
+
+def _session_row(seed: int, index: int) -> dict[str, Any]:
+    rng = _row_rng(seed, index, "session")
+    spoken, callsign = _callsign(rng)
+    # Mirrors the SequenceState slot semantics for a single aircraft.
+    active: dict[str, Label] = {}
+    turns: list[dict[str, Any]] = []
+
+    for turn_idx in range(rng.randint(2, 6)):
+        free = [itype for itype in INSTRUCTION_CLASSES if itype not in active]
+        moves = dict(SESSION_MOVES) if turn_idx else {"build": 1}
+        if not active:
+            for move in ("amend", "cancel", "until"):
+                moves.pop(move, None)
+        if not free:
+            moves.pop("build", None)
+            moves.pop("then", None)
+        if not any(itype in free for itype in _TEMPORAL_CLASSES):
+            moves.pop("temporal", None)
+        move = _weighted(rng, moves)
+
+        status = "ok"
+        turn_callsign = callsign
+        labels: list[Label] = []
+        if move == "build":
+            parts = [_instruction(rng, itype) for itype in rng.sample(free, min(len(free), rng.randint(1, 2)))]
+            utterance = f"{spoken} " + " then ".join(text for text, _ in parts)
+            labels = [label for _, label in parts]
+        elif move == "then":
+            text, label = _instruction(rng, rng.choice(free))
+            labels = [{**label, "condition": "then"}]
+            utterance = f"then {text}"
+        elif move == "temporal":
+            text, label = _instruction(rng, rng.choice([itype for itype in _TEMPORAL_CLASSES if itype in free]))
+            condition = f"{rng.choice(('until', 'after'))} {rng.choice(CONDITION_FIXES)}"
+            labels = [{**label, "condition": condition}]
+            utterance = f"{spoken} {text} {condition}"
+        elif move == "amend":
+            itype = rng.choice(sorted(active))
+            text, label = _instruction(rng, itype, exclude=active[itype]["value"])
+            labels = [label]
+            utterance = f"{spoken} correction {text}"
+        elif move == "cancel":
+            status = "unknown"
+            targets = sorted(itype for itype in active if itype in _CANCEL_PHRASES)
+            if targets and rng.random() < 0.8:
+                target = rng.choice(targets)
+                utterance = f"{spoken} {rng.choice(_CANCEL_PHRASES[target])}"
+                del active[target]
+            else:
+                utterance = f"{spoken} cancel all restrictions"
+                active.clear()
+        else:
+            status = "unknown"
+            condition = f"until {rng.choice(CONDITION_FIXES)}"
+            utterance = f"{spoken} {rng.choice(('', 'maintain '))}{condition}"
+            for slot in active.values():
+                slot["condition"] = condition
+
+        for label in labels:
+            active[label["type"]] = {"type": label["type"], "value": label["value"], "condition": label.get("condition")}
+        turns.append(
+            {
+                "utterance": utterance,
+                "expected": {"status": status, "callsign": turn_callsign, "instructions": labels},
+            }
+        )
+
+    final = {
+        itype: {key: value for key, value in slot.items() if key != "condition" or value is not None}
+        for itype, slot in active.items()
+    }
+    return {
+        "session_id": f"syn-seq-{seed}-{index:08d}",
+        "turns": turns,
+        "expected_final_state": {"callsign": callsign, "active": final},
+    }
+
+
+def iter_utterance_rows(count: int, *, seed: int = 0, start: int = 0) -> Iterator[dict[str, Any]]:
+    """Yield gold-format utterance rows `start .. start + count - 1` for `seed`."""
+    for index in range(start, start + count):
+        yield _utterance_row(seed, index)
+
+
+def iter_session_rows(count: int, *, seed: int = 0, start: int = 0) -> Iterator[dict[str, Any]]:
+    """Yield sessions in the `v0_sequence_slice` format."""
+    for index in range(start, start + count):
+        yield _session_row(seed, index)
+
+
+def write_corpus(
+    path: str | Path,
+    count: int,
+    *,
+    seed: int = 0,
+    start: int = 0,
+    sessions: bool = False,
+) -> int:
+    """Stream a synthetic corpus to JSONL (gzip-compressed when `path` ends in `.gz`)."""
+    if count < 0:
+        raise ValueError("count must be non-negative")
+    target = Path(path)
+    rows = iter_session_rows if sessions else iter_utterance_rows
+    opener = gzip.open if target.suffix == ".gz" else open
+    written = 0
+    with opener(target, "wt", encoding="utf-8") as handle:
+        buffer: list[str] = []
+        for row in rows(count, seed=seed, start=start):
+            buffer.append(json.dumps(row) + "\n")
+            written += 1
+            if len(buffer) >= 1000:
+                handle.write("".join(buffer))
+                buffer = []
+        handle.write("".join(buffer))
+    return written
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate a seeded synthetic ATC corpus with gold labels")
+    parser.add_argument("--output", required=True, help="JSONL path (.gz for gzip)")
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--start", type=int, default=0, help="First row index, for sharded generation")
+    parser.add_argument("--sessions", action="store_true", help="Emit multi-turn sessions instead of utterances")
+    args = parser.parse_args()
+
+    written = write_corpus(args.output, args.count, seed=args.seed, start=args.start, sessions=args.sessions)
+    print(json.dumps({"output": args.output, "rows": written, "seed": args.seed, "sessions": args.sessions}))
+
+
+if __name__ == "__main__":
+    main()
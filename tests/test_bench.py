@@ -0,0 +1,87 @@
+import json
+from pathlib import Path
+
+import pytest
+
+import atlas.bench as bench_module
+from atlas.bench import run_benchmarks, synthetic_utterances
+from atlas.dataset_cache import cache_file
+from atlas.perf_review import run_perf_review
+
+
+def test_run_benchmarks_reports_throughput_and_tail_latency() -> None:
+    report = run_benchmarks(only=["parse_utterance.synthetic", "parse_turn_with_state.gold"], repeat=1, synthetic=40)
+    assert list(report["benchmarks"]) == ["parse_utterance.synthetic", "parse_turn_with_state.gold"]
+    synthetic = report["benchmarks"]["parse_utterance.synthetic"]
+    assert synthetic["calls"] == 40
+    assert synthetic["throughput_per_sec"] > 0
+    latency = synthetic["latency_ms"]
+    assert latency["p50"] <= latency["p95"] <= latency["p99"] <= latency["max"]
+
+
+def test_evaluator_benchmarks_time_a_warm_dataset_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[tuple[bool, bool]] = []
+
+    def fake_evaluate(path: Path, *, use_cache: bool) -> dict:
+        calls.append((use_cache, cache_file(path).exists()))
+        return {"turns": 1}
+
+    monkeypatch.setattr(bench_module, "evaluate_sequence_dataset", fake_evaluate)
+    assert not cache_file(bench_module.SEQUENCE_DATASET).exists()
+    run_benchmarks(only=["evaluate_sequence_dataset"], repeat=3)
+    assert calls == [(True, True)] * 3
+
+
+def test_run_benchmarks_rejects_unknown_names() -> None:
+    with pytest.raises(ValueError):
+        run_benchmarks(only=["nope"])
+
+
+def test_synthetic_utterances_are_seeded() -> None:
+    assert synthetic_utterances(20, seed=3) == synthetic_utterances(20, seed=3)
+    assert synthetic_utterances(20, seed=3) != synthetic_utterances(20, seed=4)
+
+
+def _bench_report(throughput: float, p95: float, calls: int = 500) -> dict:
+    return {
+        "benchmarks": {
+            "parse_utterance.gold": {
+                "calls": calls,
+                "throughput_per_sec": throughput,
+                "latency_ms": {"p50": 0.1, "p95": p95, "p99": p95, "max": p95},
+                "peak_rss_mb": 40.0,
+            }
+        }
+    }
+
+
+def test_perf_review_flags_throughput_drop_and_tail_growth(tmp_path: Path) -> None:
+    baseline = tmp_path / "perf_baseline.json"
+    baseline.write_text(json.dumps(_bench_report(1000.0, 0.2)), encoding="utf-8")
+
+    _report, passed, reasons = run_perf_review(baseline_path=baseline, report=_bench_report(950.0, 0.21))
+    assert passed is True
+    assert reasons == []
+
+    report, passed, reasons = run_perf_review(baseline_path=baseline, report=_bench_report(500.0, 0.4))
+    assert passed is False
+    assert any("throughput dropped" in reason for reason in reasons)
+    assert any("p95 latency grew" in reason for reason in reasons)
+    assert report["comparison"]["parse_utterance.gold"]["throughput_change"] == -0.5
+
+    # Tails over a handful of calls are reported but not gated.
+    _report, passed, reasons = run_perf_review(baseline_path=baseline, report=_bench_report(1000.0, 0.4, calls=10))
+    assert passed is True
+
+
+def test_perf_review_reports_invalid_baseline(tmp_path: Path) -> None:
+    baseline = tmp_path / "perf_baseline.json"
+    baseline.write_text('{"benchmarks": {}}\n', encoding="utf-8")
+    _report, passed, reasons = run_perf_review(baseline_path=baseline, report=_bench_report(1000.0, 0.2))
+    assert passed is False
+    assert any("invalid perf baseline" in reason for reason in reasons)
+
+
+def test_stored_perf_baseline_is_valid() -> None:
+    payload = json.loads(Path("data/gold/perf_baseline.json").read_text(encoding="utf-8"))
+    assert "parse_turn_with_state.sector" in payload["benchmarks"]
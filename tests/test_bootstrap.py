@@ -0,0 +1,37 @@
+from collections import Counter
+
+import pytest
+
+import atlas.bootstrap as bootstrap_module
+from atlas.bootstrap import bootstrap_intervals
+
+COLUMNS = ("rows", "correct")
+METRICS = {"accuracy": ({"correct": 1}, {"rows": 1})}
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_bootstrap_interval_covers_rate(monkeypatch: pytest.MonkeyPatch, use_numpy: bool) -> None:
+    if not use_numpy:
+        monkeypatch.setattr(bootstrap_module, "np", None)
+    outcomes = Counter({(1, 1): 80, (1, 0): 20})
+    first = bootstrap_intervals(outcomes, COLUMNS, METRICS, resamples=400, seed=3)
+    again = bootstrap_intervals(outcomes, COLUMNS, METRICS, resamples=400, seed=3)
+    bounds = first["metrics"]["accuracy"]
+    assert first == again
+    # Normal-approximation 95% interval for p=0.8, n=100 is roughly [0.72, 0.88].
+    assert 0.68 <= bounds["lower"] <= 0.76
+    assert 0.84 <= bounds["upper"] <= 0.92
+
+
+def test_bootstrap_handles_empty_outcomes_and_zero_denominators() -> None:
+    empty = bootstrap_intervals(Counter(), COLUMNS, METRICS, resamples=10)
+    assert empty["metrics"]["accuracy"] == {"lower": 0.0, "upper": 0.0}
+    zero = bootstrap_intervals(Counter({(0, 0): 5}), COLUMNS, METRICS, resamples=10)
+    assert zero["metrics"]["accuracy"] == {"lower": 0.0, "upper": 0.0}
+
+
+def test_bootstrap_rejects_invalid_settings() -> None:
+    with pytest.raises(ValueError):
+        bootstrap_intervals(Counter({(1, 1): 1}), COLUMNS, METRICS, resamples=0)
+    with pytest.raises(ValueError):
+        bootstrap_intervals(Counter({(1, 1): 1}), COLUMNS, METRICS, confidence=1.0)
@@ -90,3 +90,85 @@ def test_audit_dataset_handles_invalid_json_line_without_crash(tmp_path: Path) -
     report = audit_gold_dataset(dataset)
     assert report["summary"]["error_count"] == 1
     assert "invalid JSON at line 1" in report["errors"][0]["message"]
+
+
+def test_audit_reports_unreadable_lines_first_and_numbers_rows_among_readable_ones(tmp_path: Path) -> None:
+    dataset = tmp_path / "mixed.jsonl"
+    rows = [json.dumps(_row("row-1", "AAL77 descend flight level 180", 180)), "{bad json}", "", "[1, 2]"]
+    rows.append(json.dumps(_row("", "AAL77 descend flight level 170", 170)))
+    dataset.write_text("\n".join(rows) + "\n", encoding="utf-8")
+
+    expected = [
+        "invalid JSON at line 2: Expecting property name enclosed in double quotes",
+        "line 4 payload must be object",
+        # The second readable row, although it is line 5 of the file.
+        "missing id at line 2",
+    ]
+    for use_cache in (False, True, True):
+        report = audit_gold_dataset(dataset, use_cache=use_cache)
+        assert [error["message"] for error in report["errors"]] == expected
+
+    # Rows reused from the cache after an edit keep the same numbering.
+    first = json.dumps(_row("row-0", "UAL12 climb flight level 300", 300))
+    dataset.write_text(f"{first}\n{dataset.read_text(encoding='utf-8')}", encoding="utf-8")
+    report = audit_gold_dataset(dataset)
+    assert [error["message"] for error in report["errors"]] == [
+        "invalid JSON at line 3: Expecting property name enclosed in double quotes",
+        "line 5 payload must be object",
+        "missing id at line 3",
+    ]
+
+
+def _row(row_id: str, utterance: str, value: int) -> dict:
+    return {
+        "id": row_id,
+        "utterance": utterance,
+        "expected": {
+            "status": "ok",
+            "callsign": "AAL77",
+            "instructions": [{"type": "altitude", "action": "descend", "value": value, "unit": "FL"}],
+        },
+    }
+
+
+def test_near_duplicate_label_conflicts_are_adjudicated(tmp_path: Path) -> None:
+    dataset = tmp_path / "near.jsonl"
+    _write_jsonl(
+        dataset,
+        [
+            _row("row-1", "AAL77 descend flight level 180 then turn left heading 270 good day", 180),
+            _row("row-2", "AAL77 uh descend flight level 180 then turn left heading 270 good day", 170),
+            # Same wording but a different value: a variant, not a duplicate.
+            _row("row-3", "AAL77 descend flight level 190 then turn left heading 270 good day", 180),
+            _row("row-4", "AAL77 uh descend flight level 180 then turn left heading 270 good day thanks", 180),
+        ],
+    )
+
+    exact = audit_gold_dataset(dataset)
+    assert exact["adjudication_items"] == []
+    assert "near_duplicate_count" not in exact["summary"]
+
+    report = audit_gold_dataset(dataset, near_duplicates=True)
+    assert report["summary"]["near_duplicate_count"] == 2
+    assert report["summary"]["adjudication_count"] == 1
+    item = report["adjudication_items"][0]
+    assert item["type"] == "near_duplicate_label_conflict"
+    assert item["row_ids"] == ["row-1", "row-2"]
+    assert 0.75 <= item["similarity"] < 1.0
+
+
+def test_near_duplicates_are_compared_with_every_label_variant(tmp_path: Path) -> None:
+    dataset = tmp_path / "chain.jsonl"
+    base = "AAL77 descend flight level 180 then turn left heading 270 good day"
+    _write_jsonl(
+        dataset,
+        [
+            _row("row-1", base, 180),
+            _row("row-2", f"{base} thanks", 170),
+            # Too far from row-1 to match it, but a near duplicate of row-2 with yet another label.
+            _row("row-3", "AAL77 uh descend flight level 180 then turn left heading 270 good day thanks much", 160),
+        ],
+    )
+
+    report = audit_gold_dataset(dataset, near_duplicates=True)
+    assert [item["row_ids"] for item in report["adjudication_items"]] == [["row-1", "row-2"], ["row-2", "row-3"]]
@@ -0,0 +1,116 @@
+import json
+import os
+import sqlite3
+from collections import OrderedDict
+from pathlib import Path
+
+import pytest
+
+from atlas import data_quality, dataset_cache
+from atlas.data_quality import audit_gold_dataset
+from atlas.dataset_cache import cache_file, iter_rows, load_derived, store_derived
+from atlas.jsonl import JsonlError, iter_jsonl
+
+
+def _copy_gold(tmp_path: Path, name: str = "v0_noisy_slice.jsonl") -> Path:
+    dataset = tmp_path / name
+    dataset.write_bytes(Path("data/gold", name).read_bytes())
+    return dataset
+
+
+def test_compiled_rows_match_jsonl_and_are_reused(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    dataset = _copy_gold(tmp_path)
+    expected = list(iter_jsonl(dataset))
+    assert list(iter_rows(dataset)) == expected
+    assert cache_file(dataset).exists()
+
+    def _no_decode(*_args: object) -> None:
+        raise AssertionError("compiled cache should skip JSON decoding")
+
+    monkeypatch.setattr(dataset_cache, "decode_line", _no_decode)
+    assert list(iter_rows(dataset)) == expected
+
+
+def test_compiled_rows_invalidate_on_content_change(tmp_path: Path) -> None:
+    dataset = tmp_path / "rows.jsonl"
+    dataset.write_text('{"id": "a"}\n{"id": "b"}\n', encoding="utf-8")
+    assert [row["id"] for row in iter_rows(dataset)] == ["a", "b"]
+
+    stat = dataset.stat()
+    # Same size and mtime would be trusted; a touched-but-identical file is confirmed by hash.
+    os.utime(dataset, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10_000_000))
+    assert [row["id"] for row in iter_rows(dataset)] == ["a", "b"]
+
+    dataset.write_text('{"id": "c"}\n{"id": "d"}\n', encoding="utf-8")
+    os.utime(dataset, ns=(stat.st_atime_ns, stat.st_mtime_ns + 20_000_000))
+    assert [row["id"] for row in iter_rows(dataset)] == ["c", "d"]
+
+
+def test_partial_pass_and_invalid_rows_leave_no_cache(tmp_path: Path) -> None:
+    dataset = tmp_path / "bad.jsonl"
+    dataset.write_text('{"id": "a"}\n{bad json}\n', encoding="utf-8")
+    with pytest.raises(JsonlError) as excinfo:
+        list(iter_rows(dataset))
+    assert excinfo.value.line_no == 2
+    assert dataset_cache.load_items(dataset, "rows", "") is None
+
+
+def test_derived_payloads_are_versioned(tmp_path: Path) -> None:
+    dataset = _copy_gold(tmp_path)
+    store_derived(dataset, "example", "v1", {"answer": 42})
+    assert load_derived(dataset, "example", "v1") == {"answer": 42}
+    assert load_derived(dataset, "example", "v2") is None
+
+
+def test_cache_lives_outside_the_dataset_tree_and_holds_no_pickles(tmp_path: Path) -> None:
+    dataset = _copy_gold(tmp_path)
+    list(iter_rows(dataset))
+    assert cache_file(dataset).parent == dataset_cache.cache_dir()
+    assert sorted(path.name for path in tmp_path.iterdir()) == [dataset.name]
+    with sqlite3.connect(cache_file(dataset)) as conn:
+        values = [value for (value,) in conn.execute("SELECT value FROM items")]
+    assert values and all(isinstance(json.loads(value), list) for value in values)
+
+
+def test_digest_memo_is_bounded(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(dataset_cache, "DIGEST_MEMO_LIMIT", 3)
+    monkeypatch.setattr(dataset_cache, "_digests", OrderedDict())
+    for idx in range(5):
+        dataset = tmp_path / f"rows{idx}.jsonl"
+        dataset.write_text('{"id": "a"}\n', encoding="utf-8")
+        dataset_cache.content_digest(dataset)
+    assert len(dataset_cache._digests) == 3
+
+
+def test_cached_data_quality_audit_matches_uncached(tmp_path: Path) -> None:
+    dataset = _copy_gold(tmp_path, "v0_slice.jsonl")
+    cold = audit_gold_dataset(dataset)
+    assert dataset_cache.load_items(dataset, "data_quality", data_quality._audit_version()) is not None
+    assert audit_gold_dataset(dataset) == cold
+    assert audit_gold_dataset(dataset, use_cache=False) == cold
+
+
+def test_incremental_audit_revalidates_only_changed_rows(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    dataset = _copy_gold(tmp_path, "v0_slice.jsonl")
+    audit_gold_dataset(dataset)
+
+    lines = dataset.read_text(encoding="utf-8").splitlines()
+    edited = lines[5].replace('"status": "ok"', '"status": "bogus"')
+    assert edited != lines[5]
+    # Drop a row, edit one, append a duplicate of another and a broken line.
+    lines = lines[1:5] + [edited] + lines[6:] + [lines[10], "{bad json}"]
+    dataset.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    audited: list[int] = []
+    original = data_quality._audit_record
+
+    def _counting(idx: int, row: object, decode_error: str | None) -> dict:
+        audited.append(idx)
+        return original(idx, row, decode_error)
+
+    monkeypatch.setattr(data_quality, "_audit_record", _counting)
+    incremental = audit_gold_dataset(dataset)
+    assert audited == [5, len(lines)]
+    assert incremental == audit_gold_dataset(dataset, use_cache=False)
+    assert any(error["message"] == "invalid status: bogus" for error in incremental["errors"])
+    assert any(error["message"] == "duplicate id" for error in incremental["errors"])
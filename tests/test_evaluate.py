@@ -1,6 +1,18 @@
+import json
 from pathlib import Path
 
-from atlas.evaluate import evaluate_dataset, evaluate_hybrid_ambiguity, evaluate_safety_dataset, evaluate_sequence_dataset
+import pytest
+
+import atlas.evaluate as evaluate_module
+from atlas.jsonl import iter_jsonl
+from atlas.evaluate import (
+    evaluate_dataset,
+    evaluate_hybrid_ambiguity,
+    evaluate_run,
+    evaluate_safety_dataset,
+    evaluate_sequence_dataset,
+)
+from atlas.pipeline import parse_utterance
 
 
 def test_evaluate_dataset_returns_metrics() -> None:
@@ -44,6 +56,26 @@ def test_evaluate_sequence_dataset_returns_perfect_scores_on_benchmark() -> None
     assert report["sessions"] >= 2
     assert report["turn_accuracy"] == 1.0
     assert report["final_state_accuracy"] == 1.0
+    assert report["failing_sessions"] == 0
+    assert report["failures"] == []
+
+
+def test_sequence_evaluation_shards_sessions_and_reports_failures(tmp_path: Path) -> None:
+    from atlas.synthetic import iter_session_rows
+
+    rows = list(iter_session_rows(40, seed=11))
+    rows[3]["turns"][1]["expected"]["callsign"] = "XXX999"
+    rows[17]["expected_final_state"]["active"] = {}
+    dataset = tmp_path / "sessions.jsonl"
+    dataset.write_text("".join(json.dumps(row) + "\n" for row in rows), encoding="utf-8")
+
+    report = evaluate_sequence_dataset(dataset)
+    assert report["sessions"] == 40
+    assert report["failing_sessions"] == 2
+    assert report["failures"][0] == {"session_id": rows[3]["session_id"], "failed_turns": [1], "final_state_ok": True}
+    assert report["failures"][1]["session_id"] == rows[17]["session_id"]
+    assert report["failures"][1]["final_state_ok"] is False
+    assert evaluate_sequence_dataset(dataset, workers=2, shard_size=7) == report
 
 
 def test_evaluate_region_phraseology_slice() -> None:
@@ -70,3 +102,147 @@ def test_evaluate_safety_dataset_reports_policy_conformance() -> None:
     assert safety["policy_conformance"]["total_violations"] >= 0
     assert 0.0 <= safety["fallback_behavior"]["blocking_status_rate"] <= 1.0
     assert 0.0 <= safety["failure_mode_detection"]["non_ok_detection_recall"] <= 1.0
+
+
+def test_parallel_evaluate_dataset_matches_serial_report() -> None:
+    serial = evaluate_dataset(Path("data/gold/v0_noisy_slice.jsonl"))
+    parallel = evaluate_dataset(Path("data/gold/v0_noisy_slice.jsonl"), workers=2, shard_size=5)
+    assert parallel == serial
+
+
+def test_evaluate_run_matches_individual_reports_from_one_pass() -> None:
+    dataset = Path("data/gold/v0_noisy_slice.jsonl")
+    combined = evaluate_run(dataset, sections=["core", "severity", "calibration", "safety"])
+    core = evaluate_dataset(dataset)
+    safety = evaluate_safety_dataset(dataset)
+
+    assert combined["samples"] == core["samples"]
+    for key in ("intent", "slot", "status_accuracy", "callsign_accuracy", "severity_weighted_error", "calibration"):
+        assert combined[key] == core[key]
+    assert combined["safety"] == safety["safety"]
+
+
+def test_evaluate_run_includes_hybrid_compare_section() -> None:
+    dataset = Path("data/gold/v0_ambiguity_slice.jsonl")
+    combined = evaluate_run(dataset, sections=["hybrid"])
+    assert combined["hybrid_compare"] == evaluate_hybrid_ambiguity(dataset)
+    assert "intent" not in combined
+
+
+def test_evaluate_run_rejects_unknown_section() -> None:
+    with pytest.raises(ValueError):
+        evaluate_run(Path("data/gold/v0_slice.jsonl"), sections=["nope"])
+
+
+def _reference_calibration(confidences: list[float], correctness: list[int], bins: int) -> list[tuple]:
+    out = []
+    for i in range(bins):
+        low, high = i / bins, (i + 1) / bins
+        idx = [j for j, c in enumerate(confidences) if (low <= c < high) or (i == bins - 1 and low <= c <= high)]
+        if idx:
+            avg = sum(confidences[j] for j in idx) / len(idx)
+            out.append((i + 1, len(idx), round(avg, 4)))
+    return out
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_calibration_bins_match_reference_binning(monkeypatch: pytest.MonkeyPatch, use_numpy: bool) -> None:
+    if not use_numpy:
+        monkeypatch.setattr(evaluate_module, "np", None)
+    dataset = Path("data/gold/v0_noisy_slice.jsonl")
+    confidences = [
+        parse_utterance(row["utterance"], speaker=row.get("speaker", "ATC"))["confidence"] for row in iter_jsonl(dataset)
+    ]
+    correctness = [0] * len(confidences)
+
+    for bins in (10, 1000):
+        report = evaluate_dataset(dataset, calibration_bins=bins)["calibration"]
+        assert report["bins"] == bins
+        assert len(report["reliability_bins"]) == bins
+        got = [(b["bin"], b["count"], b["avg_confidence"]) for b in report["reliability_bins"] if b["count"]]
+        assert got == _reference_calibration(confidences, correctness, bins)
+
+    sharded = evaluate_run(dataset, sections=["calibration"], calibration_bins=1000, workers=2, shard_size=5)
+    assert sharded["calibration"] == evaluate_dataset(dataset, calibration_bins=1000)["calibration"]
+    with pytest.raises(ValueError, match="calibration_bins"):
+        evaluate_dataset(dataset, calibration_bins=0)
+
+
+def test_bootstrap_intervals_bracket_point_metrics_and_are_seeded() -> None:
+    dataset = Path("data/gold/v0_noisy_slice.jsonl")
+    report = evaluate_dataset(dataset, bootstrap=500, bootstrap_seed=7)
+    intervals = report["confidence_intervals"]["metrics"]
+    callsign = intervals["callsign_accuracy"]
+    assert callsign["lower"] < report["callsign_accuracy"] <= callsign["upper"]
+    assert intervals["slot_f1"] == {"lower": report["slot"]["f1"], "upper": report["slot"]["f1"]}
+
+    sharded = evaluate_dataset(dataset, bootstrap=500, bootstrap_seed=7, workers=2, shard_size=5)
+    assert sharded["confidence_intervals"] == report["confidence_intervals"]
+    assert "confidence_intervals" not in evaluate_dataset(dataset)
+
+
+def test_evaluate_run_reports_safety_intervals() -> None:
+    report = evaluate_run(Path("data/gold/v0_noisy_slice.jsonl"), sections=["safety"], bootstrap=500)
+    blocking = report["safety"]["confidence_intervals"]["metrics"]["blocking_status_rate"]
+    assert blocking["lower"] <= report["safety"]["fallback_behavior"]["blocking_status_rate"] <= blocking["upper"]
+    assert "confidence_intervals" not in report
+
+
+def test_group_by_slices_match_per_file_runs(tmp_path: Path) -> None:
+    sources = {
+        "noisy": Path("data/gold/v0_noisy_slice.jsonl"),
+        "apac": Path("data/gold/v0_region_phraseology_apac_slice.jsonl"),
+    }
+    merged = tmp_path / "merged.jsonl"
+    with merged.open("w", encoding="utf-8") as handle:
+        for source, path in sources.items():
+            for line in path.read_text(encoding="utf-8").splitlines():
+                row = json.loads(line)
+                row["metadata"] = {"source": source}
+                handle.write(json.dumps(row) + "\n")
+
+    report = evaluate_dataset(merged, group_by=["source", "instruction_type", "region"])
+    for source, path in sources.items():
+        single = evaluate_dataset(path)
+        sliced = report["slices"]["source"][source]
+        assert sliced["samples"] == single["samples"]
+        assert sliced["slot_f1"] == single["slot"]["f1"]
+        assert sliced["callsign_accuracy"] == single["callsign_accuracy"]
+    assert list(report["slices"]["region"]) == ["unknown"]
+    assert report["slices"]["region"]["unknown"]["samples"] == report["samples"]
+    assert "altitude" in report["slices"]["instruction_type"]
+
+    sharded = evaluate_dataset(merged, group_by=["source", "instruction_type", "region"], workers=2, shard_size=5)
+    assert sharded["slices"] == report["slices"]
+    assert "## Slices by source" in evaluate_module._render_markdown_report(report)
+
+
+def test_cli_records_history_only_on_request(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    dataset = str(Path(__file__).resolve().parents[1] / "data/gold/v0_slice.jsonl")
+    monkeypatch.setattr("sys.argv", ["evaluate", "--dataset", dataset])
+    evaluate_module.main()
+    assert "run_history" not in json.loads(capsys.readouterr().out)
+    assert list(tmp_path.iterdir()) == []
+
+    monkeypatch.setattr("sys.argv", ["evaluate", "--dataset", dataset, "--history", "runs.sqlite"])
+    evaluate_module.main()
+    assert json.loads(capsys.readouterr().out)["run_history"]["path"] == "runs.sqlite"
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["--reports", "core", "--group-by", "region"],
+        ["--safety-dataset", "x.jsonl", "--disable-hybrid"],
+        ["--readback-dataset", "x.jsonl", "--sequence-dataset", "y.jsonl"],
+        ["--dataset", "x.jsonl", "--sequence-dataset", "y.jsonl"],
+    ],
+)
+def test_cli_rejects_unsupported_flag_combinations(monkeypatch: pytest.MonkeyPatch, argv: list[str]) -> None:
+    monkeypatch.setattr("sys.argv", ["evaluate", *argv])
+    with pytest.raises(SystemExit) as excinfo:
+        evaluate_module.main()
+    assert excinfo.value.code == 2
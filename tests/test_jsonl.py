@@ -0,0 +1,35 @@
+import gzip
+import json
+from pathlib import Path
+
+import pytest
+
+from atlas.evaluate import evaluate_dataset
+from atlas.jsonl import JsonlError, iter_jsonl, iter_jsonl_lines
+
+
+def test_iter_jsonl_skips_blank_lines_and_reports_line_numbers(tmp_path: Path) -> None:
+    dataset = tmp_path / "rows.jsonl"
+    dataset.write_text('{"id": "a"}\n\n{"id": "b"}\n', encoding="utf-8")
+    assert [line_no for line_no, _line in iter_jsonl_lines(dataset)] == [1, 3]
+    assert [row["id"] for row in iter_jsonl(dataset)] == ["a", "b"]
+
+
+def test_iter_jsonl_raises_with_line_number_on_invalid_json(tmp_path: Path) -> None:
+    dataset = tmp_path / "bad.jsonl"
+    dataset.write_text('{"id": "a"}\n{bad json}\n', encoding="utf-8")
+    with pytest.raises(JsonlError) as excinfo:
+        list(iter_jsonl(dataset))
+    assert excinfo.value.line_no == 2
+    assert "bad.jsonl:2" in str(excinfo.value)
+
+
+def test_gzip_dataset_evaluates_like_plain_dataset(tmp_path: Path) -> None:
+    source = Path("data/gold/v0_region_phraseology_slice.jsonl")
+    compressed = tmp_path / "region.jsonl.gz"
+    with gzip.open(compressed, "wt", encoding="utf-8") as f:
+        f.write(source.read_text(encoding="utf-8"))
+
+    plain = evaluate_dataset(source)
+    gz = evaluate_dataset(compressed)
+    assert json.dumps({**gz, "dataset": None}) == json.dumps({**plain, "dataset": None})
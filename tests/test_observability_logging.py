@@ -19,6 +19,7 @@ def test_trace_log_writes_jsonl_record(tmp_path: Path) -> None:
     row = rows[0]
     assert row["text"] == "AAL77 descend flight level 180"
     assert row["status"] == out["status"]
+    assert row["instructions"] == out["instructions"]
     assert isinstance(row["trace"], list)
     assert any(event["stage"] == "finalize" for event in row["trace"])
 
@@ -0,0 +1,48 @@
+import random
+from pathlib import Path
+
+import pytest
+
+from atlas.perturb import PERTURBATION_TYPES, evaluate_robustness, expand_rows, perturb_utterance
+
+
+def test_perturbations_are_seeded_and_targeted() -> None:
+    text = "Air France 100 descend flight level 120 then turn left heading 180"
+    for kind in PERTURBATION_TYPES:
+        noisy = perturb_utterance(text, kind, 0.3, random.Random(5))
+        assert noisy == perturb_utterance(text, kind, 0.3, random.Random(5))
+        assert noisy != text
+
+    homophones = perturb_utterance(text, "homophone", 1.0, random.Random(0))
+    assert homophones == "Air France 100 decend flight levell 120 then turn left heding 180"
+
+    confused = perturb_utterance(text, "digit_confusion", 1.0, random.Random(0)).split()
+    assert [token for token in confused if not token.isdigit()] == [t for t in text.split() if not t.isdigit()]
+    assert confused[2] == "788"
+
+    assert len(perturb_utterance(text, "word_drop", 1.0, random.Random(0)).split()) == 1
+    assert perturb_utterance(text, "merge", 1.0, random.Random(0)) == text.replace(" ", "")
+
+
+def test_expand_rows_tags_variants() -> None:
+    row = {"id": "r1", "utterance": "UAL12 descend flight level 120", "expected": {}, "metadata": {"region": "eu"}}
+    rows = list(expand_rows([row], variants=3, kinds=("split", "merge"), intensities=(0.2, 0.5)))
+    assert len(rows) == 1 + 2 * 2 * 3
+    assert rows[0]["metadata"] == {"region": "eu", "perturbation_level": "clean"}
+    assert rows[1]["id"] == "r1~split@0.2~0"
+    assert rows[1]["metadata"]["region"] == "eu"
+    assert rows[1]["metadata"]["source_id"] == "r1"
+    with pytest.raises(ValueError):
+        expand_rows([row], kinds=("shout",))
+
+
+def test_robustness_curves_are_worker_independent() -> None:
+    options = {"variants": 2, "kinds": ("homophone", "word_drop"), "intensities": (0.5, 0.2), "seed": 1}
+    report = evaluate_robustness(Path("data/gold/v0_slice.jsonl"), **options)
+    assert report["samples"] == 255 * (1 + 2 * 2 * 2)
+    assert report["clean"]["slot_f1"] == 1.0
+    curve = report["curves"]["word_drop"]
+    assert [point["intensity"] for point in curve] == [0.2, 0.5]
+    assert curve[1]["slot_f1"] < curve[0]["slot_f1"] < 1.0
+    assert curve[1]["degradation"]["slot_f1"] == round(1.0 - curve[1]["slot_f1"], 4)
+    assert evaluate_robustness(Path("data/gold/v0_slice.jsonl"), workers=2, shard_size=200, **options) == report
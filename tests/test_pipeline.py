@@ -1,4 +1,4 @@
-from atlas.pipeline import parse_utterance
+from atlas.pipeline import finalize_utterance, parse_utterance, prepare_utterance
 
 
 def test_parses_altitude_and_speed_with_callsign() -> None:
@@ -145,3 +145,17 @@ def test_parses_cleared_direct_and_proceed_via_variants() -> None:
     out = parse_utterance("AAL10 cleared direct LAM and proceed via DINKY")
     types = {item["type"] for item in out["instructions"]}
     assert {"direct", "waypoint"}.issubset(types)
+
+
+def test_prepared_utterance_is_reusable_across_hybrid_variants() -> None:
+    text = "AAL77 maintain 250"
+    prepared = prepare_utterance(text)
+
+    hybrid = finalize_utterance(prepared, enable_hybrid=True)
+    baseline = finalize_utterance(prepared, enable_hybrid=False)
+
+    assert hybrid == parse_utterance(text, enable_hybrid=True)
+    assert baseline == parse_utterance(text, enable_hybrid=False)
+    assert hybrid["instructions"][0]["type"] == "speed"
+    assert baseline["instructions"][0]["type"] == "altitude"
+    assert finalize_utterance(prepared, enable_hybrid=True) == hybrid
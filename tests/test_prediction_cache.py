@@ -0,0 +1,54 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from atlas import validate
+from atlas.evaluate import evaluate_dataset, evaluate_run
+from atlas.prediction_cache import parser_fingerprint
+
+
+def _strip_cache(report: dict) -> dict:
+    return {key: value for key, value in report.items() if key != "prediction_cache"}
+
+
+def test_prediction_cache_reuses_unchanged_rows(tmp_path: Path) -> None:
+    cache = tmp_path / "predictions.sqlite"
+    dataset = Path("data/gold/v0_noisy_slice.jsonl")
+
+    cold = evaluate_dataset(dataset, prediction_cache=cache)
+    warm = evaluate_dataset(dataset, prediction_cache=cache)
+
+    assert cold["prediction_cache"]["reused"] == 0
+    assert cold["prediction_cache"]["parsed"] == cold["samples"]
+    assert warm["prediction_cache"]["reused"] == warm["samples"]
+    assert _strip_cache(warm) == _strip_cache(cold) == evaluate_dataset(dataset)
+
+
+def test_prediction_cache_reparses_only_edited_rows(tmp_path: Path) -> None:
+    cache = tmp_path / "predictions.sqlite"
+    source = Path("data/gold/v0_region_phraseology_slice.jsonl")
+    rows = [json.loads(line) for line in source.read_text(encoding="utf-8").splitlines() if line.strip()]
+    dataset = tmp_path / "rows.jsonl"
+    dataset.write_text("".join(json.dumps(row) + "\n" for row in rows), encoding="utf-8")
+    evaluate_run(dataset, sections=["core", "hybrid"], prediction_cache=cache)
+
+    rows[0]["utterance"] = rows[0]["utterance"] + " and squawk 4721"
+    dataset.write_text("".join(json.dumps(row) + "\n" for row in rows), encoding="utf-8")
+    report = evaluate_run(dataset, sections=["core", "hybrid"], prediction_cache=cache)
+    assert report["prediction_cache"]["parsed"] == 1
+    assert report["prediction_cache"]["reused"] == len(rows) - 1
+
+
+def test_prediction_cache_invalidated_by_confidence_policy_change(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cache = tmp_path / "predictions.sqlite"
+    dataset = Path("data/gold/v0_region_phraseology_slice.jsonl")
+    evaluate_dataset(dataset, prediction_cache=cache)
+    before = parser_fingerprint()
+
+    monkeypatch.setitem(validate.CONFIDENCE_POLICY, "min_operational_threshold", 0.7)
+    assert parser_fingerprint() != before
+    report = evaluate_dataset(dataset, prediction_cache=cache)
+    assert report["prediction_cache"]["reused"] == 0
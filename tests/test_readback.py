@@ -1,6 +1,7 @@
 from pathlib import Path
 
-from atlas.evaluate import compare_readback, evaluate_readback_dataset
+from atlas.evaluate import compare_readback, compare_readbacks, evaluate_readback_dataset
+from atlas.jsonl import iter_jsonl
 
 
 def test_compare_readback_detects_slot_mismatch() -> None:
@@ -28,3 +29,17 @@ def test_evaluate_readback_dataset_returns_metrics() -> None:
     assert 0.0 <= mismatch["recall"] <= 1.0
     assert 0.0 <= mismatch["f1"] <= 1.0
     assert 0.0 <= mismatch["accuracy"] <= 1.0
+
+
+def test_compare_readbacks_matches_per_pair_results() -> None:
+    rows = list(iter_jsonl("data/gold/readback_pairs.v0.jsonl"))
+    # Repeat attempts per clearance, as when pilots read back more than once.
+    pairs = [(row["atc_utterance"], row["pilot_utterance"]) for row in rows] * 3
+    pairs += [(rows[0]["atc_utterance"], row["pilot_utterance"]) for row in rows]
+    expected = [compare_readback(atc, pilot) for atc, pilot in pairs]
+    assert compare_readbacks(pairs) == expected
+    assert compare_readbacks(iter(pairs), workers=2, shard_size=3) == expected
+    assert compare_readbacks([]) == []
+
+    path = Path("data/gold/readback_pairs.v0.jsonl")
+    assert evaluate_readback_dataset(path, workers=2, shard_size=2, batch_size=5) == evaluate_readback_dataset(path)
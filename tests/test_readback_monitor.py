@@ -0,0 +1,91 @@
+import pytest
+
+from atlas.readback_monitor import ReadbackMonitor
+from atlas.sequence import SequenceState, slot_at
+from atlas.subscriptions import SubscriptionRegistry
+
+
+def test_monitor_pairs_interleaved_readbacks_and_times_out() -> None:
+    registry = SubscriptionRegistry()
+    missing: list[dict] = []
+    registry.subscribe(missing.append, event="readback_missing")
+    monitor = ReadbackMonitor(timeout=5.0, state=SequenceState(subscriptions=registry))
+
+    assert monitor.observe("AAL12 descend flight level 120", timestamp=0.0) == []
+    assert monitor.observe("UAL7 turn left heading 180", timestamp=1.0) == []
+    assert monitor.observe("DAL3 squawk 4721", timestamp=2.0) == []
+    assert len(monitor) == 3
+
+    # Out of order: UAL7 reads back wrong first, then AAL12 correctly, then UAL7 again.
+    assert monitor.observe("turn left heading 170 UAL7", speaker="PILOT", timestamp=2.5) == []
+    confirmed = monitor.observe("descend flight level 120 AAL12", speaker="PILOT", timestamp=3.0)
+    assert [(event["event"], event["callsign"], event["attempts"]) for event in confirmed] == [
+        ("readback_confirmed", "AAL12", 1)
+    ]
+    assert monitor.state.active_by_callsign["AAL12"]["altitude"]["value"] == 120
+
+    # The correct UAL7 readback never comes; DAL3 never reads back at all.
+    events = monitor.expire(8.0)
+    assert [(event["event"], event["callsign"], event["at"]) for event in events] == [
+        ("readback_mismatch", "UAL7", 6.0),
+        ("readback_missing", "DAL3", 7.0),
+    ]
+    assert events[0]["comparison"]["missing_in_readback"][0]["value"] == 180
+    assert [event["callsign"] for event in missing] == ["DAL3"]
+    assert len(monitor) == 0
+    assert not monitor.deadlines
+
+
+def test_monitor_folds_follow_ups_and_ignores_acknowledgements() -> None:
+    monitor = ReadbackMonitor(timeout=5.0)
+    monitor.observe("BAW1 descend flight level 200", timestamp=0.0)
+    monitor.observe("then reduce speed to 220", timestamp=1.0)
+    monitor.observe("BAW1 correction descend flight level 180", timestamp=2.0)
+
+    assert monitor.observe("roger BAW1", speaker="PILOT", timestamp=3.0) == []
+    # No callsign: the readback answers the latest clearance on frequency.
+    events = monitor.observe("descend flight level 180 reduce speed 220", speaker="PILOT", timestamp=4.0)
+    assert [event["event"] for event in events] == ["readback_confirmed"]
+    assert events[0]["clearance"].count(" / ") == 2
+    # The stale deadlines for the folded clearance raise nothing.
+    assert monitor.expire(100.0) == []
+
+    with pytest.raises(ValueError):
+        ReadbackMonitor(timeout=0)
+
+
+def test_untimed_turns_use_the_monitor_clock_without_touching_the_state_timeline() -> None:
+    ticks = iter([100.0, 200.0])
+    monitor = ReadbackMonitor(timeout=5.0, clock=lambda: next(ticks))
+    assert monitor.observe("AAL12 descend flight level 120") == []
+    assert monitor.state.last_timestamp is None
+    assert slot_at(monitor.state, "AAL12", "altitude", 100.0) is None
+
+    # Explicit timestamps on another timescale still order correctly in the state.
+    monitor.observe("UAL7 turn left heading 180", timestamp=1.0)
+    assert slot_at(monitor.state, "UAL7", "heading", 1.0)["value"] == 180
+    events = monitor.observe("DAL3 squawk 4721")
+    assert [event["callsign"] for event in events] == ["UAL7", "AAL12"]
+
+
+def test_explicit_timestamps_expire_on_their_own_timescale() -> None:
+    monitor = ReadbackMonitor(timeout=5.0, clock=lambda: 100.0)
+    monitor.observe("AAL12 descend flight level 120")
+    monitor.observe("UAL7 turn left heading 180", timestamp=1.0)
+    monitor.observe("DAL3 squawk 4721", timestamp=2.0)
+
+    # UAL7's window closed at 6 even though AAL12's clock-timed deadline (105) was issued first.
+    events = monitor.observe("BAW1 climb flight level 300", timestamp=50.0)
+    assert [(event["event"], event["callsign"], event["at"]) for event in events] == [
+        ("readback_missing", "UAL7", 6.0),
+        ("readback_missing", "DAL3", 7.0),
+    ]
+    assert sorted(monitor.pending) == ["AAL12", "BAW1"]
+
+    # Out-of-order timestamps are rejected before anything is parsed, PILOT turns included.
+    with pytest.raises(ValueError):
+        monitor.observe("climb flight level 300 BAW1", speaker="PILOT", timestamp=40.0)
+    with pytest.raises(ValueError):
+        monitor.observe("BAW1 climb flight level 310", timestamp=40.0)
+    assert monitor.pending["BAW1"].attempts == 0
+    assert monitor.state.active_by_callsign["BAW1"]["altitude"]["value"] == 300
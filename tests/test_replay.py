@@ -0,0 +1,58 @@
+import gzip
+import json
+from pathlib import Path
+
+from atlas.dataset_cache import iter_rows
+from atlas.pipeline import parse_utterance
+from atlas.replay import replay_trace_log
+
+
+def test_replay_matches_fresh_trace_log(tmp_path: Path) -> None:
+    log = tmp_path / "trace.jsonl"
+    for row in iter_rows("data/gold/v0_noisy_slice.jsonl"):
+        parse_utterance(row["utterance"], utterance_id=row["id"], trace_log_path=str(log))
+    report = replay_trace_log(log)
+    assert report["replayed"] == report["records"] > 0
+    assert report["changed"] == 0
+    assert report["examples"] == []
+
+
+def test_replay_aggregates_regressions_by_rule_and_note(tmp_path: Path) -> None:
+    source = tmp_path / "source.jsonl"
+    texts = ["AFR100 descend flight level 120", "UAL12 turn left heading 270", "DAL5 maintain 250"] * 4
+    for idx, text in enumerate(texts):
+        parse_utterance(text, utterance_id=f"u{idx}", trace_log_path=str(source))
+    records = [json.loads(line) for line in source.read_text(encoding="utf-8").splitlines()]
+
+    # A recorded run that extracted a different altitude and lost a note.
+    records[0]["instructions"][0]["value"] = 130
+    records[0]["status"] = "ambiguous"
+    # A legacy record (no instructions) whose rule stage found a speed instead of a heading.
+    del records[1]["instructions"]
+    for event in records[1]["trace"]:
+        if event["stage"] == "segment":
+            event["parsed_instruction_types"] = ["speed"]
+    records[2]["notes"] = []
+    # A hybrid-resolved speed recorded with a different value is blamed on the hybrid stage.
+    records[5]["instructions"][0]["value"] = 260
+    # Only the pattern text changed since this run: not a regression.
+    records[3]["instructions"][0]["trace"]["pattern"] = r"\b(DESCEND)\s+FL\s*(\d{2,3})\b"
+
+    log = tmp_path / "trace.jsonl.gz"
+    with gzip.open(log, "wt", encoding="utf-8") as handle:
+        handle.write("".join(json.dumps(record) + "\n" for record in records) + "{truncated\n")
+
+    report = replay_trace_log(log)
+    assert report["records"] == 13
+    assert report["invalid"] == 1
+    assert report["changed"] == 4
+    assert report["status_changes"] == {"ambiguous->ok": 1}
+    assert report["rules"] == {
+        "altitude": {"removed": 1, "added": 1},
+        "hybrid_disambiguation": {"removed": 1, "added": 1},
+        "heading": {"removed": 0, "added": 1},
+        "speed": {"removed": 1, "added": 0},
+    }
+    assert set(report["notes"]) == set(parse_utterance(texts[2])["notes"])
+    assert [example["utterance_id"] for example in report["examples"]] == ["u0", "u1", "u2", "u5"]
+    assert replay_trace_log(log, workers=2, shard_size=3) == report
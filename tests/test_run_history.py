@@ -0,0 +1,44 @@
+from pathlib import Path
+
+from atlas.evaluate import evaluate_dataset, evaluate_safety_dataset
+from atlas.run_history import RunHistory, headline_metrics
+
+
+def test_headline_metrics_cover_evaluators() -> None:
+    metrics = headline_metrics(evaluate_dataset(Path("data/gold/v0_slice.jsonl")))
+    assert metrics["slot_f1"] == 1.0
+    assert metrics["samples"] == 255.0
+    safety = headline_metrics(evaluate_safety_dataset(Path("data/gold/v0_noisy_slice.jsonl")))
+    assert set(safety) >= {"blocking_status_rate", "violation_rate", "non_ok_detection_recall"}
+    assert headline_metrics({"dataset": "x", "delta": {"slot_f1": 0.25}}) == {"hybrid_slot_f1_delta": 0.25}
+
+
+def test_trends_and_rolling_baselines(tmp_path: Path) -> None:
+    with RunHistory(tmp_path / "history.sqlite") as history:
+        for day in range(1, 8):
+            history.record(
+                {"dataset": "a.jsonl", "samples": 10, "slot": {"f1": day / 10}},
+                kind="dataset",
+                label="nightly",
+                recorded_at=f"2026-01-0{day}T00:00:00Z",
+            )
+        history.record(
+            {"dataset": "b.jsonl", "slot": {"f1": 0.9}}, kind="dataset", label="nightly", recorded_at="2026-01-09T00:00:00Z"
+        )
+        run_id = history.record(
+            {"dataset": "a.jsonl", "slot": {"f1": 0.5}}, kind="dataset", label="adhoc", recorded_at="2026-01-08T00:00:00Z"
+        )
+
+        trend = history.trend("slot_f1", dataset="a.jsonl", label="nightly", limit=3)
+        assert [point["value"] for point in trend] == [0.5, 0.6, 0.7]
+        assert [point["value"] for point in history.trend("slot_f1", dataset="a.jsonl", since="2026-01-07")] == [0.7, 0.5]
+        assert len(history.trend("slot_f1")) == 9
+
+        baseline = history.baseline("slot_f1", dataset="a.jsonl", label="nightly", window=4)
+        assert baseline["runs"] == 4
+        assert baseline["latest"]["value"] == 0.7
+        assert baseline["mean"] == 0.45
+        assert baseline["delta"] == 0.25
+        assert history.baseline("slot_f1", dataset="missing.jsonl")["runs"] == 0
+        assert history.report(run_id) == {"dataset": "a.jsonl", "slot": {"f1": 0.5}}
+        assert history.runs(limit=1)[0]["dataset"] == "b.jsonl"
@@ -1,5 +1,9 @@
 from pathlib import Path
 
+import pytest
+
+from atlas.bootstrap import resample_backend
+from atlas.evaluate import evaluate_run
 from atlas.safety_review import run_safety_review
 
 
@@ -65,3 +69,88 @@ def test_safety_review_handles_invalid_baseline_file_without_exception(tmp_path:
     )
     assert passed is False
     assert any("invalid baseline_safety_json" in reason for reason in reasons)
+
+
+def test_safety_review_accepts_precomputed_combined_report() -> None:
+    combined = evaluate_run(Path("data/gold/v0_noisy_slice.jsonl"), sections=["core", "safety"])
+    report, passed, reasons = run_safety_review(
+        dataset=Path("data/gold/v0_noisy_slice.jsonl"),
+        min_non_ok_recall=1.0,
+        max_violations=0,
+        min_operational_threshold=0.60,
+        report=combined,
+    )
+    assert passed is True
+    assert reasons == []
+    assert report is combined
+
+
+@pytest.mark.parametrize(
+    ("dataset", "threshold", "message"),
+    [
+        ("data/gold/v0_slice.jsonl", 0.60, "computed for"),
+        ("data/gold/v0_noisy_slice.jsonl", 0.70, "min_operational_threshold"),
+    ],
+)
+def test_safety_review_rejects_precomputed_report_for_other_inputs(dataset: str, threshold: float, message: str) -> None:
+    combined = evaluate_run(Path("data/gold/v0_noisy_slice.jsonl"), sections=["safety"])
+    with pytest.raises(ValueError, match=message):
+        run_safety_review(
+            dataset=Path(dataset),
+            min_non_ok_recall=1.0,
+            max_violations=0,
+            min_operational_threshold=threshold,
+            report=combined,
+        )
+
+
+def test_safety_review_interval_gate_bounds() -> None:
+    common = {
+        "dataset": Path("data/gold/v0_noisy_slice.jsonl"),
+        "min_non_ok_recall": 1.0,
+        "max_violations": 0,
+        "min_operational_threshold": 0.60,
+        "max_blocking_status_rate": 0.15,
+        "bootstrap": 500,
+    }
+    _report, point_passed, _reasons = run_safety_review(**common)
+    _report, optimistic_passed, _reasons = run_safety_review(**common, gate_bound="optimistic")
+    report, pessimistic_passed, reasons = run_safety_review(**common, gate_bound="pessimistic")
+    assert point_passed is False
+    assert optimistic_passed is True
+    assert pessimistic_passed is False
+    assert any("pessimistic bound" in reason for reason in reasons)
+    assert "confidence_intervals" in report["safety"]
+
+
+def test_safety_review_interval_gate_requires_intervals_in_precomputed_report() -> None:
+    combined = evaluate_run(Path("data/gold/v0_noisy_slice.jsonl"), sections=["safety"])
+    with pytest.raises(ValueError):
+        run_safety_review(
+            dataset=Path("data/gold/v0_noisy_slice.jsonl"),
+            min_non_ok_recall=1.0,
+            max_violations=0,
+            min_operational_threshold=0.60,
+            report=combined,
+            gate_bound="optimistic",
+        )
+
+
+def test_safety_review_interval_gate_rejects_report_from_other_resampler(monkeypatch: pytest.MonkeyPatch) -> None:
+    combined = evaluate_run(Path("data/gold/v0_noisy_slice.jsonl"), sections=["safety"], bootstrap=200)
+    assert combined["safety"]["confidence_intervals"]["backend"] == resample_backend()
+    common = {
+        "dataset": Path("data/gold/v0_noisy_slice.jsonl"),
+        "min_non_ok_recall": 1.0,
+        "max_violations": 0,
+        "min_operational_threshold": 0.60,
+        "report": combined,
+    }
+    run_safety_review(**common, gate_bound="optimistic")
+
+    other = "python" if resample_backend() == "numpy" else "numpy"
+    monkeypatch.setattr("atlas.safety_review.resample_backend", lambda: other)
+    with pytest.raises(ValueError, match="resampled with"):
+        run_safety_review(**common, gate_bound="optimistic")
+    # Point gating never reads the intervals.
+    run_safety_review(**common)
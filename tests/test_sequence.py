@@ -1,4 +1,15 @@
-from atlas.sequence import SequenceState, parse_sequence, parse_turn_with_state
+import pytest
+
+import atlas.sequence as sequence_module
+from atlas.sequence import (
+    SequenceState,
+    active_at,
+    callsigns_assigned,
+    expire_clearances,
+    parse_sequence,
+    parse_turn_with_state,
+    slot_at,
+)
 
 
 def test_sequence_amendment_replaces_prior_instruction() -> None:
@@ -71,3 +82,190 @@ def test_parse_sequence_returns_state_snapshot() -> None:
 
     assert len(out["turns"]) == 2
     assert out["state"]["active_by_callsign"]["AAL77"]["altitude"]["value"] == 150
+
+
+def test_sequence_emits_state_events_for_set_replace_and_cancel() -> None:
+    state = SequenceState()
+    first = parse_turn_with_state("AAL77 descend flight level 180", state=state, emit_events=True)
+    assert [event["event"] for event in first["state_events"]] == ["slot_set"]
+    assert first["state_events"][0]["before"] is None
+    assert first["state_events"][0]["after"]["value"] == 180
+
+    second = parse_turn_with_state("AAL77 correction descend flight level 150", state=state, emit_events=True)
+    replaced = second["state_events"][0]
+    assert replaced["event"] == "slot_replaced"
+    assert replaced["before"]["value"] == 180
+    assert replaced["after"]["value"] == 150
+
+    third = parse_turn_with_state("AAL77 cancel altitude", state=state, emit_events=True)
+    cancelled = third["state_events"][0]
+    assert cancelled["event"] == "slot_cancelled"
+    assert cancelled["before"]["value"] == 150
+    assert cancelled["after"] is None
+
+
+def test_sequence_confirms_reasserted_slots_instead_of_replacing_them() -> None:
+    state = SequenceState()
+    parse_turn_with_state("AAL77 descend flight level 180", state=state)
+    again = parse_turn_with_state("AAL77 descend flight level 180", state=state, emit_events=True)
+    assert [event["event"] for event in again["state_events"]] == ["slot_confirmed"]
+    assert again["state_events"][0]["before"]["value"] == again["state_events"][0]["after"]["value"] == 180
+    assert callsigns_assigned(state, "altitude", 180) == {"AAL77"}
+
+
+def test_sequence_builds_only_index_events_when_nobody_consumes_them(monkeypatch: pytest.MonkeyPatch) -> None:
+    built: list[str] = []
+    original = sequence_module._state_event
+    monkeypatch.setattr(
+        sequence_module, "_state_event", lambda event, **kwargs: built.append(event) or original(event, **kwargs)
+    )
+    state = SequenceState()
+    parse_turn_with_state("AAL77 turn left heading 180", state=state)
+    parse_turn_with_state("AAL77 reduce speed to 240", state=state)
+    assert built == []
+
+    # Cross-aircraft slots still maintain the assignment index.
+    parse_turn_with_state("AAL77 descend flight level 120", state=state)
+    out = parse_turn_with_state("UAL12 descend flight level 120", state=state)
+    assert built == ["slot_set", "slot_set"]
+    assert "cross_aircraft_duplicate:altitude" in out["notes"]
+
+
+def test_sequence_emits_conflict_and_condition_events() -> None:
+    state = SequenceState()
+    parse_turn_with_state("AAL77 reduce speed to 240", state=state)
+    until = parse_turn_with_state("AAL77 until LAM", state=state, emit_events=True)
+    assert until["state_events"][0]["event"] == "condition_applied"
+    assert until["state_events"][0]["before"]["condition"] is None
+    assert until["state_events"][0]["after"]["condition"] == "until LAM"
+
+    conflict = parse_turn_with_state("AAL77 reduce speed to 210", state=state, emit_events=True)
+    assert [event["event"] for event in conflict["state_events"]] == ["conflict_raised", "slot_replaced"]
+
+
+def test_sequence_omits_state_events_by_default() -> None:
+    state = SequenceState()
+    out = parse_turn_with_state("AAL77 descend flight level 180", state=state)
+    assert "state_events" not in out
+
+
+def test_sequence_time_index_answers_point_in_time_queries() -> None:
+    state = SequenceState()
+    parse_turn_with_state("AAL77 descend flight level 180", state=state, timestamp=100.0)
+    parse_turn_with_state("AAL77 reduce speed to 250", state=state, timestamp=110.0)
+    parse_turn_with_state("AAL77 correction descend flight level 150", state=state, timestamp=130.0)
+    parse_turn_with_state("AAL77 cancel speed", state=state, timestamp=140.0)
+
+    assert slot_at(state, "AAL77", "altitude", 99.0) is None
+    assert slot_at(state, "AAL77", "altitude", 120.0)["value"] == 180
+    assert slot_at(state, "AAL77", "altitude", 130.0)["value"] == 150
+    assert slot_at(state, "AAL77", "speed", 139.9)["value"] == 250
+    assert slot_at(state, "AAL77", "speed", 140.0) is None
+    assert set(active_at(state, "AAL77", 135.0)) == {"altitude", "speed"}
+    assert state.active_by_callsign["AAL77"]["altitude"]["valid_from"] == 130.0
+
+
+def test_sequence_expires_clearances_by_rule() -> None:
+    state = SequenceState(expiry_rules={"heading": 60.0})
+    parse_turn_with_state("AAL77 turn left heading 270", state=state, timestamp=0.0)
+    parse_turn_with_state("UAL12 descend flight level 120", state=state, timestamp=30.0)
+    assert state.active_by_callsign["AAL77"]["heading"]["expires_at"] == 60.0
+
+    out = parse_turn_with_state("UAL12 reduce speed to 220", state=state, timestamp=75.0, emit_events=True)
+    assert "clearance_expired:AAL77:heading" in out["notes"]
+    assert out["state_events"][0]["event"] == "slot_expired"
+    assert "heading" not in state.active_by_callsign["AAL77"]
+    assert slot_at(state, "AAL77", "heading", 59.0)["value"] == 270
+    assert slot_at(state, "AAL77", "heading", 60.0) is None
+
+
+def test_sequence_replaced_slot_does_not_expire_from_stale_entry() -> None:
+    state = SequenceState(expiry_rules={"heading": 60.0})
+    parse_turn_with_state("AAL77 turn left heading 270", state=state, timestamp=0.0)
+    parse_turn_with_state("AAL77 correction turn right heading 300", state=state, timestamp=50.0)
+    assert expire_clearances(state, 70.0) == []
+    assert state.active_by_callsign["AAL77"]["heading"]["value"] == 300
+    assert [event["slot_type"] for event in expire_clearances(state, 110.0)] == ["heading"]
+
+
+def test_sequence_rejects_out_of_order_timestamps() -> None:
+    state = SequenceState()
+    parse_turn_with_state("AAL77 descend flight level 180", state=state, timestamp=100.0)
+    with pytest.raises(ValueError):
+        parse_turn_with_state("AAL77 descend flight level 160", state=state, timestamp=90.0)
+
+
+def test_sequence_flags_duplicate_level_across_aircraft() -> None:
+    state = SequenceState()
+    first = parse_turn_with_state("AAL77 descend flight level 180", state=state)
+    second = parse_turn_with_state("UAL12 descend flight level 180", state=state)
+
+    assert "cross_aircraft_duplicate_detected" not in first["notes"]
+    assert "cross_aircraft_duplicate:altitude" in second["notes"]
+    assert callsigns_assigned(state, "altitude", 180) == {"AAL77", "UAL12"}
+
+    parse_turn_with_state("AAL77 correction descend flight level 160", state=state)
+    assert callsigns_assigned(state, "altitude", 180) == {"UAL12"}
+    parse_turn_with_state("UAL12 cancel altitude", state=state)
+    assert callsigns_assigned(state, "altitude", 180) == set()
+    assert ("altitude", 180) not in state.assignment_index
+
+
+def test_sequence_assignment_index_scales_to_many_callsigns() -> None:
+    state = SequenceState()
+    for idx in range(600):
+        parse_turn_with_state(f"AAL{idx + 1} squawk {idx + 1000:04o}", state=state)
+
+    assert len(state.assignment_index) == 600
+    out = parse_turn_with_state("UAL9999 squawk 1750", state=state)
+    assert "cross_aircraft_duplicate:squawk" in out["notes"]
+    assert callsigns_assigned(state, "squawk", "1750") == {"AAL1", "UAL9999"}
+
+
+def test_sequence_pilot_report_over_fix_activates_after_condition() -> None:
+    state = SequenceState()
+    parse_turn_with_state("AAL77 after LAM descend flight level 130", state=state)
+    assert state.pending_by_fix == {("AAL77", "LAM"): {"altitude": "after"}}
+
+    other = parse_turn_with_state("UAL12 over LAM", state=state, speaker="PILOT")
+    assert not any(note.startswith("condition_activated") for note in other["notes"])
+
+    report = parse_turn_with_state("AAL77 over LAM", state=state, speaker="PILOT", emit_events=True)
+    event = report["state_events"][0]
+    assert event["event"] == "condition_activated"
+    assert event["before"]["condition"] == "after LAM"
+    assert event["after"]["condition"] is None
+    assert "condition_activated:altitude:after LAM" in report["notes"]
+    assert state.active_by_callsign["AAL77"]["altitude"]["value"] == 130
+    assert state.pending_by_fix == {}
+
+
+def test_sequence_level_report_is_not_a_fix_report() -> None:
+    state = SequenceState()
+    parse_turn_with_state("AAL77 reduce speed 250 until flight level 100", state=state)
+    parse_turn_with_state("AAL77 after LAM descend flight level 130", state=state)
+    assert state.pending_by_fix == {("AAL77", "LAM"): {"altitude": "after"}}
+
+    report = parse_turn_with_state("AAL77 passing flight level 180", state=state, speaker="PILOT", emit_events=True)
+    assert report["state_events"] == []
+    assert state.active_by_callsign["AAL77"]["speed"]["value"] == 250
+    assert state.pending_by_fix == {("AAL77", "LAM"): {"altitude": "after"}}
+
+
+def test_sequence_waypoint_instruction_releases_until_condition() -> None:
+    state = SequenceState()
+    parse_turn_with_state("AAL77 reduce speed to 240", state=state)
+    parse_turn_with_state("AAL77 until LAM", state=state)
+    assert state.pending_by_fix == {("AAL77", "LAM"): {"speed": "until"}}
+
+    out = parse_turn_with_state("AAL77 proceed to LAM", state=state, emit_events=True)
+    assert out["state_events"][0]["event"] == "condition_released"
+    assert "speed" not in state.active_by_callsign["AAL77"]
+    assert state.pending_by_fix == {}
+
+
+def test_sequence_cancelled_slot_leaves_no_pending_condition() -> None:
+    state = SequenceState()
+    parse_turn_with_state("AAL77 after LAM descend flight level 130", state=state)
+    parse_turn_with_state("AAL77 cancel altitude", state=state)
+    assert state.pending_by_fix == {}
@@ -0,0 +1,78 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from atlas import validate
+from atlas.pipeline import parse_utterance
+from atlas.shadow import ShadowConfig, ShadowParser, diff_results
+
+
+def test_diff_results_reports_changed_fields_only() -> None:
+    primary = parse_utterance("AFR100 descend flight level 120 turn left heading 180")
+    shadow = json.loads(json.dumps(primary))
+    assert diff_results(primary, shadow) == {}
+
+    shadow["status"] = "ambiguous"
+    shadow["instructions"][1]["value"] = 190
+    shadow["notes"].append("low_confidence_threshold_breach")
+    diff = diff_results(primary, shadow)
+    assert set(diff) == {"status", "instructions", "notes"}
+    assert diff["status"] == ["ok", "ambiguous"]
+    assert [item["value"] for item in diff["instructions"]["removed"]] == [180]
+    assert [item["value"] for item in diff["instructions"]["added"]] == [190]
+    assert diff["notes"] == {"removed": [], "added": ["low_confidence_threshold_breach"]}
+
+
+def test_shadow_parser_compares_candidate_in_background(tmp_path: Path) -> None:
+    texts = ["AFR100 descend flight level 120", "UAL12 turn left heading 270", "say again"]
+    policy = dict(validate.CONFIDENCE_POLICY)
+    config = ShadowConfig(name="strict", rule_pack={"confidence_policy": {"min_operational_threshold": 0.99}})
+    output = tmp_path / "shadow.jsonl"
+
+    with ShadowParser(config, sample_rate=1.0, output_path=output) as shadow:
+        results = [shadow.parse_utterance(text, utterance_id=f"u{idx}") for idx, text in enumerate(texts)]
+    summary = shadow.close()
+
+    # The primary path and its tables are untouched by the candidate's rule pack.
+    assert results == [parse_utterance(text, utterance_id=f"u{idx}") for idx, text in enumerate(texts)]
+    assert validate.CONFIDENCE_POLICY == policy
+    assert summary["sampled"] == summary["compared"] == 3
+    assert summary["differing"] == 2
+    assert summary["status_changes"] == {"ok->ambiguous": 2}
+    records = [json.loads(line) for line in output.read_text(encoding="utf-8").splitlines()]
+    assert [record["utterance_id"] for record in records] == ["u0", "u1"]
+    assert records[0]["diff"]["status"] == ["ok", "ambiguous"]
+
+    with pytest.raises(ValueError):
+        ShadowConfig(rule_pack={"regexes": {}})
+    with pytest.raises(ValueError):
+        shadow.submit("AFR100 descend flight level 120", "ATC", None, results[0])
+
+
+def test_shadow_submit_snapshots_primary_result() -> None:
+    with ShadowParser(ShadowConfig(name="same"), sample_rate=1.0) as shadow:
+        for idx in range(20):
+            result = parse_utterance("AFR100 descend flight level 120", utterance_id=f"u{idx}")
+            assert shadow.submit("AFR100 descend flight level 120", "ATC", f"u{idx}", result)
+            # Callers may keep editing their result after handing it off.
+            result["instructions"][0]["value"] = 999
+            result["notes"].append("edited")
+    summary = shadow.close()
+    assert summary["compared"] == 20
+    assert summary["differing"] == 0
+
+
+def test_diff_results_ignores_trace_only_instruction_changes() -> None:
+    primary = parse_utterance("AFR100 descend flight level 120 turn left heading 180")
+    shadow = json.loads(json.dumps(primary))
+    # A regex refactor and a normalization overlay: same slots, different pattern text and segment.
+    shadow["instructions"][0]["trace"]["pattern"] = r"\b(DESCEND|CLIMB)\s+FL\s*(\d{2,3})\b"
+    shadow["instructions"][1]["trace"]["segment"] = "TURN LEFT HDG 180"
+    assert diff_results(primary, shadow) == {}
+
+    shadow["instructions"][0]["condition"] = "after LAM"
+    diff = diff_results(primary, shadow)
+    assert [item["condition"] for item in diff["instructions"]["added"]] == ["after LAM"]
+    # Reported items keep their own trace.
+    assert diff["instructions"]["removed"] == [primary["instructions"][0]]
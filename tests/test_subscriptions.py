@@ -0,0 +1,78 @@
+import logging
+
+import pytest
+
+from atlas.sequence import SequenceState, parse_turn_with_state
+from atlas.subscriptions import SubscriptionRegistry
+
+
+def test_subscription_filters_by_callsign_and_slot_type() -> None:
+    registry = SubscriptionRegistry()
+    squawks: list[dict] = []
+    runways: list[dict] = []
+    registry.subscribe(squawks.append, slot_type="squawk")
+    registry.subscribe(runways.append, callsign="AAL77", slot_type="runway")
+    state = SequenceState(subscriptions=registry)
+
+    parse_turn_with_state("UAL13 squawk 4721", state=state)
+    parse_turn_with_state("UAL13 runway 27L", state=state)
+    parse_turn_with_state("AAL77 runway 27R", state=state)
+
+    assert [(event["callsign"], event["after"]["value"]) for event in squawks] == [("UAL13", "4721")]
+    assert [(event["callsign"], event["after"]["value"]) for event in runways] == [("AAL77", "27R")]
+
+
+def test_subscription_on_note_and_unsubscribe() -> None:
+    registry = SubscriptionRegistry()
+    conflicts: list[dict] = []
+    token = registry.subscribe(conflicts.append, note="history_conflict_detected")
+    state = SequenceState(subscriptions=registry)
+
+    parse_turn_with_state("AAL77 descend flight level 180", state=state)
+    parse_turn_with_state("AAL77 descend flight level 160", state=state)
+    assert len(conflicts) == 1
+    assert conflicts[0]["callsign"] == "AAL77"
+    assert conflicts[0]["status"] == "conflict"
+
+    assert registry.unsubscribe(token) is True
+    assert len(registry) == 0
+    parse_turn_with_state("AAL77 descend flight level 140", state=state)
+    assert len(conflicts) == 1
+
+
+def test_asynchronous_subscription_delivers_after_flush() -> None:
+    registry = SubscriptionRegistry()
+    received: list[dict] = []
+    registry.subscribe(received.append, callsign="AAL77", event="slot_set", asynchronous=True)
+    state = SequenceState(subscriptions=registry)
+
+    parse_turn_with_state("AAL77 descend flight level 180 and reduce speed to 250", state=state)
+    registry.flush()
+    registry.close()
+
+    assert [event["slot_type"] for event in received] == ["altitude", "speed"]
+
+
+def test_failing_callbacks_are_logged_and_isolated(caplog: pytest.LogCaptureFixture) -> None:
+    registry = SubscriptionRegistry()
+    received: list[dict] = []
+
+    def _broken(event: dict) -> None:
+        event["after"]["value"] = "tampered"
+        raise RuntimeError("subscriber bug")
+
+    registry.subscribe(_broken, slot_type="altitude")
+    registry.subscribe(received.append, slot_type="altitude")
+    registry.subscribe(_broken, slot_type="altitude", asynchronous=True)
+    state = SequenceState(subscriptions=registry)
+
+    with caplog.at_level(logging.ERROR, logger="atlas.subscriptions"):
+        result = parse_turn_with_state("AAL77 descend flight level 180", state=state)
+        registry.flush()
+        registry.close()
+
+    assert result["status"] == "ok"
+    assert state.active_by_callsign["AAL77"]["altitude"]["value"] == 180
+    assert received[0]["after"]["value"] == 180
+    assert registry.failures == 2
+    assert len([record for record in caplog.records if "callback failed" in record.getMessage()]) == 2